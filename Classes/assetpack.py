@@ -0,0 +1,167 @@
+"""
+Packed read-only assets.
+
+A pack is one file with every image, font and sound in it, so starting the
+game opens one file instead of one per asset (slow on network-booted
+kiosks). The layout is
+
+    MAGIC | entry count (u32) | index size (u32) | index | data
+
+where every index entry is a name length (u16), the name ('Background/main.png',
+utf-8), the offset of the data from the start of the file (u64) and its size
+(u64). The pack is memory-mapped, open() hands out file-like readers over
+memoryview slices of the map, so nothing is copied until pygame reads it.
+
+The scoreboard, the leaderboard files and the word lists are written at
+runtime or have their own format and stay loose. Assets missing from the
+pack are loaded from the loose files, rebuild the pack after changing one:
+
+    python main.py --build-pack
+"""
+
+import io
+import mmap
+import os
+import struct
+
+MAGIC = b'BCPACK01'
+HEADER = struct.Struct('<8sII')
+NAME_LENGTH = struct.Struct('<H')
+LOCATION = struct.Struct('<QQ')
+
+# the asset folders that go into a pack, with the files to take from them
+PACKED = {
+    'Background': ('.png', '.jpg'),
+    'Other': ('.png', '.jpg'),
+    'Sound': ('.mp3', '.ogg', '.wav'),
+    'Font': ('.ttf', '.otf'),
+}
+
+
+class AssetReader(io.RawIOBase):
+    """A read-only, seekable file over a memoryview, pygame loads from it like from a file."""
+
+    def __init__(self, view: memoryview, name: str) -> None:
+        super().__init__()
+        self.view = view
+        self.name = name
+        self.position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        chunk = self.view[self.position:self.position + len(buffer)]
+        size = len(chunk)
+        buffer[:size] = chunk
+        self.position += size
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.view)
+        self.position = max(0, offset)
+        return self.position
+
+    def tell(self) -> int:
+        return self.position
+
+    def close(self) -> None:
+        if not self.closed:
+            self.view.release()
+        super().close()
+
+
+class AssetPack:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.file = open(path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.map)
+        self.index = self.read_index()
+
+    def read_index(self) -> dict:
+        magic, count, index_size = HEADER.unpack_from(self.map)
+        if magic != MAGIC:
+            raise ValueError(f'{self.path} is not an asset pack')
+
+        index = {}
+        position = HEADER.size
+        for _ in range(count):
+            (length,) = NAME_LENGTH.unpack_from(self.map, position)
+            position += NAME_LENGTH.size
+            name = bytes(self.view[position:position + length]).decode()
+            position += length
+            index[name] = LOCATION.unpack_from(self.map, position)
+            position += LOCATION.size
+
+        if position != HEADER.size + index_size:
+            raise ValueError(f'{self.path} has a broken index')
+        return index
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def names(self) -> list[str]:
+        return list(self.index)
+
+    def data(self, name: str) -> memoryview:
+        offset, size = self.index[name]
+        return self.view[offset:offset + size]
+
+    def open(self, name: str) -> AssetReader:
+        """A new reader for the asset, each has its own position."""
+        return AssetReader(self.data(name), name)
+
+    def close(self) -> None:
+        # readers still open keep the map alive, it's closed with the last of them
+        self.view.release()
+        try:
+            self.map.close()
+        except BufferError:
+            pass
+        self.file.close()
+
+
+def pack_entries(assets_dir: str) -> list[tuple[str, str]]:
+    """(name in the pack, path) for every asset that goes into a pack."""
+    entries = []
+    for folder, extensions in PACKED.items():
+        directory = os.path.join(assets_dir, folder)
+        if not os.path.isdir(directory):
+            continue
+        for filename in sorted(os.listdir(directory)):
+            if filename.lower().endswith(extensions):
+                entries.append((f'{folder}/{filename}', os.path.join(directory, filename)))
+    return entries
+
+
+def build_pack(assets_dir: str, target: str) -> list[tuple[str, int]]:
+    """Write the pack for assets_dir to target, returns the (name, size) of every asset."""
+    entries = pack_entries(assets_dir)
+    names = [name.encode() for name, _ in entries]
+    sizes = [os.path.getsize(path) for _, path in entries]
+    index_size = sum(NAME_LENGTH.size + len(name) + LOCATION.size for name in names)
+
+    temporary = f'{target}.{os.getpid()}.tmp'
+    with open(temporary, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, len(entries), index_size))
+        offset = HEADER.size + index_size
+        for name, size in zip(names, sizes):
+            file.write(NAME_LENGTH.pack(len(name)) + name + LOCATION.pack(offset, size))
+            offset += size
+
+        for _, path in entries:
+            with open(path, 'rb') as source:
+                file.write(source.read())
+    os.replace(temporary, target)
+
+    return [(name, size) for (name, _), size in zip(entries, sizes)]
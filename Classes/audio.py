@@ -0,0 +1,203 @@
+"""
+Background audio decoding with a PCM cache.
+
+preload() hands a track to a worker thread that decodes it into a
+pygame.mixer.Sound (SDL decodes with the GIL released, the frame loop keeps
+running). play() then starts the decoded PCM on a reserved channel, which
+costs nothing on the main thread. A track that isn't decoded yet streams
+through pygame.mixer.music like before and is decoded for the next time.
+
+Decoded tracks stay in memory up to a budget, the least recently played are
+dropped first. With a directory the raw PCM is also kept on disk, named
+after the track, a hash of the source file and the mixer format, so a later
+launch reads it back instead of decoding the mp3 again.
+
+Every call made on the main thread is timed in `timings`, per call.
+"""
+
+import hashlib
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+
+import pygame
+
+from functions import CACHE_DIR, asset_bytes, asset_source, get_asset_path
+
+AUDIO_CACHE = os.path.join(CACHE_DIR, 'audio')
+
+
+class AudioLibrary:
+    BUDGET = 64 * 1024 ** 2
+
+    def __init__(self, budget: int = BUDGET, directory: str | None = AUDIO_CACHE) -> None:
+        self.budget = budget
+        self.directory = directory
+
+        # (name, start) -> Sound, least recently played first
+        self.sounds = OrderedDict()
+        self.nbytes = 0
+        self.pending = set()
+        self.failed = set()
+        self.lock = threading.Lock()
+        self.queue = queue.Queue()
+        self.thread = None
+
+        self.channel = None
+        # call -> [calls, seconds, slowest] on the main thread
+        self.timings = {}
+
+    def timed(self, call: str, start: float) -> None:
+        elapsed = time.perf_counter() - start
+        timing = self.timings.setdefault(call, [0, 0.0, 0.0])
+        timing[0] += 1
+        timing[1] += elapsed
+        timing[2] = max(timing[2], elapsed)
+
+    def preload(self, name: str, start: float = 0.0) -> None:
+        """Decode the track in the background, to be played from start."""
+        begin = time.perf_counter()
+        self.request((name, start))
+        self.timed('preload', begin)
+
+    def request(self, key: tuple) -> None:
+        with self.lock:
+            if key not in self.sounds and key not in self.pending and key not in self.failed:
+                self.pending.add(key)
+                self.queue.put(key)
+                if self.thread is None:
+                    self.thread = threading.Thread(target=self.run, name='audio', daemon=True)
+                    self.thread.start()
+
+    def run(self) -> None:
+        while True:
+            key = self.queue.get()
+            try:
+                sound = self.decode(*key)
+            except (pygame.error, OSError) as e:
+                print(f'Error: {e}')
+                sound = None
+
+            with self.lock:
+                self.pending.discard(key)
+                if sound is None:
+                    self.failed.add(key)
+                else:
+                    self.add(key, sound)
+
+    def add(self, key: tuple, sound: pygame.mixer.Sound) -> None:
+        self.sounds[key] = sound
+        self.nbytes += self.sound_bytes(sound)
+        while self.nbytes > self.budget and len(self.sounds) > 1:
+            _, dropped = self.sounds.popitem(last=False)
+            self.nbytes -= self.sound_bytes(dropped)
+
+    @staticmethod
+    def sound_bytes(sound: pygame.mixer.Sound) -> int:
+        frequency, size, channels = pygame.mixer.get_init()
+        return round(sound.get_length() * frequency) * abs(size) // 8 * channels
+
+    def decode(self, name: str, start: float) -> pygame.mixer.Sound:
+        pcm = self.read_pcm(name)
+        if pcm is None:
+            pcm = pygame.mixer.Sound(asset_source(get_asset_path('Sound', name))).get_raw()
+            self.write_pcm(name, pcm)
+
+        if start:
+            # rotated to begin at start, looping it sounds like looping the track
+            frequency, size, channels = pygame.mixer.get_init()
+            frame = abs(size) // 8 * channels
+            offset = round(start * frequency) * frame % len(pcm)
+            pcm = pcm[offset:] + pcm[:offset]
+        return pygame.mixer.Sound(buffer=pcm)
+
+    def pcm_path(self, name: str) -> str:
+        digest = hashlib.blake2b(asset_bytes(get_asset_path('Sound', name)), digest_size=10).hexdigest()
+        frequency, size, channels = pygame.mixer.get_init()
+        return os.path.join(self.directory, f'{name}.{frequency}_{size}_{channels}.{digest}.pcm')
+
+    def read_pcm(self, name: str) -> bytes | None:
+        if self.directory is None:
+            return None
+        try:
+            with open(self.pcm_path(name), 'rb') as file:
+                return file.read()
+        except OSError:
+            return None
+
+    def write_pcm(self, name: str, pcm: bytes) -> None:
+        if self.directory is None:
+            return
+        try:
+            path = self.pcm_path(name)
+            os.makedirs(self.directory, exist_ok=True)
+            temporary = f'{path}.{os.getpid()}.tmp'
+            with open(temporary, 'wb') as file:
+                file.write(pcm)
+            os.replace(temporary, path)
+
+            # the PCM of older versions of the track
+            prefix = f'{name}.'
+            for filename in os.listdir(self.directory):
+                if filename.startswith(prefix) and filename.endswith('.pcm') and filename != os.path.basename(path):
+                    os.remove(os.path.join(self.directory, filename))
+        except OSError:
+            pass
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until every preloaded track is decoded, for benchmarks and tests."""
+        end = None if timeout is None else time.perf_counter() + timeout
+        while self.pending:
+            if end is not None and time.perf_counter() >= end:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def play(self, name: str, loops: int = 1, start: float = 0.0, fade: int = 500, volume: float = 0.03,
+             play: bool = True) -> None:
+        begin = time.perf_counter()
+        key = (name, start)
+        with self.lock:
+            sound = self.sounds.get(key)
+            if sound is not None:
+                self.sounds.move_to_end(key)
+
+        try:
+            if sound is not None:
+                pygame.mixer.music.stop()
+                if self.channel is None:
+                    pygame.mixer.set_reserved(1)
+                    self.channel = pygame.mixer.Channel(0)
+                self.channel.set_volume(volume)
+                self.channel.play(sound, loops, fade_ms=fade)
+            else:
+                # not decoded (yet), stream it and have it decoded for next time
+                if self.channel is not None:
+                    self.channel.stop()
+                pygame.mixer.music.load(asset_source(get_asset_path('Sound', name)), name)
+                pygame.mixer.music.set_volume(volume)
+                pygame.mixer.music.play(loops, start, fade)
+                self.request(key)
+
+            if not play:
+                self.stop_playing()
+        except Exception as e:
+            print(f"Error: {e}")
+        finally:
+            self.timed('play', begin)
+
+    def pause(self) -> None:
+        begin = time.perf_counter()
+        self.stop_playing()
+        self.timed('pause', begin)
+
+    def stop_playing(self) -> None:
+        pygame.mixer.music.pause()
+        if self.channel is not None:
+            self.channel.pause()
+
+    def rows(self):
+        for call, (calls, total, peak) in sorted(self.timings.items(), key=lambda item: -item[1][1]):
+            yield call, calls, total / calls, peak
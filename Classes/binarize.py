@@ -0,0 +1,71 @@
+from Classes.mini_game import QuizGame
+import random
+
+
+class BinaryConversionGame(QuizGame):
+    def __init__(self, game):
+        super().__init__(game)
+        self.game = game
+
+    def play(self):
+        """Override to include binary-specific logic generation."""
+        self.start_question()
+        super().play()
+
+    def new_question(self):
+        self.generate_binary_question()
+
+    def generate_binary_question(self):
+        """Generates a binary question with multiple-choice options."""
+        # Generate a random binary value within a defined range
+        num_bits = random.randint(4, 8)  # Generate between 4 to 8 bits
+        binary_value = ''.join(random.choices(['0', '1'], k=num_bits))
+        decimal_value = int(binary_value, 2)
+
+        # Generate incorrect options
+        options = set()
+        while len(options) < 3:
+            incorrect = random.randint(decimal_value - 10, decimal_value + 10)
+            if incorrect != decimal_value:
+                options.add(incorrect)
+
+        # Combine correct and incorrect options
+        options = list(options)
+        options.append(decimal_value)
+        random.shuffle(options)
+
+        # Assign to class properties
+        self.options = {
+            "A": options[0],
+            "B": options[1],
+            "C": options[2],
+            "D": options[3],
+        }
+        correct_option_key = list(self.options.keys())[options.index(decimal_value)]
+
+        # Set question and answer
+        self.question = f"What is the decimal equivalent of {binary_value}?"
+        self.answer = decimal_value
+        self.correct_key = correct_option_key
+        self.helper = self.draw_helper
+
+    def draw_helper(self):
+        """Provide helper information to teach binary conversion."""
+        # Example conversion for illustration
+        binary_example = "1011"
+        decimal_example = int(binary_example, 2)
+
+        # Helper display
+        helper_text = [
+            f"Hint: Binary {binary_example} = Decimal {decimal_example}.",
+            "Each binary digit (bit) represents a power of 2, starting from the right:",
+            "For example, from right to left:",
+            f"  1 (2^3) + 0 (2^2) + 1 (2^1) + 1 (2^0) = {decimal_example}",
+            "Step-by-step: Start with the rightmost bit and multiply it by 2^0, the next by 2^1, and so on.",
+            "Then, add up the results to get the decimal value.",
+            "For binary 1011, you get: 1*8 + 0*4 + 1*2 + 1*1 = 11 in decimal.",
+            "Remember: 1 represents 'on' (or 'true'), and 0 represents 'off' (or 'false')."
+        ]
+
+        for i, text in enumerate(helper_text, 1):
+            self.game.draw_text(text, 20, self.game.DISPLAY_W - 50, (i * 30) + 50, color=self.game.WHITE, font=self.game.second_font, position='topright')
@@ -0,0 +1,282 @@
+"""
+Bot players and a headless driver for soak and benchmark runs.
+
+Bots don't touch the game state, they look at the active scene and post the
+key presses a player would make. Everything after that (menus, controllers,
+scoring, the scoreboard) runs exactly as in a normal game.
+
+    driver = BotDriver(correct_rate=0.7)
+    driver.run(sessions=100)
+    driver.report()
+"""
+
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+
+import pygame
+
+from functions import letter_bit
+from Classes.dictionary import LETTER_FREQUENCY, DIFFICULTIES
+from Classes.render_queue import RenderStats
+from Classes.rps import RPS_OPTIONS
+
+# most used letters first
+LETTERS_BY_FREQUENCY = sorted(LETTER_FREQUENCY, key=LETTER_FREQUENCY.get, reverse=True)
+
+ANSWER_KEYS = 'ABCD'
+
+
+def press(*keys: int) -> None:
+    for key in keys:
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode='', scancode=0))
+
+
+def letter_key(char: str) -> int:
+    return pygame.K_a + ord(char) - ord('a')
+
+
+class MiniGameBot(ABC):
+    """Plays one mini game, act() is called before every input poll while it runs."""
+
+    def __init__(self, rng: random.Random) -> None:
+        self.rng = rng
+
+    @abstractmethod
+    def act(self, controller) -> None:
+        """Post the key presses for what the controller shows."""
+
+
+class RPSBot(MiniGameBot):
+    """Picks a random hand and walks the cursor there with the arrow keys."""
+
+    def __init__(self, rng: random.Random) -> None:
+        super().__init__(rng)
+        self.target = None
+
+    def act(self, controller) -> None:
+        self.target = self.target or self.rng.choice(RPS_OPTIONS)
+
+        if controller.state == self.target:
+            self.target = None
+            press(pygame.K_RETURN)
+        else:
+            press(pygame.K_RIGHT)
+
+
+class HangmanBot(MiniGameBot):
+    """Guesses the letters from most to least common in english."""
+
+    def act(self, controller) -> None:
+        for char in LETTERS_BY_FREQUENCY:
+            if not controller.used_mask & letter_bit(char):
+                press(letter_key(char))
+                return
+
+
+class QuizBot(MiniGameBot):
+    """Answers correctly at correct_rate, otherwise picks one of the wrong answers."""
+
+    def __init__(self, rng: random.Random, correct_rate: float) -> None:
+        super().__init__(rng)
+        self.correct_rate = correct_rate
+
+    def act(self, controller) -> None:
+        answer = controller.correct_key
+        if self.rng.random() >= self.correct_rate:
+            answer = self.rng.choice([key for key in ANSWER_KEYS if key != controller.correct_key])
+        press(letter_key(answer.lower()))
+
+
+class SessionBot:
+    """
+    Plays whole sessions: menus, name, password and the mini games.
+
+    Plug it in with `game.input_source = bot`, it is called before every
+    input poll.
+    """
+
+    # screens that only wait for enter
+    SCREENS = ('Game.show_rules', 'Game.pre_story', 'Game.win_logic', 'Game.win_dialog', 'Game.show_score')
+
+    def __init__(self, correct_rate: float = 0.7, seed: int | None = None) -> None:
+        self.rng = random.Random(seed)
+        self.correct_rate = correct_rate
+        self.bots = {
+            'rps': RPSBot(self.rng),
+            'hangman': HangmanBot(self.rng)
+        }
+        self.quiz_bot = QuizBot(self.rng, correct_rate)
+
+        self.scene = None
+        self.typed = ''
+        self.difficulty = None
+        self.password = None
+
+        self.scenes = {
+            'Rating.display_rating': lambda game: press(pygame.K_BACKSPACE),
+            'MainMenu.display_menu': self.main_menu,
+            'DifficultyMenu.display_menu': self.difficulty_menu,
+            'MiniGameMenu.display_menu': self.mini_game_menu,
+            'Game.ask_name': self.ask_name,
+            'Game.guess_password': self.guess_password
+        }
+
+    def __call__(self, game) -> None:
+        if game.scene != self.scene:
+            self.scene = game.scene
+            self.typed = ''
+
+        scene = self.scene or ''
+        if scene in self.scenes:
+            self.scenes[scene](game)
+        elif scene.endswith('.play'):
+            self.bots.get(game.game_mode, self.quiz_bot).act(game.game_controller)
+        elif scene in self.SCREENS or scene.endswith('.display_rules'):
+            # rules, story, win and score screens all wait for enter
+            press(pygame.K_RETURN)
+
+    def type(self, text: str) -> None:
+        """Type the next character of text, enter once it is all typed."""
+        if len(self.typed) < len(text):
+            press(letter_key(text[len(self.typed)]))
+            self.typed += text[len(self.typed)]
+        else:
+            press(pygame.K_RETURN)
+
+    def main_menu(self, game) -> None:
+        press(pygame.K_RETURN if game.main_menu.state == 'Start' else pygame.K_DOWN)
+
+    def difficulty_menu(self, game) -> None:
+        self.difficulty = self.difficulty or self.rng.choice(DIFFICULTIES)
+        if game.difficulties.state == self.difficulty:
+            self.difficulty = None
+            press(pygame.K_RETURN)
+        else:
+            press(pygame.K_DOWN)
+
+    def mini_game_menu(self, game) -> None:
+        menu = game.mini_game_menu
+        press(pygame.K_DOWN if menu.options[menu.index].disabled else pygame.K_RETURN)
+
+    def ask_name(self, game) -> None:
+        self.type('bot')
+
+    def guess_password(self, game) -> None:
+        if not self.typed:
+            # a player that knows the password or one typing the letters they got
+            if self.rng.random() < self.correct_rate:
+                self.password = game.password
+            else:
+                self.password = ''.join(game.guessed_characters).ljust(len(game.password), 'x')
+        self.type(self.password)
+
+
+class FrameTimes:
+    """Frame times per scene, a frame listener. Keeps totals and the last `window` frames."""
+
+    def __init__(self, window: int = 5000) -> None:
+        self.window = window
+        self.scenes = {}
+        self.last = None
+
+    def __call__(self, game) -> None:
+        now = time.perf_counter()
+        if self.last is not None:
+            stats = self.scenes.setdefault(game.scene, [0, 0.0, 0.0, deque(maxlen=self.window)])
+            frame = now - self.last
+            stats[0] += 1
+            stats[1] += frame
+            stats[2] = max(stats[2], frame)
+            stats[3].append(frame)
+        self.last = now
+
+    def rows(self):
+        for scene, (count, total, peak, recent) in sorted(self.scenes.items(), key=lambda item: -item[1][1]):
+            p95 = statistics.quantiles(recent, n=20, method='inclusive')[-1] if len(recent) > 1 else recent[0]
+            yield scene, count, total / count, p95, peak
+
+
+class BotDriver:
+    """Runs bot sessions back to back on a headless game, scores go to a scratch scoreboard."""
+
+    def __init__(self, correct_rate: float = 0.7, fps: int = 0, seed: int | None = None, **game_options) -> None:
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+        from Classes.game import Game
+
+        self.game = Game(**game_options)
+        self.game.FPS = self.game.BACKGROUND_FPS = fps
+
+        # keep the real scoreboard clean, the bots still read and write one
+        self.scratch = tempfile.mkdtemp(prefix='bots-')
+        self.game.rating.path = shutil.copy(self.game.rating.path, self.scratch)
+
+        self.bot = SessionBot(correct_rate, seed)
+        self.frames = FrameTimes()
+        self.game.input_source = self.bot
+        self.game.frame_listeners.append(self.frames)
+        self.render = RenderStats()
+        self.game.frame_listeners.append(self.render)
+
+        self.sessions = 0
+        self.elapsed = 0.0
+
+    def play_session(self) -> None:
+        game = self.game
+        game.rating.display_rating()
+        game.main_menu.display_menu()
+        game.difficulties.display_menu()
+        game.game_loop()
+
+    def run(self, sessions: int | None = None, minutes: float | None = None, verbose: bool = True) -> None:
+        """Play until `sessions` sessions are done or `minutes` have passed, whichever comes first."""
+        start = time.perf_counter()
+        try:
+            while sessions is None or self.sessions < sessions:
+                if minutes is not None and time.perf_counter() - start >= minutes * 60:
+                    break
+
+                session_start = time.perf_counter()
+                self.play_session()
+                self.sessions += 1
+
+                if verbose:
+                    print(f'session {self.sessions}: {self.game.difficulty}, '
+                          f'{time.perf_counter() - session_start:.1f} s')
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.elapsed += time.perf_counter() - start
+
+    def report(self) -> None:
+        rate = self.sessions / self.elapsed * 60 if self.elapsed else 0
+        print(f'\n{self.sessions} sessions in {self.elapsed:.1f} s, {rate:.1f} sessions/min')
+
+        print(f'\n{"scene":<36} {"frames":>8} {"mean ms":>8} {"p95 ms":>8} {"max ms":>8}')
+        for scene, count, mean, p95, peak in self.frames.rows():
+            print(f'{scene:<36} {count:>8} {mean * 1000:>8.2f} {p95 * 1000:>8.2f} {peak * 1000:>8.2f}')
+
+        print(f'\n{"render queue":<36} {"frames":>8} {"queued":>8} {"calls":>8} {"flush ms":>8} {"max ms":>8}')
+        for scene, count, items, calls, flush, peak in self.render.rows():
+            print(f'{scene:<36} {count:>8} {items:>8.1f} {calls:>8.1f} {flush * 1000:>8.3f} {peak * 1000:>8.3f}')
+
+        # no tables for the services the game was built without
+        if self.game.prefetcher:
+            print(f'\n{"menu to rules screen":<36} {"launches":>8} {"mean ms":>8} {"max ms":>8}')
+            for prefetched, count, mean, peak in self.game.prefetcher.rows():
+                print(f'{"prefetched" if prefetched else "built on selection":<36} {count:>8} {mean * 1000:>8.2f} {peak * 1000:>8.2f}')
+
+        if self.game.audio:
+            print(f'\n{"audio on the main thread":<36} {"calls":>8} {"mean ms":>8} {"max ms":>8}')
+            for call, calls, mean, peak in self.game.audio.rows():
+                print(f'{call:<36} {calls:>8} {mean * 1000:>8.3f} {peak * 1000:>8.3f}')
+
+    def close(self) -> None:
+        shutil.rmtree(self.scratch, ignore_errors=True)
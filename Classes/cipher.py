@@ -0,0 +1,137 @@
+import random
+from functools import lru_cache
+
+from functions import get_asset_path
+
+VOWELS = frozenset('AEIOU')
+
+
+class HexCipher:
+    """Encodes words as dash separated hex alphabet positions (A=1 ... Z=1A)."""
+
+    separator = '-'
+
+    @staticmethod
+    def encode(word: str) -> str:
+        return HexCipher.separator.join(f'{ord(char) - 64:X}' for char in word.upper())
+
+    @staticmethod
+    def decode(code: str) -> str:
+        return ''.join(chr(int(part, 16) + 64) for part in code.split(HexCipher.separator))
+
+
+class WordIndex:
+    """
+    Word list index used by the Encrypter mini game.
+
+    The list is read lazily on first use and bucketed once by length,
+    difficulty and letter profile, so picking a word and its distractors
+    costs the same for a hundred words as for a few hundred thousand.
+    """
+
+    # word lengths allowed per difficulty (inclusive)
+    difficulty_lengths = {
+        'easy': (2, 4),
+        'medium': (5, 6),
+        'hard': (7, 32)
+    }
+
+    # how many random picks we try in a bucket before falling back to a wider one
+    max_tries = 8
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.loaded = False
+        self.size = 0
+
+        self.by_length = {}
+        self.by_profile = {}
+        self.by_difficulty = {difficulty: [] for difficulty in self.difficulty_lengths}
+        # (difficulty, extra words) -> sorted distinct words, see fallback_pool
+        self.fallbacks = {}
+
+    @staticmethod
+    def profile(word: str) -> tuple[int, str]:
+        """Length and vowel/consonant skeleton, e.g. GHOST -> (5, 'CCVCC')."""
+        return len(word), ''.join('V' if char in VOWELS else 'C' for char in word)
+
+    def get_difficulty(self, word: str) -> str | None:
+        for difficulty, (min_len, max_len) in self.difficulty_lengths.items():
+            if min_len <= len(word) <= max_len:
+                return difficulty
+        return None
+
+    def load(self) -> None:
+        if self.loaded:
+            return
+
+        with open(self.path, mode='r') as file:
+            for line in file:
+                self.add(line)
+
+        self.loaded = True
+
+    def add(self, word: str) -> None:
+        word = word.strip().upper()
+        if not word.isalpha() or not word.isascii():
+            return
+
+        difficulty = self.get_difficulty(word)
+        if difficulty is None:
+            return
+
+        self.by_length.setdefault(len(word), []).append(word)
+        self.by_profile.setdefault(self.profile(word), []).append(word)
+        self.by_difficulty[difficulty].append(word)
+        self.size += 1
+        self.fallbacks.clear()
+
+    def random_word(self, difficulty: str) -> str:
+        if difficulty not in self.by_difficulty:
+            raise ValueError("Invalid difficulty level")
+
+        self.load()
+        words = self.by_difficulty[difficulty]
+        if not words:
+            raise ValueError(f"No words available for difficulty '{difficulty}'")
+
+        return random.choice(words)
+
+    def distractors(self, word: str, amount: int = 3) -> list[str]:
+        """Pick words that look like `word`, from the narrowest bucket that has enough of them."""
+        self.load()
+        buckets = (
+            self.by_profile.get(self.profile(word), []),
+            self.by_length.get(len(word), []),
+            self.by_difficulty.get(self.get_difficulty(word), []),
+        )
+
+        picked = []
+        for bucket in buckets:
+            # every bucket contains the word itself, skip the ones that can't fill up
+            if len(bucket) <= amount:
+                continue
+
+            for _ in range(self.max_tries * amount):
+                candidate = random.choice(bucket)
+                if candidate != word and candidate not in picked:
+                    picked.append(candidate)
+                    if len(picked) == amount:
+                        return picked
+
+        return picked
+
+
+    def fallback_pool(self, difficulty: str, extra: tuple = ()) -> list[str]:
+        """Every distinct word of a difficulty plus `extra`, built once, for when distractors() comes up short."""
+        key = (difficulty, extra)
+        if key not in self.fallbacks:
+            self.load()
+            self.fallbacks[key] = sorted(set(self.by_difficulty[difficulty]) | set(extra))
+        return self.fallbacks[key]
+
+
+@lru_cache(maxsize=None)
+def get_word_index(name: str = 'encrypter.txt') -> WordIndex:
+    # one shared index per word list, the game objects get rebuilt every session
+    return WordIndex(get_asset_path('Words', name))
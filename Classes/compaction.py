@@ -0,0 +1,230 @@
+"""
+Scoreboard compaction.
+
+Only the best scores are ever shown, but save_rating appends a row for every
+session, so on a busy kiosk the csv and the time to read it keep growing.
+compact() keeps the best `keep_top` rows per difficulty and the `recent`
+newest rows in the scoreboard, and moves every other row to gzip archive
+segments (standalone csv files with a header) in an archive directory.
+
+The file is read twice: once to find the rows to keep, once to copy the
+blocks between them to the archive, so only the kept rows are ever parsed
+or held in memory.
+
+Crash safety: segments are written under temp names and renamed when they
+are complete, then the new scoreboard is written to a temp file and renamed
+over the old one. Both directories are fsynced after the renames, and the
+temp files of a failed run are removed. A crash leaves either the old or
+the new scoreboard: at worst some rows end up in an archive segment and are
+still in the old scoreboard, none is lost.
+
+It can run while the game is live: the scan runs without the lock, the rows
+appended meanwhile are copied over at the end while holding the lock that
+save_rating takes.
+"""
+
+import contextlib
+import gzip
+import heapq
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+BLOCK_SIZE = 1024 * 1024
+
+
+@dataclass
+class CompactionResult:
+    rows: int = 0
+    kept: int = 0
+    archived: int = 0
+    appended: int = 0
+    segments: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+def fsync_dir(directory: str) -> None:
+    """Make the renames in directory durable (a no-op where directories can't be opened)."""
+    if os.name == 'nt':
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class SegmentWriter:
+    """gzip archive segments, a new one is started after segment_bytes of csv."""
+
+    def __init__(self, directory: str, stem: str, header: bytes, segment_bytes: int, compresslevel: int) -> None:
+        self.directory = directory
+        self.prefix = f'{stem}.{time.strftime("%Y%m%d-%H%M%S")}'
+        # never reuse the names of an earlier run in the same second
+        taken = os.listdir(directory)
+        run = 1
+        while any(name.startswith(self.prefix + '.') for name in taken):
+            run += 1
+            self.prefix = f'{stem}.{time.strftime("%Y%m%d-%H%M%S")}-{run}'
+        self.header = header
+        self.segment_bytes = segment_bytes
+        self.compresslevel = compresslevel
+
+        self.file = None
+        self.size = 0
+        self.done = []
+        self.temps = []
+
+    def write(self, lines: bytes) -> None:
+        """Write whole lines, a segment is only ever cut between two writes."""
+        if self.file is None:
+            temp = os.path.join(self.directory, f'{self.prefix}.{len(self.done):03}.csv.gz.{os.getpid()}.tmp')
+            self.temps.append(temp)
+            self.file = gzip.open(temp, mode='wb', compresslevel=self.compresslevel)
+            self.file.write(self.header)
+            self.size = 0
+
+        self.file.write(lines)
+        self.size += len(lines)
+        if self.size >= self.segment_bytes:
+            self.finish_segment()
+
+    def finish_segment(self) -> None:
+        self.file.close()
+        self.file = None
+        self.done.append(self.temps[-1])
+
+    def close(self) -> list[str]:
+        """Make the complete segments durable and give them their final names."""
+        if self.file is not None:
+            self.finish_segment()
+
+        segments = []
+        for temp in self.done:
+            with open(temp, mode='rb') as file:
+                os.fsync(file.fileno())
+            segment = temp[:temp.rindex('.csv.gz') + len('.csv.gz')]
+            os.replace(temp, segment)
+            segments.append(segment)
+        if segments:
+            fsync_dir(self.directory)
+        return segments
+
+    def discard(self) -> None:
+        """Remove the temp files of segments that never got their final name."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        for temp in self.temps:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(temp)
+
+
+def scan(file, keep_top: int, recent: int) -> tuple[int, dict, int]:
+    """Find the rows to keep, returns the row count, {offset: line} and the end offset."""
+    heaps = {}
+    newest = deque(maxlen=recent)
+    offset = file.tell()
+    rows = 0
+
+    for line in file:
+        rows += 1
+        # csv.writer only quotes the name, so the last three fields never hold a comma
+        try:
+            _, score, _, difficulty = line.rsplit(b',', 3)
+            score = int(score)
+        except ValueError:
+            # a broken row can't be ranked, it's archived unless it's recent
+            score = None
+
+        if score is not None and keep_top:
+            heap = heaps.setdefault(difficulty.strip(), [])
+            # on equal scores the older row wins, like the stable sort in get_scores
+            entry = (score, -offset, line)
+            if len(heap) < keep_top:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+        if recent:
+            newest.append((offset, line))
+        offset += len(line)
+
+    kept = dict(newest)
+    for heap in heaps.values():
+        kept.update((-negative_offset, line) for _, negative_offset, line in heap)
+    return rows, kept, offset
+
+
+def copy_lines(file, start: int, stop: int, writer: SegmentWriter) -> None:
+    """Copy the lines between two line starts in blocks cut at line ends."""
+    file.seek(start)
+    remaining = stop - start
+    while remaining > 0:
+        block = file.read(min(BLOCK_SIZE, remaining))
+        if len(block) < remaining and not block.endswith(b'\n'):
+            # stop is a line start, so this never reads past it
+            block += file.readline()
+        remaining -= len(block)
+        writer.write(block)
+
+
+def compact(path: str, keep_top: int = 100, recent: int = 1000, archive_dir: str | None = None,
+            segment_bytes: int = 64 * 1024 * 1024, compresslevel: int = 6, lock=None) -> CompactionResult:
+    started = time.perf_counter()
+    lock = lock or contextlib.nullcontext()
+    archive_dir = archive_dir or os.path.join(os.path.dirname(os.path.abspath(path)), 'archive')
+    stem = os.path.splitext(os.path.basename(path))[0]
+    result = CompactionResult()
+
+    writer = None
+    temp = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(path, mode='rb') as file:
+            header = file.readline()
+            result.rows, kept, end = scan(file, keep_top, recent)
+            offsets = sorted(kept)
+            result.kept = len(offsets)
+            result.archived = result.rows - result.kept
+
+            if result.archived:
+                os.makedirs(archive_dir, exist_ok=True)
+                writer = SegmentWriter(archive_dir, stem, header, segment_bytes, compresslevel)
+                position = len(header)
+                for offset in offsets:
+                    copy_lines(file, position, offset, writer)
+                    position = offset + len(kept[offset])
+                copy_lines(file, position, end, writer)
+                result.segments = writer.close()
+
+        if not result.archived:
+            result.seconds = time.perf_counter() - started
+            return result
+
+        with open(temp, mode='wb') as out:
+            out.write(header)
+            for offset in offsets:
+                line = kept[offset]
+                out.write(line if line.endswith(b'\n') else line + b'\n')
+
+            with lock:
+                # rows saved while we were scanning
+                with open(path, mode='rb') as file:
+                    file.seek(end)
+                    while block := file.read(BLOCK_SIZE):
+                        result.appended += block.count(b'\n')
+                        out.write(block)
+                out.flush()
+                os.fsync(out.fileno())
+                os.replace(temp, path)
+        fsync_dir(os.path.dirname(os.path.abspath(path)))
+    finally:
+        # after a failure, whatever didn't get its final name
+        if writer is not None:
+            writer.discard()
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(temp)
+
+    result.seconds = time.perf_counter() - started
+    return result
@@ -0,0 +1,178 @@
+import math
+import mmap
+import os
+import random
+import struct
+from functools import lru_cache
+
+from functions import CACHE_DIR, get_asset_path
+
+# relative frequency (%) of letters in english text, used for letter rarity
+LETTER_FREQUENCY = {
+    'a': 8.2, 'b': 1.5, 'c': 2.8, 'd': 4.3, 'e': 12.7, 'f': 2.2, 'g': 2.0,
+    'h': 6.1, 'i': 7.0, 'j': 0.15, 'k': 0.77, 'l': 4.0, 'm': 2.4, 'n': 6.7,
+    'o': 7.5, 'p': 1.9, 'q': 0.095, 'r': 6.0, 's': 6.3, 't': 9.1, 'u': 2.8,
+    'v': 0.98, 'w': 2.4, 'x': 0.15, 'y': 2.0, 'z': 0.074
+}
+LETTER_RARITY = {
+    letter: math.log2(LETTER_FREQUENCY['e'] / frequency)
+    for letter, frequency in LETTER_FREQUENCY.items()
+}
+
+DIFFICULTIES = ('easy', 'medium', 'hard')
+
+# where word lists are compiled at runtime, assets/Words is only written by --build-dictionary
+DICTIONARY_CACHE = os.path.join(CACHE_DIR, 'words')
+
+# longer words don't fit on the hangman screen
+MIN_WORD_LENGTH, MAX_WORD_LENGTH = 3, 16
+
+# file layout (little endian):
+#   header  magic, bucket count
+#   table   per bucket: name, word count, offsets position, words position
+#   offsets per bucket: count + 1 uint32 offsets into its words blob
+#   words   per bucket: the words, ascii, back to back
+MAGIC = b'HANGDICT'
+HEADER = struct.Struct('<8sI')
+BUCKET = struct.Struct('<8sIQQ')
+OFFSET = struct.Struct('<I')
+OFFSET_PAIR = struct.Struct('<II')
+
+
+def difficulty_score(word: str) -> float:
+    """Longer words, rare letters and many different letters make a word harder to guess."""
+    unique = set(word)
+    return len(word) + len(unique) + sum(LETTER_RARITY[letter] for letter in unique)
+
+
+def is_valid_word(word: str) -> bool:
+    return (MIN_WORD_LENGTH <= len(word) <= MAX_WORD_LENGTH
+            and word.isascii() and word.isalpha())
+
+
+class HangmanDictionary:
+    """
+    Read side of the compiled hangman word list.
+
+    The file is memory-mapped, only the small header is parsed up front and a
+    random word costs two offset reads and one slice, however big the list is.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.file = None
+        self.data = None
+        self.buckets = {}
+
+    def open(self) -> None:
+        if self.data is not None:
+            return
+
+        self.file = open(self.path, mode='rb')
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, bucket_count = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f'{self.path} is not a compiled hangman dictionary')
+
+        for i in range(bucket_count):
+            name, count, offsets_pos, words_pos = BUCKET.unpack_from(self.data, HEADER.size + i * BUCKET.size)
+            self.buckets[name.rstrip(b'\0').decode('ascii')] = (count, offsets_pos, words_pos)
+
+    def close(self) -> None:
+        if self.data is not None:
+            self.data.close()
+            self.file.close()
+        self.data, self.file = None, None
+        self.buckets = {}
+
+    def __len__(self) -> int:
+        self.open()
+        return sum(count for count, _, _ in self.buckets.values())
+
+    def count(self, difficulty: str) -> int:
+        self.open()
+        return self.buckets.get(difficulty, (0, 0, 0))[0]
+
+    def get_word(self, difficulty: str, index: int) -> str:
+        self.open()
+        count, offsets_pos, words_pos = self.buckets[difficulty]
+        if not 0 <= index < count:
+            raise IndexError('word index out of range')
+
+        start, end = OFFSET_PAIR.unpack_from(self.data, offsets_pos + index * OFFSET.size)
+        return self.data[words_pos + start:words_pos + end].decode('ascii')
+
+    def random_word(self, difficulty: str) -> str:
+        count = self.count(difficulty)
+        if not count:
+            raise ValueError(f"No words available for difficulty '{difficulty}'")
+
+        return self.get_word(difficulty, random.randrange(count))
+
+    def words(self, difficulty: str):
+        for index in range(self.count(difficulty)):
+            yield self.get_word(difficulty, index)
+
+    @staticmethod
+    def build(source: str, target: str, score=difficulty_score) -> dict[str, int]:
+        """
+        Compile a plain word list (one word per line) into the binary format.
+
+        Words are sorted by `score` and split into equally sized buckets, so
+        every difficulty gets a share of the list whatever the list contains.
+        Returns the amount of words per bucket.
+        """
+        with open(source, mode='r') as file:
+            words = {word for word in (line.strip().lower() for line in file) if is_valid_word(word)}
+
+        ranked = sorted(words, key=lambda word: (score(word), word))
+        bucket_size = math.ceil(len(ranked) / len(DIFFICULTIES)) if ranked else 0
+        buckets = [ranked[i * bucket_size:(i + 1) * bucket_size] for i in range(len(DIFFICULTIES))]
+
+        table = []
+        position = HEADER.size + BUCKET.size * len(DIFFICULTIES)
+        for bucket in buckets:
+            offsets_pos = position
+            words_pos = offsets_pos + OFFSET.size * (len(bucket) + 1)
+            table.append((len(bucket), offsets_pos, words_pos))
+            position = words_pos + sum(len(word) for word in bucket)
+
+        # write next to the target and swap it in, a running game may have the old file mapped
+        tmp_target = f'{target}.{os.getpid()}.tmp'
+        with open(tmp_target, mode='wb') as file:
+            file.write(HEADER.pack(MAGIC, len(DIFFICULTIES)))
+            for name, (count, offsets_pos, words_pos) in zip(DIFFICULTIES, table):
+                file.write(BUCKET.pack(name.encode('ascii'), count, offsets_pos, words_pos))
+
+            for bucket in buckets:
+                offset = 0
+                offsets = [0]
+                for word in bucket:
+                    offset += len(word)
+                    offsets.append(offset)
+                file.write(struct.pack(f'<{len(offsets)}I', *offsets))
+                file.write(''.join(bucket).encode('ascii'))
+
+        os.replace(tmp_target, target)
+        return {name: len(bucket) for name, bucket in zip(DIFFICULTIES, buckets)}
+
+
+@lru_cache(maxsize=None)
+def get_dictionary(name: str = 'hangman') -> HangmanDictionary:
+    """Shared dictionary for a word list in assets/Words.
+
+    One compiled into assets/Words with --build-dictionary is used while it's
+    newer than the list, otherwise the list is compiled into the cache
+    (again whenever the list changed).
+    """
+    source = get_asset_path('Words', f'{name}.txt')
+    modified = os.path.getmtime(source)
+    for target in (get_asset_path('Words', f'{name}.dict'), os.path.join(DICTIONARY_CACHE, f'{name}.dict')):
+        if os.path.exists(target) and os.path.getmtime(target) >= modified:
+            return HangmanDictionary(target)
+
+    os.makedirs(DICTIONARY_CACHE, exist_ok=True)
+    HangmanDictionary.build(source, target)
+    return HangmanDictionary(target)
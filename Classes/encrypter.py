@@ -0,0 +1,81 @@
+from Classes.cipher import HexCipher, get_word_index
+from Classes.mini_game import QuizGame
+import random
+
+
+class WordDecryptionGame(QuizGame):
+    default_distractors = ("ALPHA", "BETA", "DELTA", "OMEGA")
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.game = game
+        self.encryption_method = None
+        self.hints_enabled = True
+        self.word_index = get_word_index()
+
+    def play(self):
+        """Override to include decryption-specific game logic."""
+        self.start_question()
+        super().play()
+
+    def new_question(self):
+        self.generate_encrypted_challenge()
+
+    def generate_encrypted_challenge(self):
+        """Generates a hex-based encrypted word with options."""
+        # Prepare encrypted word and correct answer
+        original_word = self.word_index.random_word(self.game.difficulty)
+        encrypted_word = HexCipher.encode(original_word)
+
+        # Generate distractors that look like the original word
+        distractors = self.word_index.distractors(original_word)
+
+        # Too few look-alikes (a tiny word list), fill up with other words, never the answer or a repeat
+        if len(distractors) < 3:
+            pool = self.word_index.fallback_pool(self.game.difficulty, self.default_distractors)
+            taken = {original_word, *distractors}
+            # enough picks that the taken ones can be skipped, the pool is never copied
+            picks = random.sample(pool, min(len(pool), 3 + len(taken)))
+            distractors += [word for word in picks if word not in taken][:3 - len(distractors)]
+
+        # Combine correct answer and distractors
+        options = [original_word] + distractors[:3]  # Ensure exactly 4 options
+        random.shuffle(options)
+
+        # Assign to class properties
+        self.options = {
+            "A": options[0],
+            "B": options[1],
+            "C": options[2],
+            "D": options[3],
+        }
+        correct_option_key = list(self.options.keys())[options.index(original_word)]
+
+        # Set question and answer
+        self.question = f"Decrypt this hex: {encrypted_word}"
+        self.answer = original_word
+        self.correct_key = correct_option_key
+        self.helper = self.draw_helper
+        self.encryption_method = "Hexadecimal Encoding"
+
+    def draw_helper(self):
+        """Provide optional hints for hexadecimal encoding."""
+        if not self.hints_enabled:
+            return
+
+        # Explain hexadecimal encoding
+        hints = [
+            "Hint: Hexadecimal encoding uses numbers 0-9 ",
+            "and letters A-F to represent values.",
+            "Hint: Each hexadecimal value corresponds to a character,",
+            " where 'A' = 1, 'B' = 2, and so on.",
+            "Hint: Convert each hex digit to its decimal equivalent and",
+            " then map it to the corresponding letter in the alphabet.",
+            "Tip: For example, 'A' in hexadecimal is 1 in decimal,",
+            " 'B' is 2, 'C' is 3, and so on until 'F' = 15.",
+            "Tip: If you see something like 'D-9-E-5',",
+            " try converting each value separately and then combine the results to form a word."
+        ]
+
+        for i, hint in enumerate(hints, 1):
+            self.game.draw_text(hint, 20, self.game.DISPLAY_W - 50, (i * 30) + 50, color=self.game.WHITE, font=self.game.second_font, position='topright')
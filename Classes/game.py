@@ -1,31 +1,88 @@
-from pygame.draw_py import draw_line
 
-from functions import get_asset_path
+from functions import asset_source, get_asset_path, scene, award_letters, calculate_score
 import pygame
 import time
 import sys
-import random
 
+from Classes.audio import AudioLibrary
+from Classes.glyphs import GlyphAtlas
+from Classes.hud import PerformanceHud
 from Classes.menu import MainMenu, DifficultyMenu, MiniGameMenu
-from Classes.mini_game import RPSGame, HangmanGame, MathChampGame, BinaryConversionGame, WordDecryptionGame
+from Classes.mini_game import MainGame
+from Classes.prefetch import Prefetcher
 from Classes.rating import Rating
+from Classes.registry import MINI_GAMES, get_spec
+from Classes.render_queue import RenderQueue
+from Classes.surfaces import SurfaceCache, SurfaceStore
+from Classes.timers import TimerService
+from Classes.widgets import Label, Prompt, Screen, SlotInput, TextInput
 
 
 class Game:
-    def __init__(self):
+    # internal render resolution per preset, layout is always done in WIDTH x HEIGHT
+    RENDER_PRESETS = {
+        'quality': (1280, 720),
+        'balanced': (960, 540),
+        'performance': (640, 360)
+    }
+
+    def __init__(self, enabled_games: list[str] | None = None, render_preset: str = 'quality', telemetry=None,
+                 audio: bool = True, prefetch: bool = True):
         # inits
         pygame.init()
         pygame.mixer.init()
 
+        # tracks are decoded in the background, the story music is ready by the time it starts,
+        # headless runs (the simulator workers) go without music and without its decode thread
+        self.audio = AudioLibrary() if audio else None
+        if self.audio:
+            self.audio.preload('horror.mp3', 90)
+
         # screen setup
         self.sound = self.play_music('main.wav', 99, 90, 20)
         self.WIDTH, self.HEIGHT = 1280, 720
-        self.display = pygame.Surface((self.WIDTH, self.HEIGHT))
-        self.DISPLAY_W, self.DISPLAY_H = self.display.get_size()
-        self.window = pygame.display.set_mode((self.DISPLAY_W, self.DISPLAY_H))
+        self.DISPLAY_W, self.DISPLAY_H = self.WIDTH, self.HEIGHT
         self.mid_w, self.mid_h = self.DISPLAY_W / 2, self.DISPLAY_H / 2
+
+        # render at a lower resolution and let SDL scale the window up
+        if render_preset not in self.RENDER_PRESETS:
+            raise ValueError(f'Unknown render preset: {render_preset}')
+        self.render_preset = render_preset
+        self.RENDER_W, self.RENDER_H = self.RENDER_PRESETS[render_preset]
+        self.scale = self.RENDER_W / self.WIDTH
+        self.display = pygame.Surface((self.RENDER_W, self.RENDER_H))
+        self.window = pygame.display.set_mode((self.RENDER_W, self.RENDER_H), pygame.SCALED if self.scale != 1 else 0)
         self.FPS = 60
 
+        # frame pacing, idle screens block on input and unfocused windows render slowly
+        self.clock = pygame.time.Clock()
+        self.BACKGROUND_FPS = 5
+        self.IDLE_TIMEOUT = 500
+        self.idle_rendering = True
+        self.focused = True
+        self.redraw = True
+        # retained screens (Classes/widgets.py) paint everything again when set
+        self.repaint = True
+        self.scene = None
+
+        # timed transitions, fired while handling events; a callback that
+        # changes the screen sets redraw
+        self.timers = TimerService()
+
+        # optional AsyncRunner, frames and idle waits then run on its event loop
+        self.runner = None
+
+        # hooks for headless runs: input_source(game) can post input events before
+        # every poll, frame_listeners(game) are called at the end of every frame
+        self.input_source = None
+        self.frame_listeners = []
+
+        # optional Telemetry, see log()
+        self.telemetry = telemetry
+
+        # optional SceneProfiler, told about every scene change
+        self.profiler = None
+
         # password
         self.guessing_password = False
         self.guessed_characters = []
@@ -44,9 +101,32 @@ class Game:
         self.display_score = None
         self.run_win_dialog = None
         
+        # mini games offered in the menu, all registered games by default
+        self.enabled_games = [game_id for game_id in MINI_GAMES if enabled_games is None or game_id in enabled_games]
+        if not self.enabled_games:
+            raise ValueError('No mini games enabled')
+
         self.total_score = 0
-        self.total_games = 5
-        self.amount_games_unplayed = 5
+        self.total_games = len(self.enabled_games)
+        self.amount_games_unplayed = self.total_games
+
+        # mini game controllers and images, created the first time they are needed,
+        # decoded and scaled images are kept on disk for the next launch
+        self.controllers = {}
+        self.surfaces = SurfaceStore(SurfaceCache())
+        self.fonts = {}
+        self.atlases = {}
+        # builds the hovered mini game's controller ahead of its selection, None without the menus
+        self.prefetcher = Prefetcher(self) if prefetch else None
+        # blits and draws queued by the screens, flushed by blit_screen
+        self.render = RenderQueue()
+        # counted for the performance HUD
+        self.font_hits = 0
+        self.font_misses = 0
+        self.text_draws = 0
+        # F3 performance overlay, hidden until toggled
+        self.hud = PerformanceHud(self)
+        self.frame_listeners.append(self.hud)
 
         self.played_games = []
         self.inputted_chars = []
@@ -68,6 +148,7 @@ class Game:
         self.START_KEY = False
         self.BACK_KEY = False
         self.ESC_KEY = False
+        self.SPACE_KEY = False
 
         # game and difficulty
         self.game_mode = False
@@ -83,16 +164,15 @@ class Game:
         self.difficulties = DifficultyMenu(self)
         self.mini_game_menu = MiniGameMenu(self)
         self.rating = Rating(self)
-        self.rps_game = RPSGame(self)
-        self.hangman_game = HangmanGame(self)
-        self.binarize_game = BinaryConversionGame(self)
-        self.encrypter_game = WordDecryptionGame(self)
-        self.math_champ_game = MathChampGame(self)
 
+    @scene
     def game_loop(self) -> None:
         if not self.playing:
             return
 
+        if self.telemetry:
+            self.telemetry.start_session(difficulty=self.difficulty, games=self.total_games)
+
         # ask for name
         self.ask_name()
 
@@ -108,11 +188,17 @@ class Game:
 
             # select game
             self.mini_game_menu.display_menu()
+            selected = time.perf_counter()
             self.game_controller = self.get_game_controller(self.game_mode)
 
             if self.game_controller:
+                self.log('game_start', game=self.game_mode)
+
                 # set game rules, title, attempts etc.
                 self.game_controller.configure()
+                self.game_controller.layout_rules()
+                if self.prefetcher:
+                    self.prefetcher.launched(self.game_mode, time.perf_counter() - selected)
 
                 # show rules
                 self.game_controller.display_rules()
@@ -120,6 +206,15 @@ class Game:
                 # play the game
                 self.game_controller.play()
 
+                self.log(
+                    'game_end',
+                    game=self.game_mode,
+                    attempts=self.game_controller.attempt,
+                    correct=self.game_controller.correct,
+                    incorrect=self.game_controller.incorrect,
+                    won=bool(self.game_controller.is_winner)
+                )
+
                 # add score
                 if self.game_controller.is_winner:
                     self.total_score += 1
@@ -133,13 +228,11 @@ class Game:
 
                 self.win_logic(self.game_controller.is_winner)
 
-            self.window.blit(self.display,  (0, 0))
-            pygame.display.update()
-
-            self.reset_keys()
+            self.blit_screen()
 
         # display password guessing screen
         self.guess_password()
+        self.log('password', correct=self.correct_password(), letters_known=len(self.guessed_characters))
 
         # check if user inputted correct password
         # and display result of it
@@ -150,35 +243,85 @@ class Game:
         self.show_score()
 
         # save score to csv
-        self.rating.save_rating(self.user_name, self.end_time - self.start_time, self.difficulty, self.get_score())
+        score = self.get_score()
+        self.run_io(self.rating.save_rating, self.user_name, self.end_time - self.start_time, self.difficulty, score)
+        self.log('session_end', name=self.user_name, wins=self.total_score, seconds=self.end_time - self.start_time, score=score)
 
         # reset game
         self.reset()
 
-    def check_events(self) -> None:
+    def check_events(self, idle: bool = False) -> bool:
+        """
+        Handle pending events and return True when the screen needs redrawing.
+
+        With idle=True a screen that is already up to date blocks until input
+        arrives, a timer is due or IDLE_TIMEOUT passes, instead of polling
+        every frame.
+        """
+        self.timers.update()
+
+        if self.input_source:
+            self.input_source(self)
+
         keys = pygame.key.get_pressed()
         if keys[pygame.K_ESCAPE]:
             self.draw_text('THERE IS NO WAY BACK', 10, 20, 20, color=self.RED)
             self.blit_screen()
+            # retained screens paint over it next frame
+            self.repaint = True
+
+        if not (idle and self.idle_rendering):
+            # animated screens draw every frame
+            self.redraw = True
+
+        if self.redraw:
+            events = pygame.event.get()
+        else:
+            timeout = self.IDLE_TIMEOUT
+            delay = self.timers.next_delay()
+            if delay is not None:
+                # never 0, that would wait forever
+                timeout = min(timeout, int(delay * 1000) + 1)
+
+            event = self.runner.wait_event(timeout) if self.runner else pygame.event.wait(timeout)
+            events = [event] + pygame.event.get() if event.type != pygame.NOEVENT else []
+            self.timers.update()
+
+        for event in events:
+            self.redraw = True
 
-        for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
-            
+
+            # throttle rendering while the window is in the background
+            if event.type in (pygame.WINDOWFOCUSLOST, pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+                self.focused = False
+            elif event.type in (pygame.WINDOWFOCUSGAINED, pygame.WINDOWRESTORED, pygame.WINDOWSHOWN):
+                self.focused = True
+            if event.type == pygame.WINDOWEXPOSED:
+                self.repaint = True
+
             # activate action buttons
             if event.type == pygame.KEYDOWN:
-                self.START_KEY = event.key == pygame.K_RETURN
-                self.BACK_KEY = event.key == pygame.K_BACKSPACE
-                self.DOWN_KEY = event.key == pygame.K_DOWN
-                self.UP_KEY = event.key == pygame.K_UP
-                self.ESC_KEY = event.key == pygame.K_ESCAPE
-                self.LEFT_KEY = event.key == pygame.K_LEFT
-                self.RIGHT_KEY = event.key == pygame.K_RIGHT
+                # several keys can arrive in one frame, don't let a later one clear an earlier one
+                self.START_KEY |= event.key == pygame.K_RETURN
+                self.BACK_KEY |= event.key == pygame.K_BACKSPACE
+                self.DOWN_KEY |= event.key == pygame.K_DOWN
+                self.UP_KEY |= event.key == pygame.K_UP
+                self.ESC_KEY |= event.key == pygame.K_ESCAPE
+                self.SPACE_KEY |= event.key == pygame.K_SPACE
+                self.LEFT_KEY |= event.key == pygame.K_LEFT
+                self.RIGHT_KEY |= event.key == pygame.K_RIGHT
 
                 if pygame.K_a <= event.key <= pygame.K_z:
                     self.OTHER_KEY.append(chr(event.key).lower())
 
+                if event.key == pygame.K_F3:
+                    self.hud.toggle()
+
+        return self.redraw
+
     def reset_keys(self) -> None:
         self.OTHER_KEY = [] 
         self.LEFT_KEY = False
@@ -188,11 +331,13 @@ class Game:
         self.START_KEY = False
         self.BACK_KEY = False
         self.ESC_KEY = False
+        self.SPACE_KEY = False
 
     def draw_text(self, text: str, size: int | float, x: int | float, y: int | float, **kwargs) -> None:
 
         if not isinstance(text, str):
             text = str(text)
+        self.text_draws += 1
 
         color = self.BLACK
         if 'color' in kwargs and kwargs['color']:
@@ -201,76 +346,134 @@ class Game:
         selected_font = self.font
         if 'font' in kwargs and kwargs['font']:
             selected_font = kwargs['font']
-        font = pygame.font.Font(selected_font, size)
-
-        text_surface = font.render(text, True, color)
-        text_rect = text_surface.get_rect()
 
         position = 'topleft'
         if 'position' in kwargs:
             position = kwargs['position']
 
-        setattr(text_rect, position, (x, y))
+        # layer=N: queue the text on the render queue instead of drawing it now
+        layer = kwargs.get('layer')
+
+        # atlas=True: blit cached glyphs instead of rasterizing the string
+        if kwargs.get('atlas'):
+            glyphs = self.get_atlas(selected_font, size, color).sequence(text, position, self.scaled_point((x, y)))
+            if glyphs is not None:
+                if layer is None:
+                    self.display.blits(glyphs, doreturn=False)
+                else:
+                    self.render.blits(glyphs, layer)
+                return
+
+        font = self.get_font(selected_font, size)
+        text_surface = font.render(text, True, color)
+        text_rect = text_surface.get_rect()
+
+        setattr(text_rect, position, self.scaled_point((x, y)))
+
+        if layer is None:
+            self.display.blit(text_surface, text_rect)
+        else:
+            self.render.blit(text_surface, text_rect, layer=layer)
+
+    def get_font(self, path: str, size: int | float) -> pygame.font.Font:
+        """Font for a layout size, rendered at the size matching the render resolution."""
+        key = (path, max(1, round(size * self.scale)))
+        if key in self.fonts:
+            self.font_hits += 1
+        else:
+            self.font_misses += 1
+            self.fonts[key] = pygame.font.Font(asset_source(path), key[1])
+        return self.fonts[key]
+
+    def get_atlas(self, path: str, size: int | float, color) -> GlyphAtlas:
+        key = (path, max(1, round(size * self.scale)), tuple(color))
+        if key not in self.atlases:
+            self.atlases[key] = GlyphAtlas(self.get_font(path, size), color)
+        return self.atlases[key]
 
-        self.display.blit(text_surface, text_rect)
+    def scaled(self, value: int | float) -> int | float:
+        """Layout (1280x720) distance to render pixels."""
+        if self.scale == 1:
+            return value
+        return round(value * self.scale)
+
+    def scaled_point(self, point: tuple) -> tuple:
+        return self.scaled(point[0]), self.scaled(point[1])
+
+    def scaled_rect(self, rect) -> pygame.Rect:
+        rect = pygame.Rect(rect)
+        return pygame.Rect(self.scaled(rect.x), self.scaled(rect.y), self.scaled(rect.w), self.scaled(rect.h))
+
+    def scaled_width(self, width: int) -> int:
+        """Line width in render pixels, never thinner than one pixel."""
+        return max(1, self.scaled(width))
 
     def start_game(self) -> None:
         self.playing = True
         self.start_time = int(time.time())
 
     def get_background(self, name: str) -> pygame.image:
-        selected_image = pygame.image.load(get_asset_path('Background', name)) # Load and scale the background image
-        return pygame.transform.scale(selected_image, (self.DISPLAY_W, self.DISPLAY_H))
+        # the background scaled to the render size
+        return self.surfaces.load(name, 'Background', (self.RENDER_W, self.RENDER_H))
 
     def play_music(self, file_path: str, loops: int = 1, start: float = 0.0, fade: int = 500, volume: float = 0.03, play: bool = True) -> pygame.mixer:
-        # Initialize a new mixer instance
-        pygame.mixer.quit()  # Ensure no conflicts with existing mixer
-        pygame.mixer.init()
+        # Decoded PCM when the library has it, streamed from the file otherwise
+        if self.audio:
+            self.audio.play(file_path, loops, start, fade, volume, play)
+        return pygame.mixer
 
+    def get_game_controller(self, game_mode: str | bool) -> MainGame | None:
+        if game_mode in self.controllers:
+            return self.controllers[game_mode]
+
+        spec = get_spec(game_mode)
+        if spec is None or game_mode not in self.enabled_games:
+            return None
+
+        # built on the prefetch worker while the option was hovered
+        controller = self.prefetcher.take(game_mode) if self.prefetcher else None
+        if controller is None:
+            controller = self.build_controller(spec)
+        self.controllers[game_mode] = controller
+        return controller
+
+    def build_controller(self, spec) -> MainGame:
+        # first time this game is selected, import its module and load its assets,
+        # the originals are only held while the controller builds its scaled copies
+        controller_class = spec.load_class()
+        self.load_assets(spec.assets)
         try:
-            path = get_asset_path('Sound', file_path)
-            if not path:
-                raise FileNotFoundError(f"Asset path not found for {file_path}")
-
-            pygame.mixer.music.load(path)  # Load the music file
-            pygame.mixer.music.set_volume(volume)  # Set default volume
-            pygame.mixer.music.play(loops, start, fade)  # Play the music
+            return controller_class(self)
+        finally:
+            self.release_assets(spec.assets)
 
-            if not play:
-                pygame.mixer.music.pause()
+    def load_assets(self, assets: tuple) -> None:
+        for asset_type, name in assets:
+            self.surfaces.acquire(name, asset_type)
 
-        except Exception as e:
-            print(f"Error: {e}")
-
-        return pygame.mixer
-
-    def get_game_controller(self, game_mode: str | bool) -> RPSGame | HangmanGame | MathChampGame | BinaryConversionGame | WordDecryptionGame | None:
-        controllers = {
-            'rps': self.rps_game,
-            'hangman': self.hangman_game,
-            'math_champ': self.math_champ_game,
-            'encrypter': self.encrypter_game,
-            'binarize': self.binarize_game,
-        }
-    
-        return controllers.get(game_mode, None)
+    def release_assets(self, assets: tuple) -> None:
+        for asset_type, name in assets:
+            self.surfaces.release(name, asset_type)
 
+    @scene
     def show_rules(self) -> None:
         # stop playing any music
-        if self.sound and self.sound.music:
-            self.sound.music.pause()
+        if self.audio:
+            self.audio.pause()
 
         # Rules text
         rules = [
             "You will play a series of mini-games.",
             "For each mini-game, you will earn letters.",
             "If you win the most mini-games, you can decrypt the password in a later stage.",
-            "There are a total of 5 mini-games."
+            f"There are a total of {self.total_games} mini-games."
         ]
 
         self.display_rules = True
         while self.display_rules:
-            self.check_events()
+            if not self.check_events(idle=True):
+                continue
+
             if self.START_KEY:
                 self.display_rules = False
 
@@ -288,6 +491,7 @@ class Game:
             self.proceed('START')
             self.blit_screen()
 
+    @scene
     def pre_story(self) -> None:
         self.sound = self.play_music('horror.mp3', 99, 90, 20, volume=.1)
         # Story text
@@ -303,31 +507,39 @@ class Game:
         story_line_index = 0
         current_line = ""
         char_index = 0
-        line_speed = 40
-        last_time = pygame.time.get_ticks()
+        line_speed = 0.04
+
+        def type_next() -> None:
+            nonlocal story_line_index, current_line, char_index
+
+            if char_index < len(story[story_line_index]):
+                current_line += story[story_line_index][char_index]
+                char_index += 1
+            else:
+                story_line_index += 1
+                current_line = ""
+                char_index = 0
+
+            if story_line_index >= len(story):
+                self.timers.cancel(typing)
+            self.redraw = True
+
+        # the screen only changes when the typing timer adds a character
+        typing = self.timers.every(line_speed, type_next)
 
         while self.display_story:
-            self.check_events()
+            if not self.check_events(idle=True):
+                continue
+
             if self.START_KEY:
                 self.display_story = False
+                self.timers.cancel(typing)
 
             self.display.fill(self.BLACK)
 
             y_start = 250
             y_offset = 50
 
-            if story_line_index < len(story):
-                now = pygame.time.get_ticks()
-                if now - last_time > line_speed:
-                    if char_index < len(story[story_line_index]):
-                        current_line += story[story_line_index][char_index]
-                        char_index += 1
-                    else:
-                        story_line_index += 1
-                        current_line = ""
-                        char_index = 0
-                    last_time = now
-
             # Draw all fully written lines and the current line being typed
             for i in range(story_line_index):
                 self.draw_text(story[i], 30, self.mid_w, y_start + (y_offset * i), color=self.WHITE, position='center',
@@ -347,96 +559,110 @@ class Game:
             self.proceed('SKIP')
             self.blit_screen()
 
-    def blit_screen(self) -> None:
-        self.window.blit(self.display, (0, 0))
-        pygame.display.update()
+    def blit_screen(self, rects: list | None = None) -> None:
+        """Present the frame, only `rects` of it when given (retained screens)."""
+        self.render.flush(self.display)
+        if rects is None:
+            self.window.blit(self.display, (0, 0))
+        else:
+            for rect in rects:
+                self.window.blit(self.display, rect, rect)
+
+        # the F3 overlay goes on the window only, the display stays as the screen drew it
+        hud = self.hud.draw(self.window)
+        if rects is None:
+            pygame.display.update()
+        elif rects or hud:
+            pygame.display.update(rects + [hud] if hud else rects)
+        self.frame_done()
+
+    def enter_scene(self, name: str) -> str | None:
+        """Make `name` the active scene, returns the scene it replaces."""
+        previous, self.scene = self.scene, name
+        self.redraw = True
+        self.repaint = True
+        if self.telemetry:
+            self.telemetry.scene_enter(name)
+        if self.profiler:
+            self.profiler.enter(name)
+        return previous
+
+    def exit_scene(self, previous: str | None) -> None:
+        if self.telemetry:
+            self.telemetry.scene_exit(self.scene)
+        if self.profiler:
+            self.profiler.exit(self.scene)
+        self.scene = previous
+        self.redraw = True
+        self.repaint = True
+
+    def run_io(self, func, *args):
+        """Blocking I/O off the frame loop when a runner is attached, inline otherwise."""
+        if self.runner:
+            return self.runner.run_io(func, *args)
+        return func(*args)
+
+    def log(self, event: str, **fields) -> None:
+        if self.telemetry:
+            self.telemetry.record(event, **fields)
+
+    def frame_done(self) -> None:
+        """End of a frame: forget the handled keys and wait for the next frame slot."""
         self.reset_keys()
+        self.redraw = False
+        self.render.end_frame()
+
+        fps = self.FPS if self.focused else self.BACKGROUND_FPS
+        if self.runner:
+            self.runner.tick(fps)
+            self.clock.tick()
+        else:
+            self.clock.tick(fps)
+
+        for listener in self.frame_listeners:
+            listener(self)
 
+    @scene
     def guess_password(self):
         self.guessing_password = True
+        slots = SlotInput(self, len(self.password), 400)
+        # the typed letters are what correct_password() checks
+        self.inputted_chars = slots.chars
+        screen = Screen(self, [
+            Label(self, 'GUESS THE PASSWORD', 20, (self.DISPLAY_W / 2, 100), self.WHITE),
+            Label(self, ' '.join(self.guessed_characters), 20, (self.DISPLAY_W / 2, 200), self.ORANGE,
+                  font=self.second_font),
+            slots,
+            Prompt(self, 'SUBMIT'),
+        ])
         while self.guessing_password:
-            self.check_events()
+            if not self.check_events(idle=True):
+                continue
 
-            for char in self.OTHER_KEY:
-                if char in self.alphabet and len(self.inputted_chars) < len(self.password):
-                    self.inputted_chars.append(char)
+            slots.type_keys()
 
-            if self.BACK_KEY and len(self.inputted_chars) > 0:
-                self.inputted_chars.pop()
+            if self.BACK_KEY:
+                slots.pop()
 
-            if self.START_KEY and len(self.inputted_chars) == len(self.password):
+            if self.START_KEY and len(slots) == len(self.password):
                 self.guessing_password = False
 
-            self.display.fill(self.BLACK)
-            self.draw_text('GUESS THE PASSWORD', 20, self.DISPLAY_W / 2, 100, color=self.WHITE, position='center')
-            self.draw_text(' '.join(self.guessed_characters), 20, self.DISPLAY_W / 2, 200, color=self.ORANGE, position='center', font=self.second_font)
-
-            self.draw_password_lines(self.inputted_chars)
-            self.blit_screen()
-
-    def draw_password_lines(self, inputted_chars: list[str]) -> None:
-        word = self.password
-        display = self.display
-
-        line_length = 60
-        space_between_lines = 15
-        start_x = (self.DISPLAY_W // 2 -
-                   (len(word) * (line_length +
-                                 space_between_lines)) // 2)
-
-        start_y = 400
-        f_size = 20
-
-        # Draw lines for each letter in the word
-        for i, char in enumerate(word):
-            # Draw the line for the current character
-            # (even if it's not guessed yet)
-            pygame.draw.line(
-                display,
-                self.WHITE,
-                (start_x + i * (line_length +
-                                space_between_lines), start_y),
-                (start_x + i * (line_length +
-                                space_between_lines) + line_length, start_y),
-                3
-            )
-
-            # Calculate the width of the character to center it on the line
-            font = pygame.font.Font(self.font, f_size)
-
-            # Get both width and height
-            char_width, char_height = font.size(char)
-
-            # Calculate the x-coordinate to center the text
-            char_x = (start_x + i * (line_length + space_between_lines)
-                      + (line_length - char_width) // 2)
-
-            self.draw_text(
-                inputted_chars[i] if i < len(inputted_chars) else '',
-                f_size,
-                char_x,
-                start_y - 50,
-                color=self.WHITE,
-                position='topleft'
-            )
-
-        self.proceed('SUBMIT')
+            # typing a letter redraws just its slot
+            self.blit_screen(screen.draw())
 
+    @scene
     def win_logic(self, has_user_won: bool):
         if has_user_won:
-            amount_letters = len(self.pass_list) // self.amount_games_unplayed
+            new_letters = award_letters(self.pass_list, self.amount_games_unplayed)
             self.amount_games_unplayed -= 1
-            new_letters = ""
-
-            for _ in range(amount_letters):
-                index = random.randint(0, len(self.pass_list) - 1)
-                new_letter = self.pass_list.pop(index)
-                new_letters += new_letter
-                self.guessed_characters.append(new_letter)
+            self.guessed_characters.extend(new_letters)
+            self.log('letters', game=self.game_mode, letters=new_letters)
             self.display_winscreen = True
 
             while self.display_winscreen:
-                self.check_events()
+                if not self.check_events(idle=True):
+                    continue
+
                 if self.START_KEY:
                     self.display_winscreen = False
                 self.display.fill(self.BLACK)
@@ -460,7 +686,9 @@ class Game:
         else:
             self.display_losescreen = True
             while self.display_losescreen:
-                self.check_events()
+                if not self.check_events(idle=True):
+                    continue
+
                 if self.START_KEY:
                     self.display_losescreen = False
                 self.display.fill(self.RED)
@@ -492,27 +720,31 @@ class Game:
 
         self.total_score = 0
         self.guessed_characters = []
-        self.amount_games_unplayed = 5
+        self.amount_games_unplayed = self.total_games
         self.pass_list = list(self.password)
         self.cur_game = None
         self.game_controller = None
 
-        self.rps_game = RPSGame(self)
-        self.hangman_game = HangmanGame(self)
-        self.binarize_game = BinaryConversionGame(self)
-        self.encrypter_game = WordDecryptionGame(self)
-        self.math_champ_game = MathChampGame(self)
+        # fresh controllers next session, the modules stay loaded
+        if self.prefetcher:
+            self.prefetcher.cancel()
+        for controller in self.controllers.values():
+            controller.release()
+        self.controllers = {}
 
     def correct_password(self) -> bool:
         return ''.join(self.inputted_chars) == self.password
 
+    @scene
     def win_dialog(self):
         is_winner = self.correct_password()
         win_text = 'PASSWORD IS CORRECT!' if is_winner else 'PASSWORD IS INCORRECT!'
         win_color = self.GREEN if self.correct_password() else self.RED
         self.run_win_dialog = True
         while self.run_win_dialog:
-            self.check_events()
+            if not self.check_events(idle=True):
+                continue
+
             if self.START_KEY:
                 self.run_win_dialog = False
 
@@ -548,10 +780,13 @@ class Game:
             color=self.RED
         )
 
+    @scene
     def show_score(self):
         self.display_score = True
         while self.display_score:
-            self.check_events()
+            if not self.check_events(idle=True):
+                continue
+
             self.display.fill(self.BLACK)
 
             if self.START_KEY:
@@ -574,54 +809,31 @@ class Game:
             self.blit_screen()
 
     def get_score(self) -> int:
-        mod = {
-            'easy': 1,
-            'medium': 2,
-            'hard': 3
-        }
-
-        # Calculate the score
-        score = ((self.total_score * 1000) - ((self.end_time - self.start_time) * 0.1)) * mod[self.difficulty]
-
-        if self.correct_password():
-            score += 1000
-
-        # Ensure the score is non-negative
-        return max(0, int(score))
+        return calculate_score(self.total_score, self.end_time - self.start_time, self.difficulty, self.correct_password())
 
+    @scene
     def ask_name(self):
         """
         Ask user for his name
         """
         self.asking_name = True
-        name = []
+        name = TextInput(self, (self.DISPLAY_W / 2, self.DISPLAY_H / 2), 25, line_length=400)
+        screen = Screen(self, [
+            Label(self, 'INPUT YOUR NAME', 20, (self.DISPLAY_W / 2, 200), self.RED),
+            name,
+            Prompt(self),
+        ])
         while self.asking_name:
-            self.check_events()
-            self.display.fill(self.BLACK)
+            if not self.check_events(idle=True):
+                continue
 
             if self.START_KEY and len(name) > 2:
                 self.asking_name = False
-                self.user_name = ''.join(name)
-            elif self.BACK_KEY and len(name) > 0:
+                self.user_name = name.text
+            elif self.BACK_KEY:
                 name.pop()
 
-            for char in self.OTHER_KEY:
-                if char in self.alphabet:
-                    name.append(char)
+            name.type_keys()
 
-            self.draw_text('INPUT YOUR NAME', 20, self.DISPLAY_W / 2, 200, color=self.RED, position='center')
-
-            # Draw centered line
-            center_x = self.DISPLAY_W / 2
-            center_y = self.DISPLAY_H / 2
-            line_length = 400  # Adjust as needed for the desired length
-
-            # Ensure coordinates are integers
-            start_point = (int(center_x - line_length / 2), int(center_y))
-            end_point = (int(center_x + line_length / 2), int(center_y))
-
-            self.draw_text(''.join(name), 25, center_x, center_y - 50, color=self.WHITE, position='center')
-            draw_line(self.display, self.WHITE, start_point, end_point, 2)
-
-            self.proceed()
-            self.blit_screen()
+            # only the changed widgets are drawn and presented
+            self.blit_screen(screen.draw())
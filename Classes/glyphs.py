@@ -0,0 +1,108 @@
+"""
+Glyph-atlas text rendering.
+
+A GlyphAtlas rasterizes every character of a charset once, for one font,
+size and color, into a single surface. A string is then drawn straight onto
+the target with one Surface.blits call, a blit per character from its
+atlas rect, instead of rasterizing the whole string with the TTF renderer
+and blitting the result.
+
+Pen positions use the font's own widths plus the pair adjustments SDL_ttf
+makes when it renders a whole string, so the text lines up with
+Font.render output. A pair is measured with Font.size the first time it's
+laid out, not for the whole charset up front.
+
+It only pays off for many short strings drawn every frame onto the render
+queue, where the glyphs go out in the queue's blits batch (the hangman
+letter row). A longer string is faster through Font.render, see
+benchmarks/bench_text.py.
+"""
+
+import string
+
+import pygame
+
+CHARSET = ' ' + string.ascii_letters + string.digits + string.punctuation
+
+
+class GlyphAtlas:
+    # layouts of recently drawn strings
+    LAYOUT_CACHE = 512
+
+    def __init__(self, font: pygame.font.Font, color, charset: str = CHARSET) -> None:
+        self.font = font
+        self.height = font.get_height()
+        glyphs = [(char, font.render(char, True, color)) for char in charset]
+
+        self.surface = pygame.Surface((max(1, sum(glyph.get_width() for _, glyph in glyphs)), self.height),
+                                      pygame.SRCALPHA)
+        self.rects = {}
+        self.advances = {}
+        x = 0
+        for char, glyph in glyphs:
+            # a plain copy, blending onto the transparent atlas would darken the edges
+            self.surface.blit(glyph, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.rects[char] = pygame.Rect(x, 0, glyph.get_width(), self.height)
+            self.advances[char] = glyph.get_width()
+            x += glyph.get_width()
+        # premultiplied blits take the faster blend path
+        self.surface = self.surface.premul_alpha()
+
+        # (first, second) -> pen adjustment, measured as pairs come up
+        self.kerning = {}
+
+        self.layouts = {}
+        self.hits = 0
+        self.misses = 0
+
+    def layout(self, text: str) -> tuple[int, list] | None:
+        """Width and (x, rect) per character, None when a character isn't in the atlas."""
+        if text in self.layouts:
+            self.hits += 1
+            return self.layouts[text]
+        self.misses += 1
+
+        if any(char not in self.rects for char in text):
+            return None
+
+        x = 0
+        glyphs = []
+        previous = None
+        for char in text:
+            if previous is not None:
+                x += self.pair(previous, char)
+            glyphs.append((x, self.rects[char]))
+            x += self.advances[char]
+            previous = char
+
+        if len(self.layouts) >= self.LAYOUT_CACHE:
+            self.layouts.clear()
+        self.layouts[text] = (x, glyphs)
+        return self.layouts[text]
+
+    def pair(self, first: str, second: str) -> int:
+        adjust = self.kerning.get((first, second))
+        if adjust is None:
+            adjust = self.font.size(first + second)[0] - self.advances[first] - self.advances[second]
+            self.kerning[first, second] = adjust
+        return adjust
+
+    def sequence(self, text: str, position: str, point: tuple) -> list | None:
+        """Surface.blits items for text with its rect's `position` at point, None when the atlas can't draw it."""
+        layout = self.layout(text)
+        if layout is None:
+            return None
+
+        width, glyphs = layout
+        rect = pygame.Rect(0, 0, width, self.height)
+        setattr(rect, position, point)
+        return [(self.surface, (rect.x + x, rect.y), area, pygame.BLEND_PREMULTIPLIED) for x, area in glyphs]
+
+    def draw(self, target: pygame.Surface, text: str, position: str, point: tuple) -> bool:
+        """Draw text with its rect's `position` at point, False when the atlas can't draw it."""
+        sequence = self.sequence(text, position, point)
+        if sequence is None:
+            return False
+
+        target.blits(sequence, doreturn=False)
+        return True
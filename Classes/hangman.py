@@ -0,0 +1,323 @@
+from functions import (draw_circle, draw_slanted_line, draw_vertical_line,
+                       letter_bit, letter_mask, scene)
+from Classes.dictionary import get_dictionary
+from Classes.mini_game import MainGame
+from Classes.solver import get_solver
+from dataclasses import dataclass
+import pygame
+
+
+@dataclass(slots=True)
+class Alphabet:
+    name: str
+    x: int
+    y: int
+    h: int
+    w: int
+    bit: int
+
+
+class HangmanGame(MainGame):
+    def __init__(self, game):
+        MainGame.__init__(self, game)
+        self.is_winner = False
+        self.state = False
+        self.word = None
+        self.alphabet_objects = {}
+        self.alphabet = list('abcdefghijklmnopqrstuvwxyz')
+        self.dictionary = get_dictionary()
+
+        # round state as 26 bit letter masks (bit 0 = 'a')
+        self.word_mask = 0
+        self.guessed_mask = 0
+        self.used_mask = 0
+        self.word_bits = []
+        self.hint = None
+        # the first word, picked by prepare()
+        self.next_word = None
+
+        # redraw only when the masks changed
+        self.dirty = True
+
+        x, y = 20, 20
+        for letter in self.alphabet:
+
+            self.alphabet_objects[letter] = Alphabet(
+                name=letter.upper(),
+                x=x,
+                y=y,
+                h=35,
+                w=35,
+                bit=letter_bit(letter)
+            )
+
+            x += 30
+
+    def prepare(self, game_id: str) -> None:
+        self.next_word = self.get_random_word(self.game.difficulty)
+        # the hint index takes a while to build, better here than on the first SPACE
+        get_solver()
+
+    def warm(self, game_id: str) -> None:
+        super().warm(game_id)
+        for color in (self.game.WHITE, self.game.RED):
+            self.game.get_atlas(self.game.font, 24, color)
+
+    @scene
+    def play(self) -> None:
+        if self.next_word is None:
+            # not prefetched, build the hint index before the round rather than on the first hint
+            get_solver()
+        self.new_round(self.next_word or self.get_random_word(self.game.difficulty))
+        self.next_word = None
+        self.run_display = True
+        while self.run_display:
+            self.check_input()
+
+            # nothing changed: check_input() already blocked on input, just end the frame
+            if not self.dirty:
+                self.game.frame_done()
+                continue
+
+            self.dirty = False
+            self.game.display.fill(self.game.WHITE)
+
+            self.game.draw_text(
+                'Gues the word or he will die',
+                30,
+                self.mid_w,
+                75,
+                position='center',
+                color=self.game.RED
+            )
+
+            self.draw_gallows()
+            self.draw_word_lines()
+            self.draw_options()
+            self.draw_hint()
+
+            self.blit_screen()
+
+            self.did_user_win()
+
+    def new_round(self, word: str) -> None:
+        self.word = word
+        self.word_bits = [letter_bit(char) for char in word]
+        self.word_mask = letter_mask(word)
+        self.guessed_mask = 0
+        self.used_mask = 0
+        self.hint = None
+        self.dirty = True
+
+    def did_user_win(self) -> None:
+        if self.incorrect >= 6:
+            self.run_display = False
+            self.is_winner = False
+            return
+
+        if self.guessed_mask == self.word_mask:
+            self.run_display = False
+            self.is_winner = True
+
+    def draw_options(self) -> None:
+
+        rect_x = 50
+        rect_y = self.game.DISPLAY_H - 90
+        rect_width = 40
+        rect_height = 40
+
+        step = ((self.game.DISPLAY_W - (len(self.alphabet_objects) * 3.5))
+                / len(self.alphabet_objects))
+
+        for char in self.alphabet_objects.values():
+            color = self.game.WHITE
+            if self.used_mask & char.bit:
+                color = self.game.RED
+
+            self.game.draw_text(
+                char.name,
+                24,
+                (rect_x + rect_width // 2) + 2,
+                (rect_y + rect_height // 2) - 2.5,
+                position='center',
+                color=color,
+                # the same 26 single letters every redraw, glyph blits are cheapest here
+                atlas=True,
+                layer=1
+            )
+
+            rect_x += step
+
+    def check_input(self) -> None:
+        # nothing changes on screen until a guess comes in
+        self.game.check_events(idle=not self.dirty)
+
+        for char in self.game.OTHER_KEY:
+            self.guess(char)
+
+        if self.game.SPACE_KEY:
+            self.show_hint()
+
+    def guess(self, char: str) -> None:
+        bit = letter_bit(char)
+        if not bit or self.used_mask & bit:
+            return
+
+        self.used_mask |= bit
+        self.hint = None
+        if self.word_mask & bit:
+            self.guessed_mask |= bit
+        else:
+            self.incorrect += 1
+
+        self.dirty = True
+
+    def pattern(self) -> str:
+        """The word as the player sees it, e.g. 'sh_d_w'."""
+        return ''.join(char if self.guessed_mask & bit else '_' for char, bit in zip(self.word, self.word_bits))
+
+    def show_hint(self) -> None:
+        self.hint = get_solver().best_letter(self.pattern(), self.used_mask)
+        self.dirty = True
+
+    def draw_hint(self) -> None:
+        text = f'HINT: TRY {self.hint.upper()}' if self.hint else 'PRESS SPACE FOR A HINT'
+        self.game.draw_text(text, 15, self.mid_w, 120, position='center', color=self.game.ORANGE)
+
+    def draw_gallows(self):
+        display = self.game.display
+        black = self.game.BLACK
+        dw, dh = self.game.DISPLAY_W, self.game.DISPLAY_H
+
+        # layout coordinates to render pixels
+        point, rect, width = self.game.scaled_point, self.game.scaled_rect, self.game.scaled_width
+
+        # Draw base structure
+        pygame.draw.rect(
+            display,
+            black,
+            rect((0, dh - 250, dw, dh))
+        )  # Horizontal bottom line
+
+        pygame.draw.rect(
+            display,
+            black,
+            rect((dw - 475, 200, 15, 275))
+        )  # Vertical right long line
+
+        pygame.draw.line(
+            display,
+            black,
+            point((750, dh - 525)),
+            point((810, dh - 450)), width(15)
+        )  # Slanted line
+
+        pygame.draw.rect(
+            display,
+            black,
+            rect((650, dh - 525, 170, 10))
+        )  # Horizontal top line
+
+        pygame.draw.rect(
+            display,
+            black,
+            rect((650, 200, 15, 50))
+        )  # Vertical top line
+
+        # Draw hangman parts incrementally
+        if self.incorrect >= 1:
+            draw_circle(
+                self.game.display,
+                point((657, 275)),
+                self.game.scaled(25),
+                width(5),
+                self.game.RED
+            )  # Head
+
+        if self.incorrect >= 2:
+            draw_vertical_line(
+                self.game.display,
+                point((657, 300)),
+                self.game.scaled(100),
+                width(5),
+                self.game.RED
+            )  # Body
+
+        if self.incorrect >= 3:
+            draw_slanted_line(
+                self.game.display,
+                point((657, 315)),
+                point((-50, 50)),
+                width(7),
+                self.game.RED
+            )  # Left arm
+
+        if self.incorrect >= 4:
+            draw_slanted_line(
+                self.game.display,
+                point((657, 315)),
+                point((50, 50)),
+                width(7),
+                self.game.RED
+            )  # Right arm
+
+        if self.incorrect >= 5:
+            draw_slanted_line(
+                self.game.display,
+                point((657, 400)),
+                point((-50, 50)),
+                width(7),
+                self.game.RED
+            )  # Left leg
+
+        if self.incorrect >= 6:
+            draw_slanted_line(
+                self.game.display,
+                point((657, 400)),
+                point((50, 50)),
+                width(7),
+                self.game.RED
+            )  # Right leg
+
+    def draw_word_lines(self):
+        word = self.word
+
+        line_length = 60
+        space_between_lines = 15
+        start_x = (self.game.DISPLAY_W // 2 -
+                   (len(word) * (line_length +
+                                 space_between_lines)) // 2)
+
+        start_y = 575
+        f_size = 40
+
+        # Draw lines for each letter in the word
+        for i, char in enumerate(word):
+            # Draw the line for the current character
+            # (even if it's not guessed yet)
+            self.game.render.line(
+                self.game.WHITE,
+                self.game.scaled_point((start_x + i * (line_length +
+                                                       space_between_lines), start_y)),
+                self.game.scaled_point((start_x + i * (line_length +
+                                                       space_between_lines) + line_length, start_y)),
+                self.game.scaled_width(3)
+            )
+
+            # If the character has been guessed, display it centered on its line
+            if self.guessed_mask & self.word_bits[i]:
+                char_x = (start_x + i * (line_length + space_between_lines)
+                          + line_length // 2)
+
+                self.game.draw_text(
+                    char,
+                    f_size,
+                    char_x,
+                    start_y - 50,
+                    color=self.game.WHITE,
+                    position='midtop',
+                    layer=1
+                )
+
+    def get_random_word(self, difficulty):
+        return self.dictionary.random_word(difficulty)
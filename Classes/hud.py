@@ -0,0 +1,155 @@
+"""
+Performance overlay, toggled with F3 and hidden by default.
+
+The HUD is a frame listener. While it's shown it records the frame times
+and the render queue numbers of every frame, but it only renders its text
+and the frame-time sparkline into a cached overlay UPDATE_INTERVAL times a
+second. Every frame Game.blit_screen just blits that overlay onto the
+window, so the display the screens draw on is never touched and measuring
+barely shows up in what is measured. While shown a timer wakes screens
+that wait for input, so the overlay still updates there. While hidden it
+does nothing.
+"""
+
+import time
+from collections import deque
+
+import pygame
+
+from Classes.surfaces import surface_bytes
+
+
+class PerformanceHud:
+    UPDATE_INTERVAL = 0.25
+    HISTORY = 120
+    WIDTH = 330
+    FONT_SIZE = 16
+    LINE_HEIGHT = 18
+    SPARKLINE_HEIGHT = 36
+    # frame times up to this fill the sparkline, slower frames are clipped
+    SPARKLINE_MAX = 1 / 20
+
+    def __init__(self, game) -> None:
+        self.game = game
+        self.visible = False
+        self.times = deque(maxlen=self.HISTORY)
+        self.last = None
+        self.next_update = 0.0
+
+        # sums since the last update, shown as per-frame averages
+        self.frames = 0
+        self.items = 0
+        self.calls = 0
+        self.texts = 0
+
+        self.surface = None
+        self.rect = None
+        # wakes idle screens while shown, so the numbers keep updating
+        self.timer = None
+
+    def toggle(self) -> None:
+        self.visible = not self.visible
+        self.game.timers.cancel(self.timer)
+        self.timer = self.game.timers.every(self.UPDATE_INTERVAL, self.wake) if self.visible else None
+        self.times.clear()
+        self.last = None
+        self.next_update = 0.0
+        self.surface = None
+        self.frames = self.items = self.calls = self.texts = 0
+        self.game.text_draws = 0
+
+        # take the overlay off (or put it on) retained screens too
+        self.game.repaint = True
+        self.game.redraw = True
+
+    def wake(self) -> None:
+        self.game.redraw = True
+
+    def __call__(self, game) -> None:
+        if not self.visible:
+            return
+
+        now = time.perf_counter()
+        if self.last is not None:
+            self.times.append(now - self.last)
+        self.last = now
+
+        self.frames += 1
+        self.items += game.render.last.items
+        self.calls += game.render.last.calls
+
+        if now >= self.next_update:
+            self.next_update = now + self.UPDATE_INTERVAL
+            self.update()
+
+    def text_cache(self) -> str:
+        atlases = list(self.game.atlases.values())
+        hits = sum(atlas.hits for atlas in atlases)
+        lookups = hits + sum(atlas.misses for atlas in atlases)
+        fonts = self.game.font_hits / max(1, self.game.font_hits + self.game.font_misses)
+        glyphs = f'{hits / lookups:.0%}' if lookups else '-'
+        return f'TEXT CACHE FONTS {fonts:.0%} GLYPHS {glyphs}'
+
+    def memory(self) -> str:
+        store = self.game.surfaces.nbytes()
+        atlases = sum(surface_bytes(atlas.surface) for atlas in list(self.game.atlases.values()))
+        frame = surface_bytes(self.game.display)
+        total = store + atlases + frame
+        return f'SURFACES {total / 1024 ** 2:.1f} MB ({len(self.game.surfaces)} SHARED)'
+
+    def update(self) -> None:
+        game = self.game
+        frames = max(1, self.frames)
+        texts, game.text_draws = game.text_draws, 0
+
+        if self.times:
+            mean = sum(self.times) / len(self.times)
+            timing = f'FPS {1 / mean:.1f}  FRAME {mean * 1000:.1f} MS  MAX {max(self.times) * 1000:.1f}'
+        else:
+            timing = 'FPS -'
+
+        lines = [
+            timing,
+            f'QUEUED {self.items / frames:.0f}  CALLS {self.calls / frames:.0f}  TEXT {texts / frames:.0f} PER FRAME',
+            self.text_cache(),
+            self.memory(),
+            f'SCENE {game.scene or "-"}',
+        ]
+        self.frames = self.items = self.calls = 0
+
+        font = game.get_font(game.second_font, self.FONT_SIZE)
+        padding = game.scaled(6)
+        line_height = game.scaled(self.LINE_HEIGHT)
+        spark_height = game.scaled(self.SPARKLINE_HEIGHT)
+        width = game.scaled(self.WIDTH)
+        height = padding * 3 + spark_height + line_height * len(lines)
+
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 190))
+
+        # frame-time sparkline, newest on the right
+        if len(self.times) > 1:
+            step = (width - padding * 2) / (self.HISTORY - 1)
+            offset = self.HISTORY - len(self.times)
+            bottom = padding + spark_height
+            points = [(padding + (offset + index) * step,
+                       bottom - min(frame, self.SPARKLINE_MAX) / self.SPARKLINE_MAX * spark_height)
+                      for index, frame in enumerate(self.times)]
+            pygame.draw.lines(surface, game.ORANGE, False, points)
+
+        y = padding * 2 + spark_height
+        for line in lines:
+            surface.blit(font.render(line, True, game.WHITE), (padding, y))
+            y += line_height
+
+        self.surface = surface
+        self.rect = surface.get_rect(topright=(game.RENDER_W - padding, padding))
+
+    def draw(self, window: pygame.Surface) -> pygame.Rect | None:
+        """Put the overlay on the window over a clean copy of the display, returns its rect."""
+        if not self.visible or self.surface is None:
+            return None
+
+        window.blit(self.game.display, self.rect, self.rect)
+        window.blit(self.surface, self.rect)
+        return self.rect
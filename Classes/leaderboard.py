@@ -0,0 +1,315 @@
+"""
+Shared leaderboard client and a local stand-in server.
+
+The client sits behind Rating. Scores are put on an offline queue (kept in
+a file, one JSON object per line) and a background thread sends them in
+batches over one kept-alive HTTP connection. When the server can't be
+reached the queue just grows and is replayed once it answers again, also
+after a restart of the game.
+
+The top scores are fetched by the same thread and cached with a TTL, top()
+only returns the cache and asks for a refresh when it went stale, so the
+rating screen never waits on the network.
+
+Every queued score gets a uuid when it's submitted. A batch whose response
+got lost is sent again, the server ignores the ids it already has.
+
+API:
+    GET  /scores?limit=N  ->  [{"id", "name", "score", "time", "difficulty"}, ...] best first
+    POST /scores          <-  [{"id", "name", "score", "time", "difficulty"}, ...]
+                          ->  {"accepted": N}  (new scores, repeated ids don't count)
+"""
+
+import atexit
+import heapq
+import http.client
+import json
+import os
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class LeaderboardError(Exception):
+    pass
+
+
+class LeaderboardClient:
+    def __init__(self, url: str, queue_path: str, cache_path: str | None = None, ttl: float = 30.0,
+                 limit: int = 11, batch_size: int = 50, timeout: float = 2.0, retry_interval: float = 5.0,
+                 background: bool = True) -> None:
+        parts = urlsplit(url)
+        if parts.scheme != 'http' or not parts.hostname:
+            raise ValueError(f'Unsupported leaderboard url: {url}')
+
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.prefix = parts.path.rstrip('/')
+        self.queue_path = queue_path
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.limit = limit
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.retry_interval = retry_interval
+
+        self.lock = threading.Lock()
+        self.pending = self.load_queue()
+        self.cache, self.fetched = self.load_cache(), 0.0
+        self.connection = None
+        self.online = None
+        self.on_update = None
+        self.requests = 0
+        self.connects = 0
+
+        self.wake = threading.Event()
+        self.closing = False
+        self.thread = None
+        if background:
+            self.thread = threading.Thread(target=self.run, name='leaderboard', daemon=True)
+            self.thread.start()
+            atexit.register(self.close)
+
+    # game side, never touches the network
+
+    def submit(self, name: str, score: int, seconds: int, difficulty: str) -> None:
+        entry = {'id': uuid.uuid4().hex, 'name': name, 'score': int(score), 'time': int(seconds),
+                 'difficulty': difficulty}
+        with self.lock:
+            self.pending.append(entry)
+            with open(self.queue_path, mode='a') as file:
+                file.write(json.dumps(entry, separators=(',', ':')) + '\n')
+        self.wake.set()
+
+    def top(self) -> list[dict]:
+        """The cached top scores, possibly stale or empty, a refresh is asked for when stale."""
+        if self.stale():
+            self.wake.set()
+        return self.cache
+
+    def stale(self) -> bool:
+        return time.monotonic() - self.fetched > self.ttl
+
+    # network side
+
+    def run(self) -> None:
+        while not self.closing:
+            self.sync()
+            # offline: retry later, online: wake up for new scores or when the cache expires
+            self.wake.wait(self.retry_interval if self.online is False else self.ttl)
+            self.wake.clear()
+
+    def sync(self) -> None:
+        """Send the queued scores and refresh a stale cache."""
+        try:
+            self.send_pending()
+            if self.stale():
+                self.fetch_top()
+            self.online = True
+        except (OSError, ValueError, http.client.HTTPException, LeaderboardError):
+            # ValueError: a body that isn't JSON, the thread has to keep running
+            self.disconnect()
+            self.online = False
+
+    def send_pending(self) -> None:
+        while self.pending:
+            batch = self.pending[:self.batch_size]
+            self.request('POST', '/scores', batch)
+            with self.lock:
+                del self.pending[:len(batch)]
+                self.save_queue()
+            # the new scores may change the top list
+            self.fetched = 0.0
+
+    def fetch_top(self) -> None:
+        scores = parse_scores(self.request('GET', f'/scores?limit={self.limit}'))
+        if scores is None:
+            raise LeaderboardError('GET /scores: unexpected response')
+        self.cache, self.fetched = scores, time.monotonic()
+        if self.cache_path:
+            replace_file(self.cache_path, json.dumps(scores))
+        if self.on_update:
+            self.on_update()
+
+    def request(self, method: str, path: str, body=None):
+        if self.connection is None:
+            self.connection = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            self.connects += 1
+
+        headers = {}
+        data = None
+        if body is not None:
+            data = json.dumps(body, separators=(',', ':')).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+
+        self.connection.request(method, self.prefix + path, data, headers)
+        response = self.connection.getresponse()
+        payload = response.read()
+        self.requests += 1
+
+        if response.will_close:
+            self.disconnect()
+        if response.status != 200:
+            raise LeaderboardError(f'{method} {path}: {response.status} {response.reason}')
+        return json.loads(payload)
+
+    def disconnect(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def close(self) -> None:
+        if self.closing:
+            return
+
+        self.closing = True
+        self.wake.set()
+        if self.thread is not None:
+            self.thread.join()
+        self.disconnect()
+
+    # local files
+
+    def load_queue(self) -> list[dict]:
+        if not os.path.exists(self.queue_path):
+            return []
+
+        entries, torn = [], False
+        with open(self.queue_path, mode='r') as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # a line half written when the game died during submit()
+                    torn = True
+                    continue
+                if 'id' not in entry:
+                    # queued before scores had ids
+                    entry['id'] = uuid.uuid4().hex
+                    torn = True
+                entries.append(entry)
+
+        if torn:
+            replace_file(self.queue_path, queue_text(entries))
+        return entries
+
+    def save_queue(self) -> None:
+        replace_file(self.queue_path, queue_text(self.pending))
+
+    def load_cache(self) -> list[dict]:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return []
+        try:
+            with open(self.cache_path, mode='r') as file:
+                return parse_scores(json.load(file)) or []
+        except ValueError:
+            return []
+
+
+def parse_scores(payload) -> list[dict] | None:
+    """The score entries in payload with the types the rating screen needs, None when it isn't a score list."""
+    if not isinstance(payload, list):
+        return None
+    try:
+        return [{'id': str(entry.get('id', '')), 'name': str(entry['name']), 'score': int(entry['score']),
+                 'time': int(entry['time']), 'difficulty': str(entry['difficulty'])} for entry in payload]
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+
+def queue_text(entries: list[dict]) -> str:
+    return ''.join(json.dumps(entry, separators=(',', ':')) + '\n' for entry in entries)
+
+
+def replace_file(path: str, text: str) -> None:
+    temp = f'{path}.{os.getpid()}.tmp'
+    with open(temp, mode='w') as file:
+        file.write(text)
+    os.replace(temp, path)
+
+
+class LeaderboardHandler(BaseHTTPRequestHandler):
+    # keep-alive, every response has a Content-Length
+    protocol_version = 'HTTP/1.1'
+    # headers and body go out in separate writes, without this a kept-alive
+    # connection waits ~40 ms on the client's delayed ACK for every response
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        if url.path != '/scores':
+            return self.send_json(404, {'error': 'not found'})
+
+        try:
+            limit = int(parse_qs(url.query).get('limit', ['10'])[0])
+        except ValueError:
+            return self.send_json(400, {'error': 'bad limit'})
+        self.send_json(200, self.server.top(limit))
+
+    def do_POST(self) -> None:
+        if self.path != '/scores':
+            return self.send_json(404, {'error': 'not found'})
+
+        try:
+            scores = parse_scores(json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0)))))
+        except ValueError:
+            scores = None
+        if scores is None:
+            return self.send_json(400, {'error': 'bad scores'})
+
+        self.send_json(200, {'accepted': self.server.add(scores)})
+
+    def send_json(self, status: int, body) -> None:
+        data = json.dumps(body, separators=(',', ':')).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class LeaderboardServer(ThreadingHTTPServer):
+    """Stand-in for the shared leaderboard, keeps the scores in memory."""
+
+    daemon_threads = True
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0) -> None:
+        super().__init__((host, port), LeaderboardHandler)
+        self.scores = []
+        self.ids = set()
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def add(self, scores: list[dict]) -> int:
+        """Store the scores not seen before, returns how many that were."""
+        added = 0
+        with self.lock:
+            for entry in scores:
+                if entry['id']:
+                    if entry['id'] in self.ids:
+                        continue
+                    self.ids.add(entry['id'])
+                self.scores.append(entry)
+                added += 1
+        return added
+
+    def top(self, limit: int) -> list[dict]:
+        with self.lock:
+            return heapq.nlargest(limit, self.scores, key=lambda entry: entry['score'])
+
+    def start(self) -> threading.Thread:
+        """Serve on a daemon thread, stop with shutdown()."""
+        thread = threading.Thread(target=self.serve_forever, name='leaderboard-server', daemon=True)
+        thread.start()
+        return thread
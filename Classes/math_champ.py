@@ -0,0 +1,81 @@
+from Classes.mini_game import QuizGame
+import random
+
+
+class MathChampGame(QuizGame):
+    def __init__(self, game):
+        super().__init__(game)
+        self.game = game
+
+    def play(self):
+        """Override to include math-specific equation generation."""
+        self.start_question()
+        super().play()
+
+    def new_question(self):
+        self.generate_equation(self.game.difficulty)
+
+    def generate_equation(self, game_mode):
+        """Generates a math equation and populates options."""
+        values = {
+            "A": 2,
+            "B": 3,
+            "C": 5,
+            "D": 7,
+            "E": 11
+        }
+
+        difficulty = {
+            'easy': 2,
+            'medium': 3,
+            'hard': 4
+        }
+
+        num_variables = difficulty[game_mode]
+        chosen_vars = random.sample(list(values.items()), num_variables)
+
+        equation_str = " + ".join([f"{var}" for var, _ in chosen_vars])
+        equation_result = sum([val for _, val in chosen_vars])
+
+        options = set()
+        while len(options) < 3:
+            incorrect = random.randint(equation_result - 4, equation_result + 4)
+            if incorrect != equation_result:
+                options.add(incorrect)
+
+        options = list(options)
+        options.append(equation_result)
+        random.shuffle(options)
+
+        self.options = {
+            "A": options[0],
+            "B": options[1],
+            "C": options[2],
+            "D": options[3],
+        }
+
+        correct_option_key = list(self.options.keys())[options.index(equation_result)]
+        self.question, self.answer, self.correct_key = equation_str, equation_result, correct_option_key
+        self.helper = self.draw_helper
+
+    def draw_helper(self):
+        values = {
+            "A": 2,
+            "B": 3,
+            "C": 5,
+            "D": 7,
+            "E": 11
+        }
+
+        # Calculations to display
+        calculations = [
+            f'A + A = {values["A"] + values["A"]}',
+            f'B + A = {values["B"] + values["A"]}',
+            f'B + C = {values["B"] + values["C"]}',
+            f'C + D = {values["D"] + values["C"]}',
+            f'D + E = {values["D"] + values["E"]}'
+        ]
+
+        for i, calc in enumerate(calculations, 1):
+            self.game.draw_text(calc, 25, self.game.DISPLAY_W - 150, (i * 50), color=self.game.WHITE,
+                                font=self.game.second_font)
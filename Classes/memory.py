@@ -0,0 +1,89 @@
+"""
+Memory report: surface bytes and python objects per subsystem.
+
+Every subsystem is walked from its root objects with gc.get_referents. The
+walk never steps into the game object, modules, classes or functions, and
+an object reached from an earlier subsystem isn't counted again, so shared
+surfaces show up under the first subsystem that holds them.
+"""
+
+import gc
+import sys
+import types
+from collections import Counter
+
+import pygame
+
+from Classes.surfaces import surface_bytes
+
+SKIP_TYPES = (types.ModuleType, type, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+
+
+class Usage:
+    def __init__(self) -> None:
+        self.objects = 0
+        self.python_bytes = 0
+        self.surfaces = 0
+        self.surface_bytes = 0
+        self.types = Counter()
+
+    def add(self, obj) -> None:
+        self.objects += 1
+        self.python_bytes += sys.getsizeof(obj)
+        self.types[type(obj).__name__] += 1
+
+        if isinstance(obj, pygame.Surface):
+            self.surfaces += 1
+            self.surface_bytes += surface_bytes(obj)
+
+
+def walk(roots: list, seen: set) -> Usage:
+    usage = Usage()
+    stack = list(roots)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, SKIP_TYPES):
+            continue
+
+        seen.add(id(obj))
+        usage.add(obj)
+        stack.extend(gc.get_referents(obj))
+    return usage
+
+
+def subsystems(game) -> dict[str, list]:
+    systems = {
+        'display': [game.display, game.window],
+        'menus': [game.main_menu, game.difficulties, game.mini_game_menu],
+        'rating': [game.rating],
+    }
+    for game_id, controller in game.controllers.items():
+        systems[f'mini game {game_id}'] = [controller]
+
+    systems['fonts'] = [game.fonts, game.atlases]
+    systems['surface store'] = [game.surfaces]
+    systems['game (rest)'] = list(vars(game).values())
+    return systems
+
+
+def memory_report(game) -> dict[str, Usage]:
+    # keep everything the walk would see from the game itself out of every subsystem
+    seen = {id(game), id(vars(game))}
+    return {name: walk(roots, seen) for name, roots in subsystems(game).items()}
+
+
+def print_report(report: dict[str, Usage]) -> None:
+    print(f'{"subsystem":<22} {"objects":>8} {"python KB":>10} {"surfaces":>9} {"surface KB":>11}  top types')
+    for name, usage in report.items():
+        top = ', '.join(f'{type_name} {count}' for type_name, count in usage.types.most_common(3))
+        print(f'{name:<22} {usage.objects:>8} {usage.python_bytes / 1024:>10.1f} '
+              f'{usage.surfaces:>9} {usage.surface_bytes / 1024:>11.1f}  {top}')
+
+    total = Usage()
+    for usage in report.values():
+        total.objects += usage.objects
+        total.python_bytes += usage.python_bytes
+        total.surfaces += usage.surfaces
+        total.surface_bytes += usage.surface_bytes
+    print(f'{"total":<22} {total.objects:>8} {total.python_bytes / 1024:>10.1f} '
+          f'{total.surfaces:>9} {total.surface_bytes / 1024:>11.1f}')
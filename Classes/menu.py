@@ -1,6 +1,16 @@
 import sys
 import pygame
-from functions import get_asset_path
+from dataclasses import dataclass
+from functions import scene
+from Classes.registry import get_spec
+
+
+@dataclass(slots=True)
+class MenuOption:
+    value: str
+    label: str
+    color: tuple
+    disabled: bool = False
 
 
 class Menu:
@@ -14,91 +24,157 @@ class Menu:
 
         self.offset = -50
 
-    def draw_cursor(self, **kwargs) -> None:
-        color = self.game.BLACK
-        if 'color' in kwargs:
-            color = kwargs['color']
-
-        self.game.draw_text('*', 15, self.cursor_rect.x, self.cursor_rect.y, color=color)
-
     def blit_screen(self) -> None:
-        self.game.window.blit(self.game.display, (0, 0))
-        pygame.display.update()
-        self.game.reset_keys()
+        self.game.blit_screen()
 
 
-class MainMenu(Menu):
-    def __init__(self, game) -> None:
-        Menu.__init__(self, game)
-        self.state = "Start"
-        self.start_pos = 100
+class OptionMenu(Menu):
+    """
+    Vertical list of options navigated with the arrow keys.
 
-        self.playx, self.playy = self.start_pos, self.mid_h - 50
-        self.scoreboardx, self.scoreboardy = self.start_pos, self.playy + self.option_offset
-        self.quitx, self.quity = self.start_pos, self.scoreboardy + self.option_offset
+    Every option is rendered once per state (normal, selected, disabled and
+    selected while disabled) and the static part of the screen once per
+    visit. Moving the cursor only repaints and updates the old and the new
+    option rows.
+    """
 
-        self.cursor_rect.midtop = (self.start_pos + self.offset, self.playy)
+    font_size = 20
+    cursor_size = 15
 
-    def display_menu(self) -> None:
-        self.run_display = True
+    def __init__(self, game, options: list[MenuOption], x: float, y: float, cursor_color: tuple) -> None:
+        Menu.__init__(self, game)
+        self.options = options
+        self.index = 0
+        self.x, self.y = x, y
+        self.cursor_color = cursor_color
+        self.disabled_color = self.game.RED
+
+        self.background = None
+        self.rects = []
+        self.surfaces = []
+        self.render_options()
+
+    @property
+    def state(self) -> str:
+        return self.options[self.index].value
+
+    def render_options(self) -> None:
+        font = self.game.get_font(self.game.font, self.font_size)
+        cursor = self.game.get_font(self.game.font, self.cursor_size).render('*', True, self.cursor_color)
+
+        # the cursor sits left of the label, same spot draw_cursor used to put it
+        cursor_x = self.game.scaled(self.offset - self.cursor_rect.w // 2)
+
+        self.rects, self.surfaces = [], []
+        for i, option in enumerate(self.options):
+            labels = {
+                False: font.render(option.label, True, option.color),
+                True: font.render(option.label, True, self.disabled_color)
+            }
+            width = -cursor_x + max(label.get_width() for label in labels.values())
+            height = max(cursor.get_height(), font.get_height())
+
+            states = {}
+            for disabled, label in labels.items():
+                for selected in (False, True):
+                    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+                    surface.blit(label, (-cursor_x, 0))
+                    if selected:
+                        surface.blit(cursor, (0, 0))
+                    states[selected, disabled] = surface
+
+            self.surfaces.append(states)
+            x, y = self.game.scaled_point((self.x, self.y + i * self.option_offset))
+            self.rects.append(pygame.Rect(x + cursor_x, y, width, height))
+
+    def draw_background(self) -> None:
+        """Draw the static part of the screen on the display, overridden per menu."""
+        self.game.display.fill(self.game.BLACK)
+
+    def draw_option(self, index: int) -> pygame.Rect:
+        rect = self.rects[index]
+        option = self.options[index]
+
+        self.game.display.blit(self.background, rect, rect)
+        self.game.display.blit(self.surfaces[index][index == self.index, option.disabled], rect)
+        return rect
+
+    def redraw(self) -> None:
+        self.game.repaint = False
+        self.draw_background()
+        self.background = self.game.display.copy()
+
+        for index in range(len(self.options)):
+            self.draw_option(index)
+        self.blit_screen()
+
+    def update_options(self, *indexes: int) -> None:
+        self.game.blit_screen([self.draw_option(index) for index in indexes])
+
+    def run_menu(self) -> None:
+        if not self.run_display:
+            return
+
+        self.redraw()
         while self.run_display:
-            self.game.check_events()
-            self.check_input()
-
-            self.game.display.fill(self.game.WHITE)
-            self.game.display.blit(self.game.get_background('main.png'), (0, 0))
-
-            image = pygame.image.load(get_asset_path('Other', 'main_controls.png'))
-            original_width, original_height = image.get_size()
-
-            # Scaling percentage (e.g., 50% = 0.5)
-            scale_percentage = 0.25
-            new_width = int(original_width * scale_percentage)
-            new_height = int(original_height * scale_percentage)
+            self.game.check_events(idle=True)
 
-            # Scale the image
-            scaled_image = pygame.transform.scale(image, (new_width, new_height))
+            previous = self.index
+            self.check_input()
 
-            # Blit the scaled image to the display
-            self.game.display.blit(
-                scaled_image,
-                (self.game.DISPLAY_W - 290, 50)
-            )
+            if self.game.repaint and self.run_display:
+                # the window was exposed or the ESC message drawn over it
+                self.redraw()
+            elif self.index != previous:
+                self.update_options(previous, self.index)
+            else:
+                # nothing of the menu changed, presents just the F3 overlay when it's up
+                self.game.blit_screen([])
 
-            self.game.draw_text('MAIN CONTROLS', 15, self.game.DISPLAY_W - 230, 10, color=self.game.BLACK)
+    def move_cursor(self) -> None:
+        if self.game.UP_KEY:
+            self.index = (self.index - 1) % len(self.options)
+        elif self.game.DOWN_KEY:
+            self.index = (self.index + 1) % len(self.options)
 
-            self.game.draw_text('Start', 20, self.playx, self.playy, color=self.game.BLACK)
-            self.game.draw_text('Scoreboard', 20, self.scoreboardx, self.scoreboardy, color=self.game.BLACK)
-            self.game.draw_text('Quit', 20, self.quitx, self.quity, color=self.game.BLACK)
+    def check_input(self) -> None:
+        self.move_cursor()
 
-            self.draw_cursor()
-            self.blit_screen()
 
-    def move_cursor(self) -> None:
-        if self.game.DOWN_KEY:
-            if self.state == "Start":
-                self.cursor_rect.midtop = (self.scoreboardx + self.offset, self.scoreboardy)
-                self.state = "Scoreboard"
+class MainMenu(OptionMenu):
+    def __init__(self, game) -> None:
+        OptionMenu.__init__(
+            self,
+            game,
+            [
+                MenuOption('Start', 'Start', game.BLACK),
+                MenuOption('Scoreboard', 'Scoreboard', game.BLACK),
+                MenuOption('Quit', 'Quit', game.BLACK),
+            ],
+            100,
+            game.DISPLAY_H / 2 - 50,
+            game.BLACK
+        )
+
+    @scene
+    def display_menu(self) -> None:
+        self.run_display = True
+        self.run_menu()
 
-            elif self.state == "Scoreboard":
-                self.cursor_rect.midtop = (self.quitx + self.offset, self.quity)
-                self.state = "Quit"
+    def draw_background(self) -> None:
+        self.game.display.fill(self.game.WHITE)
+        self.game.display.blit(self.game.get_background('main.png'), (0, 0))
 
-            else:
-                self.cursor_rect.midtop = (self.playx + self.offset, self.playy)
-                self.state = "Start"
-        elif self.game.UP_KEY:
-            if self.state == "Start":
-                self.cursor_rect.midtop = (self.quitx + self.offset, self.quity)
-                self.state = "Quit"
+        # Scaled to a quarter (of the layout size)
+        scaled_image = self.game.surfaces.load('main_controls.png', factor=0.25 * self.game.scale)
 
-            elif self.state == "Quit":
-                self.cursor_rect.midtop = (self.scoreboardx + self.offset, self.scoreboardy)
-                self.state = "Scoreboard"
+        # Blit the scaled image to the display
+        self.game.display.blit(
+            scaled_image,
+            self.game.scaled_point((self.game.DISPLAY_W - 290, 50))
+        )
 
-            else:
-                self.cursor_rect.midtop = (self.playx + self.offset, self.playy)
-                self.state = "Start"
+        self.game.draw_text('MAIN CONTROLS', 15, self.game.DISPLAY_W - 230, 10, color=self.game.BLACK)
 
     def check_input(self) -> None:
         self.move_cursor()
@@ -114,53 +190,29 @@ class MainMenu(Menu):
             self.run_display = False
 
 
-class DifficultyMenu(Menu):
+class DifficultyMenu(OptionMenu):
     def __init__(self, game) -> None:
-        Menu.__init__(self, game)
-        self.state = 'easy'
+        OptionMenu.__init__(
+            self,
+            game,
+            [
+                MenuOption('easy', 'easy', game.GREEN),
+                MenuOption('medium', 'medium', game.ORANGE),
+                MenuOption('hard', 'hard', game.RED),
+            ],
+            game.DISPLAY_W / 2 - 50,
+            game.DISPLAY_H / 2 - 30,
+            game.WHITE
+        )
         self.run_display = False
 
-        self.easyx, self.easyy = self.mid_w - 50, self.mid_h - 30
-        self.mediumx, self.mediumy = self.mid_w - 50, self.easyy + self.option_offset
-        self.hardx, self.hardy = self.mid_w - 50, self.mediumy + self.option_offset
-        self.cursor_rect.midtop = (self.easyx + self.offset, self.easyy)
-
+    @scene
     def display_menu(self) -> None:
-        while self.run_display:
-            self.game.check_events()
-            self.check_input()
+        self.run_menu()
 
-            self.game.display.fill(self.game.BLACK)
-
-            self.game.draw_text('DIFFICULTY', 30, self.game.DISPLAY_W / 2, self.game.DISPLAY_H / 2 - 100, position='center', color=self.game.WHITE)
-            self.game.draw_text('easy', 20, self.easyx, self.easyy, color=self.game.GREEN)
-            self.game.draw_text('medium', 20, self.mediumx, self.mediumy, color=self.game.ORANGE)
-            self.game.draw_text('hard', 20, self.hardx, self.hardy, color=self.game.RED)
-
-            self.draw_cursor(color=self.game.WHITE)
-            self.blit_screen()
-
-    def move_cursor(self) -> None:
-        if self.game.UP_KEY:
-            if self.state == "easy":
-                self.state = 'hard'
-                self.cursor_rect.midtop = (self.hardx + self.offset, self.hardy)
-            elif self.state == "hard":
-                self.state = "medium"
-                self.cursor_rect.midtop = (self.mediumx + self.offset, self.mediumy)
-            else:
-                self.state = "easy"
-                self.cursor_rect.midtop = (self.easyx + self.offset, self.easyy)
-        elif self.game.DOWN_KEY:
-            if self.state == "easy":
-                self.state = "medium"
-                self.cursor_rect.midtop = (self.mediumx + self.offset, self.mediumy)
-            elif self.state == "medium":
-                self.state = 'hard'
-                self.cursor_rect.midtop = (self.hardx + self.offset, self.hardy)
-            else:
-                self.state = "easy"
-                self.cursor_rect.midtop = (self.easyx + self.offset, self.easyy)
+    def draw_background(self) -> None:
+        self.game.display.fill(self.game.BLACK)
+        self.game.draw_text('DIFFICULTY', 30, self.game.DISPLAY_W / 2, self.game.DISPLAY_H / 2 - 100, position='center', color=self.game.WHITE)
 
     def check_input(self) -> None:
         self.move_cursor()
@@ -175,87 +227,45 @@ class DifficultyMenu(Menu):
             self.game.main_menu.run_display = True
 
 
-class MiniGameMenu(Menu):
+class MiniGameMenu(OptionMenu):
     def __init__(self, game) -> None:
-        Menu.__init__(self, game)
-        self.encrypter_color = None
-        self.math_champ_color = None
-        self.binarize_color = None
-        self.hangman_color = None
-        self.rps_color = None
-        self.state = 'rps'
-
-        self.rpsx, self.rpsy = self.mid_w - 100, self.mid_h - 150
-        self.hangmanx, self.hangmany = self.rpsx, self.rpsy + self.option_offset
-        self.binarizex, self.binarizey = self.rpsx, self.hangmany + self.option_offset
-        self.encrypterx, self.encryptery = self.rpsx, self.binarizey + self.option_offset
-        self.math_champx, self.math_champy = self.rpsx, self.encryptery + self.option_offset
-
-        self.cursor_rect.midtop = (self.rpsx + self.offset, self.rpsy)
-
+        OptionMenu.__init__(
+            self,
+            game,
+            [
+                MenuOption(spec.id, spec.label, game.WHITE)
+                for spec in (get_spec(game_id) for game_id in game.enabled_games)
+            ],
+            game.DISPLAY_W / 2 - 100,
+            game.DISPLAY_H / 2 - 150,
+            game.WHITE
+        )
+
+    @scene
     def display_menu(self) -> None:
-        self.run_display = True
-        while self.run_display:
-            self.game.check_events()
-            self.check_input()
-
-            self.game.display.fill(self.game.BLACK)
-            self.rps_color = self.game.WHITE if 'rps' not in self.game.played_games else self.game.RED
-            self.hangman_color = self.game.WHITE if 'hangman' not in self.game.played_games else self.game.RED
-            self.binarize_color = self.game.WHITE if 'binarize' not in self.game.played_games else self.game.RED
-            self.encrypter_color = self.game.WHITE if 'encrypter' not in self.game.played_games else self.game.RED
-            self.math_champ_color = self.game.WHITE if 'math_champ' not in self.game.played_games else self.game.RED
+        # played games stay selectable but are shown (and refused) as disabled
+        for option in self.options:
+            option.disabled = option.value in self.game.played_games
 
-            self.game.draw_text('SELECT MINI GAME', 30, self.mid_w, self.mid_h - 250, position='center', color=self.game.RED)
-            self.game.draw_text('Rock Paper Scissors', 20, self.rpsx, self.rpsy, color=self.rps_color)
-            self.game.draw_text('Hangman', 20, self.hangmanx, self.hangmany, color=self.hangman_color)
-            self.game.draw_text('Binarize', 20, self.binarizex, self.binarizey, color=self.binarize_color)
-            self.game.draw_text('Encrypter', 20, self.encrypterx, self.encryptery, color=self.encrypter_color)
-            self.game.draw_text('Math Champ', 20, self.math_champx, self.math_champy, color=self.math_champ_color)
+        self.run_display = True
+        self.prefetch()
+        self.run_menu()
 
-            self.draw_cursor(color=self.game.WHITE)
-            self.blit_screen()
+    def prefetch(self) -> None:
+        """Let the prefetcher know which game the cursor rests on."""
+        if self.game.prefetcher is None:
+            return
+        option = self.options[self.index]
+        self.game.prefetcher.hover(None if option.disabled else option.value)
 
-    def move_cursor(self) -> None:
-        if self.game.UP_KEY:
-            if self.state == 'rps':
-                self.state = 'math_champ'
-                self.cursor_rect.midtop = (self.math_champx + self.offset, self.math_champy)
-            elif self.state == 'binarize':
-                self.state = 'hangman'
-                self.cursor_rect.midtop = (self.hangmanx + self.offset, self.hangmany)
-            elif self.state == 'hangman':
-                self.state = "rps"
-                self.cursor_rect.midtop = (self.rpsx + self.offset, self.rpsy)
-            elif self.state == 'encrypter':
-                self.state = "binarize"
-                self.cursor_rect.midtop = (self.binarizex + self.offset, self.binarizey)
-            elif self.state == 'math_champ':
-                self.state = "encrypter"
-                self.cursor_rect.midtop = (self.encrypterx + self.offset, self.encryptery)
-            else:
-                self.state = "rps"
-                self.cursor_rect.midtop = (self.rpsx + self.offset, self.rpsy)
-        elif self.game.DOWN_KEY:
-            if self.state == "rps":
-                self.state = "hangman"
-                self.cursor_rect.midtop = (self.hangmanx + self.offset, self.hangmany)
-            elif self.state == 'hangman':
-                self.state = 'binarize'
-                self.cursor_rect.midtop = (self.binarizex + self.offset, self.binarizey)
-            elif self.state == 'binarize':
-                self.state = 'encrypter'
-                self.cursor_rect.midtop = (self.encrypterx + self.offset, self.encryptery)
-            elif self.state == 'encrypter':
-                self.state = 'math_champ'
-                self.cursor_rect.midtop = (self.math_champx + self.offset, self.math_champy)
-            else:
-                self.state = "rps"
-                self.cursor_rect.midtop = (self.rpsx + self.offset, self.rpsy)
+    def draw_background(self) -> None:
+        self.game.display.fill(self.game.BLACK)
+        self.game.draw_text('SELECT MINI GAME', 30, self.mid_w, self.mid_h - 250, position='center', color=self.game.RED)
 
     def check_input(self) -> None:
         self.move_cursor()
+        self.prefetch()
 
-        if self.game.START_KEY and self.state not in self.game.played_games:
+        if self.game.START_KEY and not self.options[self.index].disabled:
             self.run_display = False
             self.game.game_mode = self.state
@@ -0,0 +1,148 @@
+"""
+Speculative prefetch from the mini game menu.
+
+When the cursor rests on a mini game for HOVER_DELAY, a worker thread builds
+its controller (importing the module and loading its images) and prepares
+its first round, while the menu sits idle waiting for input. Fonts are not
+thread-safe, so once the worker is done a timer on the main thread warms
+them and splits the rules text (MainGame.warm). Selecting the game then
+takes the finished controller instead of building one, waiting for the
+worker if it's still busy with it.
+
+Moving the cursor away cancels the pending timer and the work for the old
+option: a running job stops after its current step and a finished one gives
+its surfaces back. Every launch is recorded with whether it was prefetched
+and how long the player waited between the menu and the rules screen.
+"""
+
+import queue
+import threading
+
+from Classes.registry import get_spec
+
+
+class PrefetchJob:
+    __slots__ = ('game_id', 'cancelled', 'done', 'controller', 'warmed')
+
+    def __init__(self, game_id: str) -> None:
+        self.game_id = game_id
+        self.cancelled = threading.Event()
+        self.done = threading.Event()
+        self.controller = None
+        self.warmed = False
+
+
+class Prefetcher:
+    HOVER_DELAY = 0.25
+    # how often the main thread looks for a finished job to warm
+    POLL_INTERVAL = 0.02
+
+    def __init__(self, game) -> None:
+        self.game = game
+        self.hovered = None
+        self.timer = None
+        self.poll = None
+        self.jobs = {}
+        self.lock = threading.Lock()
+        self.queue = queue.Queue()
+        self.thread = None
+
+        self.cancelled = 0
+        # the game take() found a controller for
+        self.taken = None
+        # (game id, prefetched, seconds from selection to the rules screen)
+        self.launches = []
+
+    def hover(self, game_id: str | None) -> None:
+        """The cursor is on game_id (None for nothing worth prefetching)."""
+        if game_id == self.hovered:
+            return
+
+        self.cancel(keep=game_id)
+        self.hovered = game_id
+        if game_id is not None and game_id not in self.jobs and get_spec(game_id) is not None:
+            self.timer = self.game.timers.after(self.HOVER_DELAY, self.start)
+
+    def start(self) -> None:
+        job = PrefetchJob(self.hovered)
+        self.jobs[job.game_id] = job
+        self.queue.put(job)
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name='prefetch', daemon=True)
+            self.thread.start()
+        self.poll = self.game.timers.every(self.POLL_INTERVAL, lambda: self.finish(job))
+
+    def finish(self, job: PrefetchJob) -> None:
+        """Main thread: warm the controller once the worker built it."""
+        if not job.done.is_set():
+            return
+
+        self.game.timers.cancel(self.poll)
+        self.poll = None
+        self.warm(job)
+
+    def warm(self, job: PrefetchJob) -> None:
+        if job.controller is not None and not job.warmed:
+            job.controller.warm(job.game_id)
+            job.warmed = True
+
+    def cancel(self, keep: str | None = None) -> None:
+        """Cancel the timer and the work for every option but keep."""
+        self.game.timers.cancel(self.timer)
+        self.game.timers.cancel(self.poll)
+        self.timer = self.poll = None
+        self.hovered = None
+
+        for game_id in [game_id for game_id in self.jobs if game_id != keep]:
+            job = self.jobs.pop(game_id)
+            self.cancelled += 1
+            with self.lock:
+                job.cancelled.set()
+                controller, job.controller = job.controller, None
+            if controller is not None:
+                controller.release()
+
+    def take(self, game_id: str):
+        """The controller prefetched for the selected game, None when there is none."""
+        self.cancel(keep=game_id)
+        job = self.jobs.pop(game_id, None)
+        if job is None:
+            return None
+
+        job.done.wait()
+        if job.controller is not None:
+            self.warm(job)
+            self.taken = game_id
+        return job.controller
+
+    def run(self) -> None:
+        while True:
+            job = self.queue.get()
+            try:
+                if not job.cancelled.is_set():
+                    self.build(job)
+            except Exception as e:
+                print(f'prefetch {job.game_id}: {e}')
+            finally:
+                job.done.set()
+
+    def build(self, job: PrefetchJob) -> None:
+        controller = self.game.build_controller(get_spec(job.game_id))
+        if not job.cancelled.is_set():
+            controller.prepare(job.game_id)
+
+        with self.lock:
+            if not job.cancelled.is_set():
+                job.controller = controller
+                return
+        controller.release()
+
+    def launched(self, game_id: str, seconds: float) -> None:
+        self.launches.append((game_id, self.taken == game_id, seconds))
+        self.taken = None
+
+    def rows(self):
+        for prefetched in (True, False):
+            times = [seconds for _, hit, seconds in self.launches if hit == prefetched]
+            if times:
+                yield prefetched, len(times), sum(times) / len(times), max(times)
@@ -0,0 +1,138 @@
+"""
+Per-scene cProfile capture.
+
+SceneProfiler follows the scenes the game enters (Game.enter_scene and
+exit_scene call it) and keeps one cProfile.Profile per profiled scene. Only
+one profile runs at a time: entering a profiled scene inside another one
+pauses the outer profile until the inner scene exits, entering a scene that
+isn't profiled leaves the outer one running, so profiling Game.game_loop
+alone covers everything it calls.
+
+A scene is named like the scene decorator does ('HangmanGame.play'), or by
+its class ('HangmanGame') or method ('pre_story'). With a frame limit a
+scene stops being profiled after that many frames, and once every named
+scene got its frames the game exits. Every profile is written to
+`<directory>/<scene>.pstats` and a summary of the top cumulative functions
+is printed at exit.
+"""
+
+import atexit
+import cProfile
+import os
+import pstats
+import sys
+
+
+def matches(scene: str, names: list[str]) -> bool:
+    return any(scene == name or scene.startswith(name + '.') or scene.endswith('.' + name) for name in names)
+
+
+class SceneProfiler:
+    def __init__(self, directory: str = 'profiles', scenes: list[str] | None = None, frames: int | None = None,
+                 top: int = 10) -> None:
+        self.directory = directory
+        self.names = scenes or []
+        self.frames = frames
+        self.top = top
+
+        self.profiles = {}
+        self.counts = {}
+        self.done = set()
+        # (scene, profile or None) for every scene entered and not left yet
+        self.stack = []
+        self.finished = False
+        atexit.register(self.finish)
+
+    def wanted(self, scene: str) -> bool:
+        return (not self.names or matches(scene, self.names)) and scene not in self.done
+
+    def running(self) -> tuple[str, cProfile.Profile] | tuple[None, None]:
+        """The innermost profiled scene, its profile is the one enabled."""
+        for scene, profile in reversed(self.stack):
+            if profile is not None:
+                return scene, profile
+        return None, None
+
+    def enter(self, scene: str) -> None:
+        if not self.wanted(scene):
+            self.stack.append((scene, None))
+            return
+
+        _, outer = self.running()
+        if outer is not None:
+            outer.disable()
+
+        profile = self.profiles.setdefault(scene, cProfile.Profile())
+        self.counts.setdefault(scene, 0)
+        self.stack.append((scene, profile))
+        profile.enable()
+
+    def exit(self, scene: str) -> None:
+        if not self.stack:
+            return
+
+        _, profile = self.stack.pop()
+        if profile is not None:
+            profile.disable()
+            _, outer = self.running()
+            if outer is not None:
+                outer.enable()
+
+    def __call__(self, game) -> None:
+        """Frame listener, counts the frames of the running profile."""
+        scene, profile = self.running()
+        if profile is None:
+            return
+
+        self.counts[scene] += 1
+        if self.frames and self.counts[scene] >= self.frames:
+            self.stop(scene)
+            if self.names and all(any(matches(done, [name]) for done in self.done) for name in self.names):
+                # every named scene has its frames
+                sys.exit()
+
+    def stop(self, scene: str) -> None:
+        """Stop profiling scene, also when it's entered again."""
+        self.done.add(scene)
+        for index, (entered, profile) in enumerate(self.stack):
+            if entered == scene and profile is not None:
+                profile.disable()
+                self.stack[index] = (entered, None)
+
+        _, outer = self.running()
+        if outer is not None:
+            outer.enable()
+
+    def finish(self) -> None:
+        """Write the profiles and print the summary, once."""
+        if self.finished:
+            return
+        self.finished = True
+
+        for _, profile in self.stack:
+            if profile is not None:
+                profile.disable()
+        if not self.profiles:
+            print('profile: no profiled scene was entered')
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        for scene, profile in self.profiles.items():
+            path = os.path.join(self.directory, f'{scene}.pstats')
+            try:
+                stats = pstats.Stats(profile)
+            except TypeError:
+                # entered, but no call was recorded
+                continue
+
+            stats.dump_stats(path)
+            self.print_summary(scene, stats, path)
+
+    def print_summary(self, scene: str, stats: pstats.Stats, path: str) -> None:
+        print(f'\n{scene}: {self.counts.get(scene, 0)} frames, {stats.total_tt:.3f} s  -> {path}')
+        print(f'{"calls":>10} {"total s":>9} {"cumul s":>9}  function')
+
+        rows = sorted(stats.stats.items(), key=lambda item: -item[1][3])
+        for (filename, line, name), (_, calls, total, cumulative, _) in rows[:self.top]:
+            where = f'{os.path.basename(filename)}:{line}' if line else filename
+            print(f'{calls:>10} {total:>9.3f} {cumulative:>9.3f}  {name} ({where})')
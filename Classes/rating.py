@@ -1,17 +1,45 @@
 import pygame
 import csv
-from functions import get_asset_path
+import threading
+from Classes.compaction import compact
+from functions import get_asset_path, scene
+
+# posted by the leaderboard thread, wakes an idle rating screen to redraw
+LEADERBOARD_UPDATED = pygame.event.custom_type()
 
 
 class Rating:
-    def __init__(self, game):
+    # compact the scoreboard in the background once it grows past this
+    COMPACT_BYTES = 4 * 1024 * 1024
+    KEEP_TOP = 100
+    KEEP_RECENT = 1000
+
+    def __init__(self, game, path: str | None = None):
         pygame.init()
         self.game = game
         self.run_display = False
-
+        self.path = path or get_asset_path('Other', 'scoreboard.csv')
+        self.leaderboard = None
+        # appends and the end of a compaction don't overlap
+        self.lock = threading.Lock()
+        self.compaction = None
+
+    def use_leaderboard(self, client) -> None:
+        """Show and submit to a shared leaderboard, the local csv stays the fallback."""
+        self.leaderboard = client
+        client.on_update = self.refresh
+
+    def refresh(self) -> None:
+        # called from the leaderboard thread when new top scores came in
+        if self.run_display and pygame.display.get_init():
+            pygame.event.post(pygame.event.Event(LEADERBOARD_UPDATED))
+
+    @scene
     def display_rating(self):
         while self.run_display:
-            self.game.check_events()
+            if not self.game.check_events(idle=True):
+                continue
+
             self.check_input()
 
             self.game.display.fill(self.game.WHITE)
@@ -48,7 +76,8 @@ class Rating:
                     15,
                     self.game.DISPLAY_W / 2,
                     (self.game.DISPLAY_H / 2) + y,
-                    position='center'
+                    position='center',
+                    layer=1
                 )
 
                 index += 1
@@ -56,12 +85,20 @@ class Rating:
             self.blit_screen()
 
     def blit_screen(self):
-        self.game.window.blit(self.game.display, (0, 0))
-        pygame.display.update()
-        self.game.reset_keys()
+        self.game.blit_screen()
 
     def get_scores(self):
-        with open(get_asset_path('Other', 'scoreboard.csv'), mode='r') as file:
+        # the shared scores once they were fetched, never waits for them
+        top = self.leaderboard.top() if self.leaderboard else None
+        if top:
+            try:
+                return [[entry['name'], str(entry['score']), str(entry['time']), entry['difficulty']]
+                        for entry in top[:11]]
+            except (KeyError, TypeError):
+                # not a score list, show the local scores
+                pass
+
+        with open(self.path, mode='r') as file:
             next(file)
             data = list(csv.reader(file))
         return sorted(data, key=lambda line: int(line[1]), reverse=True)[:11]
@@ -72,6 +109,24 @@ class Rating:
             self.run_display = False
 
     def save_rating(self, name, time, difficulty, score):
-        with open(get_asset_path('Other', 'scoreboard.csv'), mode='a', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow([name, score, time, difficulty])
+        with self.lock:
+            with open(self.path, mode='a', newline='') as file:
+                writer = csv.writer(file)
+                writer.writerow([name, score, time, difficulty])
+                size = file.tell()
+
+        if size > self.COMPACT_BYTES:
+            self.compact_in_background()
+
+        if self.leaderboard:
+            self.leaderboard.submit(name, score, time, difficulty)
+
+    def compact_in_background(self) -> threading.Thread:
+        """Move all but the best and the newest rows to the archive, while the game goes on."""
+        if self.compaction is None or not self.compaction.is_alive():
+            self.compaction = threading.Thread(
+                target=compact, args=(self.path, self.KEEP_TOP, self.KEEP_RECENT), kwargs={'lock': self.lock},
+                name='compaction', daemon=True
+            )
+            self.compaction.start()
+        return self.compaction
@@ -0,0 +1,131 @@
+"""
+Registry of the mini games.
+
+Every mini game declares itself here with a MiniGameSpec. The spec is all
+the menus and rule screens need, the module holding the controller class
+is only imported (and its assets only loaded) once the game gets selected.
+"""
+
+from dataclasses import dataclass, field
+import importlib
+
+
+@dataclass(frozen=True)
+class MiniGameSpec:
+    id: str
+    title: str
+    label: str
+    rules: str
+    module: str
+    class_name: str
+    # per difficulty settings, e.g. {'easy': {'total_attempts': 3}}
+    difficulty: dict = field(default_factory=dict)
+    # (asset type, file name) pairs loaded the first time the game is selected
+    assets: tuple = ()
+
+    def get_setting(self, difficulty: str, name: str):
+        return self.difficulty.get(difficulty, {}).get(name)
+
+    def load_class(self):
+        return getattr(importlib.import_module(self.module), self.class_name)
+
+
+MINI_GAMES = {}
+
+
+def register(spec: MiniGameSpec) -> MiniGameSpec:
+    MINI_GAMES[spec.id] = spec
+    return spec
+
+
+def get_spec(game_id: str | bool) -> MiniGameSpec | None:
+    return MINI_GAMES.get(game_id)
+
+
+register(MiniGameSpec(
+    id='rps',
+    title='Rock Paper Scissor',
+    label='Rock Paper Scissors',
+    rules=(
+        "In Rock, Paper, Scissors, two players"
+        " each choose one of three options: "
+        "Rock, Paper, or Scissors. Rock beats"
+        " Scissors, Scissors beats Paper, and "
+        "Paper beats Rock. If both players choose"
+        " the same option, the round is a tie. "
+        "The game is usually played in multiple"
+        " rounds, and the player with the most wins "
+        "is the overall winner."
+    ),
+    module='Classes.rps',
+    class_name='RPSGame',
+    difficulty={
+        'easy': {'total_attempts': 3},
+        'medium': {'total_attempts': 2},
+        'hard': {'total_attempts': 1}
+    },
+    assets=tuple(
+        ('Other', f'{prefix}{hand}.png')
+        for prefix in ('', 'l_')
+        for hand in ('rock', 'paper', 'scissors')
+    )
+))
+
+register(MiniGameSpec(
+    id='hangman',
+    title='Hangman',
+    label='Hangman',
+    rules=(
+        "In Hangman, one player chooses a word,"
+        " and the others guess letters to reveal it. "
+        "Correct guesses fill in blanks, while"
+        " wrong guesses bring the hangman closer to completion. "
+        "The goal: guess the word before the drawing is finished!"
+    ),
+    module='Classes.hangman',
+    class_name='HangmanGame'
+))
+
+register(MiniGameSpec(
+    id='binarize',
+    title='Binarize',
+    label='Binarize',
+    rules=(
+        "In Binarize, players convert decimal numbers"
+        " into binary. The goal: accurately transform "
+        "random decimal numbers into their binary"
+        " equivalents and test your binary conversion skills!"
+    ),
+    module='Classes.binarize',
+    class_name='BinaryConversionGame'
+))
+
+register(MiniGameSpec(
+    id='encrypter',
+    title='Encrypter',
+    label='Encrypter',
+    rules=(
+        "In Encrypter, players decode a message"
+        " using a given encryption method, with clues like "
+        '"only HEXES will save you, B=2." Alternatively,'
+        ' players encode messages following specific rules. '
+        "The goal: master cryptography through decoding"
+        " and encoding challenges!"
+    ),
+    module='Classes.encrypter',
+    class_name='WordDecryptionGame'
+))
+
+register(MiniGameSpec(
+    id='math_champ',
+    title='Math Champ',
+    label='Math Champ',
+    rules=(
+        "In Math Champ, players solve equations"
+        " like A + A = 4 or B + A = 7 by deducing the values of "
+        "the variables. The goal: use logic and "
+        "problem-solving skills to figure out the correct values!"
+    ),
+    module='Classes.math_champ',
+    class_name='MathChampGame'
+))
@@ -0,0 +1,112 @@
+"""
+Per-frame render queue.
+
+Screens queue blits and primitive draws instead of drawing them one by one,
+each with a layer. Game.blit_screen flushes the queue onto the display:
+items are drawn by layer (in queue order within a layer) and every run of
+blits goes to SDL as one Surface.blits call. Anything drawn straight onto
+the display still works, it just ends up below the queued items.
+
+The queue counts queued items, SDL calls and flush time per frame:
+Game.frame_done calls end_frame(), after that `last` holds the numbers of
+that frame.
+"""
+
+import time
+from dataclasses import dataclass
+
+import pygame
+
+BLIT, DRAW = 0, 1
+
+
+@dataclass(slots=True)
+class QueueStats:
+    items: int = 0
+    calls: int = 0
+    flush_time: float = 0.0
+
+
+class RenderQueue:
+    def __init__(self) -> None:
+        self.items = []
+        self.stats = QueueStats()
+        self.last = QueueStats()
+
+    def blit(self, surface: pygame.Surface, dest, area=None, layer: int = 0, special_flags: int = 0) -> None:
+        self.items.append((layer, len(self.items), BLIT, (surface, dest, area, special_flags)))
+
+    def blits(self, sequence, layer: int = 0) -> None:
+        """(surface, dest[, area[, special_flags]]) items, like Surface.blits."""
+        for item in sequence:
+            self.items.append((layer, len(self.items), BLIT, item))
+
+    def draw(self, func, *args, layer: int = 0) -> None:
+        """A primitive drawn as func(target, *args), e.g. pygame.draw.line, returning its rect."""
+        self.items.append((layer, len(self.items), DRAW, (func, args)))
+
+    def line(self, color, start, end, width: int = 1, layer: int = 0) -> None:
+        self.draw(pygame.draw.line, color, start, end, width, layer=layer)
+
+    def rect(self, color, rect, width: int = 0, layer: int = 0) -> None:
+        self.draw(pygame.draw.rect, color, rect, width, layer=layer)
+
+    def fill(self, color, rect=None, layer: int = 0) -> None:
+        self.draw(pygame.Surface.fill, color, rect, layer=layer)
+
+    def flush(self, target: pygame.Surface) -> None:
+        """Draw everything queued onto target."""
+        if not self.items:
+            return
+
+        start = time.perf_counter()
+        self.items.sort(key=lambda item: (item[0], item[1]))
+
+        batch = []
+        for _, _, kind, item in self.items:
+            if kind == BLIT:
+                batch.append(item)
+                continue
+
+            if batch:
+                target.blits(batch, doreturn=False)
+                self.stats.calls += 1
+                batch = []
+            func, args = item
+            func(target, *args)
+            self.stats.calls += 1
+
+        if batch:
+            target.blits(batch, doreturn=False)
+            self.stats.calls += 1
+
+        self.stats.items += len(self.items)
+        self.items.clear()
+        self.stats.flush_time += time.perf_counter() - start
+
+    def end_frame(self) -> None:
+        self.last, self.stats = self.stats, QueueStats()
+
+
+class RenderStats:
+    """Render queue numbers per scene, a frame listener."""
+
+    def __init__(self) -> None:
+        self.scenes = {}
+
+    def __call__(self, game) -> None:
+        frame = game.render.last
+        if not frame.items:
+            return
+
+        # drawn frames, items, SDL calls, flush seconds, slowest flush
+        stats = self.scenes.setdefault(game.scene, [0, 0, 0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += frame.items
+        stats[2] += frame.calls
+        stats[3] += frame.flush_time
+        stats[4] = max(stats[4], frame.flush_time)
+
+    def rows(self):
+        for scene, (frames, items, calls, total, peak) in sorted(self.scenes.items(), key=lambda item: -item[1][3]):
+            yield scene, frames, items / frames, calls / frames, total / frames, peak
@@ -0,0 +1,327 @@
+from functions import scene
+from Classes.mini_game import MainGame
+import random
+import pygame
+
+RPS_OPTIONS = ('rock', 'paper', 'scissors')
+
+
+class RPSGame(MainGame):
+    def __init__(self, game) -> None:
+        MainGame.__init__(self, game)
+        self.is_winner = False
+        self.user_selected = False
+        self.state = 'paper'
+        self.random_option = False
+
+        # a round goes choose -> animation -> result -> choose, the last two on timers
+        self.phase = 'choose'
+        self.timer = None
+        self.animation_time = 0.5
+        self.result_time = 2
+
+        self.result_text = {
+            None: ('Tie', self.game.WHITE),
+            True: ('You Win', self.game.GREEN),
+            False: ('You Lose', self.game.RED)
+        }
+
+        # small right options
+        sm_w, sm_h, gap = 150, 150, 175
+
+        self.s_rock = Hand(
+            game,
+            'rock',
+            sm_w,
+            sm_h,
+            (self.game.DISPLAY_W - sm_w) // 2 - gap,
+            (self.game.DISPLAY_H - sm_w) // 2
+        )
+
+        self.s_paper = Hand(
+            game,
+            'paper',
+            sm_w,
+            sm_h,
+            (self.game.DISPLAY_W - sm_w) // 2,
+            (self.game.DISPLAY_H - sm_w) // 2
+        )
+
+        self.s_scissors = Hand(
+            game,
+            'scissors',
+            sm_w,
+            sm_h,
+            (self.game.DISPLAY_W - sm_w) // 2 + gap,
+            (self.game.DISPLAY_H - sm_w) // 2
+        )
+
+        # large right options
+        lg_w, lg_h = 500, 500
+
+        self.r_rock = Hand(
+            game,
+            'rock',
+            lg_w,
+            lg_h,
+            self.game.DISPLAY_W - 400,
+            self.mid_h // 2
+        )
+
+        self.r_paper = Hand(
+            game,
+            'paper',
+            lg_w,
+            lg_h,
+            self.game.DISPLAY_W - 450,
+            self.mid_h // 2
+        )
+
+        self.r_scissors = Hand(
+            game,
+            'scissors',
+            lg_w,
+            lg_h,
+            self.game.DISPLAY_W - 450,
+            self.mid_h // 2
+        )
+
+        # large left options
+        self.l_rock = Hand(
+            game,
+            'rock',
+            lg_w, lg_h, -100,
+            self.mid_h // 2,
+            True
+        )
+
+        self.l_paper = Hand(
+            game,
+            'paper',
+            lg_w,
+            lg_h,
+            -50,
+            self.mid_h // 2,
+            True
+        )
+
+        self.l_scissors = Hand(
+            game,
+            'scissors',
+            lg_w,
+            lg_h,
+            -50,
+            self.mid_h // 2,
+            True
+        )
+
+        self.options = {
+            'paper': self.s_paper,
+            'rock': self.s_rock,
+            'scissors': self.s_scissors,
+            'r_paper': self.r_paper,
+            'r_rock': self.r_rock,
+            'r_scissors': self.r_scissors,
+            'l_paper': self.l_paper,
+            'l_rock': self.l_rock,
+            'l_scissors': self.l_scissors
+        }
+
+    @scene
+    def play(self) -> None:
+        self.run_display = True
+        self.phase = 'choose'
+        while self.run_display:
+            self.user_selected = False
+
+            # only the animation moves by itself, the other phases wait for input or a timer
+            if not self.game.check_events(idle=self.phase != 'animation'):
+                continue
+
+            if not self.run_display:
+                break
+
+            self.game.display.fill(self.game.BLACK)
+
+            if self.phase == 'animation':
+                self.display_animation()
+            elif self.phase == 'result':
+                self.display_result()
+            else:
+                self.random_option = random.choice(RPS_OPTIONS)
+                self.display_menu()
+                self.display_score()
+
+                if self.user_selected:
+                    self.attempt += 1
+                    self.did_user_win()
+                    self.start_animation()
+
+            self.blit_screen()
+
+    def start_animation(self) -> None:
+        self.phase = 'animation'
+        self.timer = self.game.timers.after(self.animation_time, self.show_result)
+
+    def show_result(self) -> None:
+        self.phase = 'result'
+        self.reset_hands()
+        self.timer = self.game.timers.after(self.result_time, self.end_round)
+        self.game.redraw = True
+
+    def end_round(self) -> None:
+        self.phase = 'choose'
+        self.timer = None
+        if self.attempt == self.total_attempts or self.is_winner:
+            self.run_display = False
+        self.game.redraw = True
+
+    def did_user_win(self) -> None:
+        if self.state == self.random_option:
+            self.is_winner = None
+            self.tie += 1
+        elif (self.state == 'rock' and self.random_option == 'scissors') or \
+                (self.state == 'paper' and self.random_option == 'rock') or \
+                (self.state == 'scissors' and self.random_option == 'paper'):
+            self.is_winner = True
+            self.correct += 1
+        else:
+            self.is_winner = False
+            self.incorrect += 1
+
+    def display_menu(self) -> None:
+        self.check_input()
+        self.draw_options()
+
+    def display_result(self) -> None:
+        # display right and left large hand selected by user and game
+        self.options[f'r_{self.state}'].draw()
+        self.options[f'l_{self.random_option}'].draw()
+
+        # Display result text
+        text, color = self.result_text[self.is_winner]
+
+        self.game.draw_text(
+            text,
+            30,
+            self.mid_w,
+            self.mid_h,
+            position='center',
+            color=color
+        )
+
+    def display_score(self) -> None:
+        self.game.draw_text(
+            self.incorrect,
+            50,
+            15,
+            10,
+            color=self.game.RED
+        )
+
+        self.game.draw_text(
+            self.correct,
+            50,
+            self.game.DISPLAY_W - 15,
+            10,
+            color=self.game.GREEN,
+            position='topright'
+        )
+
+        self.game.draw_text(
+            self.tie,
+            50,
+            self.game.DISPLAY_W // 2, 40,
+            color=self.game.ORANGE,
+            position='center'
+        )
+
+    def display_animation(self) -> None:
+        # two up and down cycles over the animation timer
+        cycles = 2
+        cycle_height = self.game.scaled(250)
+        cycle_phase = (self.game.timers.progress(self.timer) * cycles % 1) * 2
+
+        # Calculate vertical offset based on cycle phase
+        if cycle_phase <= 1:
+            offset = int(cycle_height * cycle_phase)  # Moving up
+        else:
+            offset = int(cycle_height * (2 - cycle_phase))  # Moving down
+
+        # Apply the offset to the rock positions
+        self.reset_hands()
+        self.l_rock.rect.y -= offset
+        self.r_rock.rect.y -= offset
+
+        self.display_large_hands()
+
+    def reset_hands(self) -> None:
+        self.l_rock.rect.y = self.game.scaled(self.l_rock.y)
+        self.r_rock.rect.y = self.game.scaled(self.r_rock.y)
+
+    def draw_options(self) -> None:
+        option = self.options[self.state]
+
+        pygame.draw.rect(
+            self.game.display,
+            option.border_color,
+            option.rect,
+            self.game.scaled_width(option.border_width)
+        )
+
+        self.s_rock.draw()
+        self.s_paper.draw()
+        self.s_scissors.draw()
+
+        self.display_large_hands()
+
+    def move_cursor(self) -> None:
+        # get index of user selected option of (rock, paper, scissors)
+        current_index = RPS_OPTIONS.index(self.state)
+
+        # check if user clicks left or to the right
+        # set current selected option
+        if self.game.LEFT_KEY:
+            self.state = RPS_OPTIONS[(current_index - 1) % len(RPS_OPTIONS)]
+        elif self.game.RIGHT_KEY:
+            self.state = RPS_OPTIONS[(current_index + 1) % len(RPS_OPTIONS)]
+
+    def check_input(self) -> None:
+        self.move_cursor()
+        if self.game.START_KEY:
+            self.user_selected = self.state
+
+    def release(self) -> None:
+        for hand in self.options.values():
+            hand.release()
+
+    def display_large_hands(self) -> None:
+        self.r_rock.draw()
+        self.l_rock.draw()
+
+
+class Hand:
+    __slots__ = ('game', 'type', 'left_handed', 'w', 'h', 'x', 'y', 'name', 'rect', 'img', 'border_color', 'border_width')
+
+    def __init__(self, game, hand_type, w, h, x, y, left_handed=False) -> None:
+        if hand_type not in RPS_OPTIONS:
+            raise ValueError('Hand type is not valid!')
+
+        self.game = game
+        self.type = hand_type
+        self.left_handed = left_handed
+        self.w, self.h, self.x, self.y = w, h, x, y
+        self.name = (f'l_{self.type}' if self.left_handed else f'{self.type}') + '.png'
+
+        # w, h, x, y are layout coordinates, img and rect are in render pixels,
+        # the image is shared with every hand of the same picture and size
+        self.rect = self.game.scaled_rect((self.x, self.y, self.w, self.h))
+        self.img = self.game.surfaces.acquire(self.name, size=self.rect.size)
+        self.border_color = self.game.RED
+        self.border_width = 5
+
+    def release(self) -> None:
+        self.game.surfaces.release(self.name, size=self.img.get_size())
+
+    def draw(self) -> None:
+        self.game.display.blit(self.img, self.rect)
@@ -0,0 +1,99 @@
+"""
+asyncio runner and frame pacing stats.
+
+The scenes stay ordinary loops. With a runner attached the end of every
+frame (Game.frame_done) hands control to an asyncio event loop until the
+frame's deadline, and idle screens wait for input inside the event loop too.
+Tasks started with spawn() or run_io(), like score saves, run in those gaps
+instead of stalling a frame.
+"""
+
+import asyncio
+import statistics
+import time
+
+import pygame
+
+
+class AsyncRunner:
+    # how often an idle screen looks for input while the event loop runs
+    POLL_INTERVAL = 0.005
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.tasks = set()
+        self.deadline = None
+
+    def spawn(self, coro) -> asyncio.Task:
+        task = self.loop.create_task(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+    def run_io(self, func, *args) -> asyncio.Task:
+        """Run a blocking call on a worker thread, its result is on the returned task."""
+        return self.spawn(asyncio.to_thread(func, *args))
+
+    async def next_frame(self, fps: int) -> None:
+        now = time.perf_counter()
+        if not fps:
+            self.deadline = None
+            await asyncio.sleep(0)
+            return
+
+        # keep to the frame grid, but don't try to catch up after a long frame
+        frame = 1 / fps
+        if self.deadline is None or now - self.deadline > frame:
+            self.deadline = now
+        self.deadline += frame
+        await asyncio.sleep(self.deadline - now)
+
+    def tick(self, fps: int) -> None:
+        self.loop.run_until_complete(self.next_frame(fps))
+
+    async def next_event(self, timeout: int) -> pygame.event.Event:
+        end = time.perf_counter() + timeout / 1000
+        while True:
+            event = pygame.event.poll()
+            if event.type != pygame.NOEVENT or time.perf_counter() >= end:
+                return event
+            await asyncio.sleep(self.POLL_INTERVAL)
+
+    def wait_event(self, timeout: int) -> pygame.event.Event:
+        """pygame.event.wait(timeout) that lets the event loop run meanwhile."""
+        return self.loop.run_until_complete(self.next_event(timeout))
+
+    def close(self) -> None:
+        """Let the running tasks finish and close the loop."""
+        if self.loop.is_closed():
+            return
+        if self.tasks:
+            self.loop.run_until_complete(asyncio.gather(*self.tasks, return_exceptions=True))
+        self.loop.close()
+
+
+class FramePacing:
+    """Frame listener that measures how close the frames are to the target rate."""
+
+    def __init__(self) -> None:
+        self.intervals = []
+        self.last = None
+
+    def __call__(self, game) -> None:
+        now = time.perf_counter()
+        if self.last is not None:
+            self.intervals.append(now - self.last)
+        self.last = now
+
+    def summary(self, fps: int) -> dict:
+        target = 1 / fps
+        errors = [abs(interval - target) for interval in self.intervals]
+        return {
+            'frames': len(self.intervals),
+            'mean_ms': statistics.mean(self.intervals) * 1000,
+            'error_mean_ms': statistics.mean(errors) * 1000,
+            'error_p95_ms': statistics.quantiles(errors, n=20)[-1] * 1000,
+            'error_max_ms': max(errors) * 1000,
+            # a frame taking more than one and a half slots dropped one
+            'dropped': sum(interval > target * 1.5 for interval in self.intervals),
+        }
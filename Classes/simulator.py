@@ -0,0 +1,233 @@
+"""
+Headless session simulator.
+
+Plays whole sessions without drawing anything: every mini game is decided by
+the real controller rules (RPSGame.did_user_win, HangmanGame.guess, the quiz
+generators), letters are handed out and the score is calculated exactly as in
+Game. Player skill and the time a player takes are modelled, everything else
+is the game's own code.
+
+Sessions are split in chunks and spread over a process pool, every worker
+builds one headless Game on start-up and reuses its controllers.
+"""
+
+import os
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from multiprocessing import Pool
+
+from functions import award_letters, calculate_score, letter_bit
+from Classes.dictionary import DIFFICULTIES
+from Classes.rps import RPS_OPTIONS
+
+BUCKET_SIZE = 250
+CHUNK_SIZE = 2000
+
+# seconds an average player spends per game, rules screen included
+GAME_SECONDS = {
+    'rps': 20,
+    'hangman': 60,
+    'binarize': 30,
+    'encrypter': 45,
+    'math_champ': 35
+}
+# name, story and typing the password
+SESSION_SECONDS = 90
+
+LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+
+# the game owned by this worker process
+_game = None
+
+
+@dataclass
+class ChunkResult:
+    difficulty: str
+    sessions: int = 0
+    wins: int = 0
+    passwords: int = 0
+    cpu_time: float = 0.0
+    buckets: Counter = field(default_factory=Counter)
+
+    def add(self, other: 'ChunkResult') -> None:
+        self.sessions += other.sessions
+        self.wins += other.wins
+        self.passwords += other.passwords
+        self.cpu_time += other.cpu_time
+        self.buckets.update(other.buckets)
+
+
+def _init_worker() -> None:
+    global _game
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+    from Classes.game import Game
+    # no music and no menus in a worker, so no audio decode or prefetch thread either
+    _game = Game(audio=False, prefetch=False)
+
+
+def play_rps(controller, skill: float, rng: random.Random) -> None:
+    # nobody is good at rock paper scissors, skill doesn't help here
+    while controller.attempt < controller.total_attempts and not controller.is_winner:
+        controller.state = rng.choice(RPS_OPTIONS)
+        controller.random_option = rng.choice(RPS_OPTIONS)
+        controller.attempt += 1
+        controller.did_user_win()
+
+
+def play_hangman(controller, skill: float, rng: random.Random) -> None:
+    controller.new_round(controller.get_random_word(controller.game.difficulty))
+    controller.run_display = True
+
+    while controller.run_display:
+        if rng.random() < skill:
+            # a letter of the word that is still hidden
+            char = rng.choice([char for char in controller.word if not controller.guessed_mask & letter_bit(char)])
+        else:
+            char = rng.choice(LETTERS)
+        controller.guess(char)
+        controller.did_user_win()
+
+
+def play_quiz(controller, skill: float, rng: random.Random) -> None:
+    controller.new_question()
+    controller.a, controller.b, controller.c, controller.d = False, False, False, False
+
+    answer = controller.correct_key if rng.random() < skill else rng.choice('ABCD')
+    setattr(controller, answer.lower(), True)
+    controller.did_user_win()
+
+
+PLAYERS = {
+    'rps': play_rps,
+    'hangman': play_hangman
+}
+
+
+def play_session(game, difficulty: str, skill: float, rng: random.Random) -> tuple[int, int, bool]:
+    """Play one session, returns the score, the games won and if the password was guessed."""
+    game.difficulty = difficulty
+    pass_list = list(game.password)
+    games_left = game.total_games
+    wins = 0
+    seconds = SESSION_SECONDS * rng.uniform(0.7, 1.3)
+
+    games = list(game.enabled_games)
+    rng.shuffle(games)
+    for game_mode in games:
+        game.game_mode = game_mode
+        controller = game.get_game_controller(game_mode)
+        # the rules are never shown, so they aren't laid out either
+        controller.configure()
+        controller.is_winner = False
+
+        PLAYERS.get(game_mode, play_quiz)(controller, skill, rng)
+        seconds += GAME_SECONDS.get(game_mode, 30) * rng.uniform(1.5 - skill, 2 - skill)
+
+        if controller.is_winner:
+            wins += 1
+            award_letters(pass_list, games_left, rng)
+            games_left -= 1
+
+    # the more letters are known, the easier the password
+    revealed = 1 - len(pass_list) / len(game.password)
+    password_correct = rng.random() < revealed * (0.5 + skill / 2)
+
+    return calculate_score(wins, int(seconds), difficulty, password_correct), wins, password_correct
+
+
+def run_chunk(task: tuple[str, int, int]) -> ChunkResult:
+    difficulty, sessions, seed = task
+    rng = random.Random(seed)
+    # the game code itself draws from the global generator
+    random.seed(seed)
+
+    result = ChunkResult(difficulty)
+    start = time.process_time()
+    for _ in range(sessions):
+        skill = rng.betavariate(2, 2)
+        score, wins, password_correct = play_session(_game, difficulty, skill, rng)
+
+        result.sessions += 1
+        result.wins += wins
+        result.passwords += password_correct
+        result.buckets[score // BUCKET_SIZE * BUCKET_SIZE] += 1
+
+    result.cpu_time = time.process_time() - start
+    return result
+
+
+def make_tasks(sessions: int, seed: int) -> list[tuple[str, int, int]]:
+    tasks = []
+    for index, difficulty in enumerate(DIFFICULTIES):
+        remaining = sessions // len(DIFFICULTIES) + (index < sessions % len(DIFFICULTIES))
+        chunk = 0
+        while remaining > 0:
+            size = min(CHUNK_SIZE, remaining)
+            tasks.append((difficulty, size, seed * 1000003 + index * 10007 + chunk))
+            remaining -= size
+            chunk += 1
+    return tasks
+
+
+def _warm_up(_) -> None:
+    run_chunk(('easy', 1, 0))
+
+
+def run(sessions: int, workers: int, seed: int = 0) -> tuple[dict[str, ChunkResult], float]:
+    """Simulate sessions spread evenly over the difficulties, returns the results and the wall time."""
+    results = {difficulty: ChunkResult(difficulty) for difficulty in DIFFICULTIES}
+    tasks = make_tasks(sessions, seed)
+
+    with Pool(workers, initializer=_init_worker) as pool:
+        # start-up (pygame, fonts) is not part of the measurement
+        pool.map(_warm_up, range(workers))
+
+        start = time.perf_counter()
+        for result in pool.imap_unordered(run_chunk, tasks):
+            results[result.difficulty].add(result)
+        wall = time.perf_counter() - start
+
+        # SDL turns SIGTERM into a quit event, so let the workers finish instead of terminating them
+        pool.close()
+        pool.join()
+
+    return results, wall
+
+
+def report(results: dict[str, ChunkResult], wall: float, workers: int) -> None:
+    total = sum(result.sessions for result in results.values())
+    cpu = sum(result.cpu_time for result in results.values())
+
+    for difficulty, result in results.items():
+        if not result.sessions:
+            continue
+
+        print(f'\n{difficulty}: {result.sessions} sessions, '
+              f'{result.wins / result.sessions:.2f} games won, '
+              f'{result.passwords / result.sessions:.0%} passwords guessed')
+
+        # scores cluster around whole games won, empty buckets are left out
+        peak = max(result.buckets.values())
+        for bucket, count in sorted(result.buckets.items()):
+            bar = '#' * round(count / peak * 50)
+            print(f'  {bucket:>6}-{bucket + BUCKET_SIZE - 1:<6} {count / result.sessions:6.1%} {bar}')
+
+    print(f'\n{total} sessions in {wall:.2f} s with {workers} workers: '
+          f'{total / wall:,.0f} sessions/s, {total / cpu:,.0f} sessions/s per core')
+
+
+def scaling(sessions: int, max_workers: int, seed: int = 0) -> None:
+    """Run the same simulation with 1 to max_workers workers."""
+    print(f'{"workers":>8} {"sessions/s":>12} {"speedup":>8} {"efficiency":>11}')
+
+    base = None
+    for workers in range(1, max_workers + 1):
+        results, wall = run(sessions, workers, seed)
+        rate = sum(result.sessions for result in results.values()) / wall
+        base = base or rate
+        print(f'{workers:>8} {rate:>12,.0f} {rate / base:>7.2f}x {rate / base / workers:>10.0%}')
@@ -0,0 +1,162 @@
+"""
+Hangman solver, used for hints and for ranking words by how hard they are.
+
+Words are grouped by length. Per group every (position, letter) pair and
+every letter has a bitset over the words of the group, stored as a python
+int with bit i set for word i. Filtering the candidates for a pattern is a
+handful of big int ANDs and counting them is int.bit_count, no word is
+looked at.
+"""
+
+from functools import lru_cache
+
+from functions import letter_bit
+from Classes.dictionary import DIFFICULTIES, LETTER_FREQUENCY, get_dictionary
+
+LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+
+# ties between letters go to the more common one
+TIE_ORDER = {char: LETTER_FREQUENCY[char] for char in LETTERS}
+
+
+class WordGroup:
+    """Bitsets for the words of one length."""
+
+    def __init__(self, words: list[str]) -> None:
+        self.words = words
+        self.all = (1 << len(words)) - 1
+
+        length = len(words[0])
+        positions = [[bytearray((len(words) + 7) // 8) for _ in LETTERS] for _ in range(length)]
+        for index, word in enumerate(words):
+            byte, bit = index >> 3, 1 << (index & 7)
+            for position, char in enumerate(word):
+                positions[position][ord(char) - 97][byte] |= bit
+
+        # positions[i][letter]: words with that letter at position i
+        self.positions = [[int.from_bytes(bits, 'little') for bits in position] for position in positions]
+
+        # contains[letter]: words with that letter anywhere
+        self.contains = []
+        for letter in range(len(LETTERS)):
+            bits = 0
+            for position in self.positions:
+                bits |= position[letter]
+            self.contains.append(bits)
+
+
+class HangmanSolver:
+    def __init__(self, words) -> None:
+        by_length = {}
+        for word in words:
+            by_length.setdefault(len(word), []).append(word)
+        self.groups = {length: WordGroup(sorted(group)) for length, group in by_length.items()}
+
+    def candidates(self, pattern: str, used_mask: int) -> tuple[WordGroup | None, int]:
+        """
+        Bitset of the words that fit a pattern like 'sh_d_w' after the letters
+        in used_mask were guessed. A revealed letter shows up at every
+        position it has, a used letter that isn't shown isn't in the word.
+        """
+        group = self.groups.get(len(pattern))
+        if group is None:
+            return None, 0
+
+        candidates = group.all
+        revealed = 0
+        for position, char in enumerate(pattern):
+            if char != '_':
+                candidates &= group.positions[position][ord(char) - 97]
+                revealed |= letter_bit(char)
+
+        for letter, char in enumerate(LETTERS):
+            bit = 1 << letter
+            if revealed & bit:
+                # no more of a revealed letter hides behind the blanks
+                for position, shown in enumerate(pattern):
+                    if shown == '_':
+                        candidates &= ~group.positions[position][letter]
+            elif used_mask & bit:
+                candidates &= ~group.contains[letter]
+
+        return group, candidates
+
+    def best_letter(self, pattern: str, used_mask: int) -> str | None:
+        """
+        The unused letter in the most remaining candidates. It is the guess
+        least likely to cost a life, and a hit splits the candidates by
+        where the letter sits.
+        """
+        group, candidates = self.candidates(pattern, used_mask)
+        if not candidates:
+            return None
+
+        counts = {
+            char: (candidates & group.contains[letter]).bit_count()
+            for letter, char in enumerate(LETTERS)
+            if not used_mask & (1 << letter)
+        }
+        return pick_letter(counts)
+
+    def words(self, pattern: str, used_mask: int) -> list[str]:
+        group, candidates = self.candidates(pattern, used_mask)
+        found = []
+        while candidates:
+            low = candidates & -candidates
+            found.append(group.words[low.bit_length() - 1])
+            candidates ^= low
+        return found
+
+    def misses(self) -> dict[str, int]:
+        """
+        Wrong guesses the solver makes on every word, following best_letter.
+
+        Every word of a group starts in the same state, the guesses only
+        differ once a letter splits them, so the whole group is played as one
+        decision tree instead of word by word.
+        """
+        result = {}
+        for group in self.groups.values():
+            # (word indexes, used letters, misses so far)
+            stack = [(list(range(len(group.words))), 0, 0)]
+            while stack:
+                indexes, used_mask, misses = stack.pop()
+                if len(indexes) == 1:
+                    result[group.words[indexes[0]]] = misses
+                    continue
+
+                counts = dict.fromkeys((char for char in LETTERS if not used_mask & letter_bit(char)), 0)
+                for index in indexes:
+                    for char in set(group.words[index]):
+                        if char in counts:
+                            counts[char] += 1
+
+                char = pick_letter(counts)
+                if char is None:
+                    # only happens for duplicate words
+                    result.update((group.words[index], misses) for index in indexes)
+                    continue
+                used_mask |= letter_bit(char)
+
+                # split by where the letter sits, words without it cost a miss
+                branches = {}
+                for index in indexes:
+                    positions = tuple(i for i, other in enumerate(group.words[index]) if other == char)
+                    branches.setdefault(positions, []).append(index)
+
+                for positions, branch in branches.items():
+                    stack.append((branch, used_mask, misses + (not positions)))
+
+        return result
+
+
+def pick_letter(counts: dict[str, int]) -> str | None:
+    char = max(counts, key=lambda char: (counts[char], TIE_ORDER[char]), default=None)
+    return char if char and counts[char] else None
+
+
+@lru_cache(maxsize=None)
+def get_solver(name: str = 'hangman') -> HangmanSolver:
+    """Solver over every word of a dictionary, built once (hangman builds it before its first round)."""
+    dictionary = get_dictionary(name)
+    return HangmanSolver(word for difficulty in DIFFICULTIES for word in dictionary.words(difficulty))
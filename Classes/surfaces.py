@@ -0,0 +1,171 @@
+import hashlib
+import os
+import threading
+
+import pygame
+
+from functions import CACHE_DIR, asset_bytes, get_asset_path, get_image
+
+SURFACE_CACHE = os.path.join(CACHE_DIR, 'surfaces')
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    return surface.get_pitch() * surface.get_height()
+
+
+class SurfaceCache:
+    """
+    Decoded and scaled images on disk, as raw pixels.
+
+    An entry is named after the asset, the variant (its size or scale
+    factor), the pixel format and a hash of the source file, and holds the
+    pygame.image.tobytes() pixels. Loading one is a read and a frombuffer,
+    no PNG decode and no scale. A changed asset hashes differently, so its
+    old entries are never hit again, storing the new one deletes them.
+    Anything going wrong with the cache just means decoding as before.
+    """
+
+    def __init__(self, directory: str = SURFACE_CACHE) -> None:
+        self.directory = directory
+        self.digests = {}
+        self.hits = 0
+        self.misses = 0
+
+    def digest(self, path: str) -> str:
+        if path not in self.digests:
+            self.digests[path] = hashlib.blake2b(asset_bytes(path), digest_size=10).hexdigest()
+        return self.digests[path]
+
+    def prefix(self, asset_type: str, name: str, variant: str) -> str:
+        return f'{asset_type}_{name}.{variant}.'
+
+    def entry(self, asset_type: str, name: str, variant: str, pixel_format: str, size: tuple) -> str:
+        digest = self.digest(get_asset_path(asset_type, name))
+        width, height = size
+        filename = f'{self.prefix(asset_type, name, variant)}{width}x{height}.{pixel_format}.{digest}.raw'
+        return os.path.join(self.directory, filename)
+
+    def find(self, asset_type: str, name: str, variant: str) -> str | None:
+        """The entry for the asset as it is now, None when there's none."""
+        prefix = self.prefix(asset_type, name, variant)
+        try:
+            filenames = [filename for filename in os.listdir(self.directory) if filename.startswith(prefix)]
+        except OSError:
+            return None
+
+        digest = self.digest(get_asset_path(asset_type, name))
+        for filename in filenames:
+            if filename.endswith(f'.{digest}.raw'):
+                return os.path.join(self.directory, filename)
+        return None
+
+    def load(self, asset_type: str, name: str, variant: str) -> pygame.Surface | None:
+        path = self.find(asset_type, name, variant)
+        if path is None:
+            self.misses += 1
+            return None
+
+        size, pixel_format = os.path.basename(path)[len(self.prefix(asset_type, name, variant)):].split('.')[:2]
+        size = tuple(int(value) for value in size.split('x'))
+        try:
+            with open(path, 'rb') as file:
+                # a bytearray so the surface can be drawn on, frombuffer shares it
+                data = bytearray(os.fstat(file.fileno()).st_size)
+                complete = file.readinto(data) == len(data) == size[0] * size[1] * len(pixel_format)
+        except OSError:
+            complete = False
+
+        if not complete:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return pygame.image.frombuffer(data, size, pixel_format)
+
+    def store(self, asset_type: str, name: str, variant: str, surface: pygame.Surface) -> None:
+        pixel_format = 'RGBA' if surface.get_flags() & pygame.SRCALPHA else 'RGB'
+        path = self.entry(asset_type, name, variant, pixel_format, surface.get_size())
+        prefix = self.prefix(asset_type, name, variant)
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            temporary = f'{path}.{os.getpid()}.tmp'
+            with open(temporary, 'wb') as file:
+                file.write(pygame.image.tobytes(surface, pixel_format))
+            os.replace(temporary, path)
+
+            # entries of an older version of the asset
+            for filename in os.listdir(self.directory):
+                if filename.startswith(prefix) and filename.endswith('.raw') and filename != os.path.basename(path):
+                    os.remove(os.path.join(self.directory, filename))
+        except OSError:
+            pass
+
+
+class SurfaceStore:
+    """
+    Decoded and scaled images, shared by everyone that uses them.
+
+    acquire() hands out a surface and counts the reference, release() gives it
+    back and the surface is dropped when nobody holds it anymore. A scaled
+    variant is built from the original, which is given back straight away, so
+    an original only stays in memory while someone holds it explicitly.
+    """
+
+    def __init__(self, cache: SurfaceCache | None = None) -> None:
+        self.surfaces = {}
+        self.refs = {}
+        self.cache = cache
+        # the prefetch worker acquires and releases too
+        self.lock = threading.RLock()
+
+    def load(self, name: str, asset_type: str = 'Other', size: tuple | None = None,
+             factor: float | None = None) -> pygame.Surface:
+        """
+        The image, scaled to size or by factor, from the disk cache when it's there.
+
+        Not shared and not counted, for screens that draw an image once.
+        """
+        if size is not None:
+            variant = 'x'.join(str(value) for value in size)
+        elif factor is not None:
+            variant = f'f{factor:g}'
+        else:
+            variant = 'original'
+
+        surface = self.cache.load(asset_type, name, variant) if self.cache else None
+        if surface is not None:
+            return surface
+
+        key = (asset_type, name, None)
+        surface = self.surfaces[key] if key in self.surfaces else get_image(name, asset_type)
+        if factor is not None:
+            size = (int(surface.get_width() * factor), int(surface.get_height() * factor))
+        if size is not None:
+            surface = pygame.transform.scale(surface, size)
+
+        if self.cache:
+            self.cache.store(asset_type, name, variant, surface)
+        return surface
+
+    def acquire(self, name: str, asset_type: str = 'Other', size: tuple | None = None) -> pygame.Surface:
+        key = (asset_type, name, tuple(size) if size else None)
+        with self.lock:
+            if key not in self.surfaces:
+                self.surfaces[key] = self.load(name, asset_type, tuple(size) if size else None)
+                self.refs[key] = 0
+
+            self.refs[key] += 1
+            return self.surfaces[key]
+
+    def release(self, name: str, asset_type: str = 'Other', size: tuple | None = None) -> None:
+        key = (asset_type, name, tuple(size) if size else None)
+        with self.lock:
+            self.refs[key] -= 1
+            if not self.refs[key]:
+                del self.surfaces[key], self.refs[key]
+
+    def __len__(self) -> int:
+        return len(self.surfaces)
+
+    def nbytes(self) -> int:
+        return sum(surface_bytes(surface) for surface in list(self.surfaces.values()))
@@ -0,0 +1,172 @@
+"""
+Session telemetry.
+
+Events are put in an in-memory ring buffer and a background thread writes
+them to an append-only log in batches, so a frame never waits on the disk.
+When the buffer is full the oldest events are dropped and counted.
+
+Two formats:
+    ndjson  one compact JSON object per line
+    binary  magic, then per event: uint32 payload size, float64 time,
+            uint16 event code, uint32 session, compact JSON fields
+
+The log is rotated by size: log -> log.1 -> log.2 ... up to `backups` files.
+"""
+
+import atexit
+import json
+import os
+import struct
+import threading
+import time
+from collections import deque
+
+EVENTS = (
+    'dropped',
+    'session_start',
+    'session_end',
+    'scene_enter',
+    'scene_exit',
+    'game_start',
+    'game_end',
+    'letters',
+    'password',
+)
+EVENT_CODES = {name: code for code, name in enumerate(EVENTS)}
+
+MAGIC = b'TLMLOG1\n'
+RECORD = struct.Struct('<IdHI')
+FORMATS = ('ndjson', 'binary')
+
+
+class Telemetry:
+    def __init__(self, path: str, fmt: str = 'ndjson', max_bytes: int = 1024 * 1024, backups: int = 5,
+                 capacity: int = 4096, flush_interval: float = 1.0) -> None:
+        if fmt not in FORMATS:
+            raise ValueError(f'Unknown telemetry format: {fmt}')
+
+        self.path = path
+        self.fmt = fmt
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+
+        self.buffer = deque(maxlen=capacity)
+        self.dropped = 0
+        self.session = 0
+        self.scenes = []
+
+        self.file = None
+        self.wake = threading.Event()
+        self.closing = False
+        self.thread = threading.Thread(target=self.run, name='telemetry', daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    # frame side, never touches the file
+
+    def record(self, event: str, **fields) -> None:
+        if len(self.buffer) == self.capacity:
+            self.dropped += 1
+        self.buffer.append((time.time(), EVENT_CODES[event], self.session, fields))
+
+        if len(self.buffer) >= self.capacity // 2:
+            self.wake.set()
+
+    def start_session(self, **fields) -> None:
+        self.session += 1
+        self.record('session_start', **fields)
+
+    def scene_enter(self, scene: str) -> None:
+        self.scenes.append(time.perf_counter())
+        self.record('scene_enter', scene=scene)
+
+    def scene_exit(self, scene: str) -> None:
+        started = self.scenes.pop() if self.scenes else time.perf_counter()
+        self.record('scene_exit', scene=scene, duration=round(time.perf_counter() - started, 4))
+
+    # writer side
+
+    def run(self) -> None:
+        while not self.closing:
+            self.wake.wait(self.flush_interval)
+            self.wake.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        batch = []
+        while self.buffer:
+            batch.append(self.buffer.popleft())
+
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            batch.append((time.time(), EVENT_CODES['dropped'], self.session, {'count': dropped}))
+
+        if batch:
+            self.write(b''.join(self.encode(record) for record in batch))
+
+    def encode(self, record: tuple) -> bytes:
+        timestamp, code, session, fields = record
+        if self.fmt == 'binary':
+            payload = json.dumps(fields, separators=(',', ':')).encode('utf-8')
+            return RECORD.pack(len(payload), timestamp, code, session) + payload
+
+        line = {'t': round(timestamp, 4), 'event': EVENTS[code], 'session': session, **fields}
+        return json.dumps(line, separators=(',', ':')).encode('utf-8') + b'\n'
+
+    def write(self, data: bytes) -> None:
+        if self.file is not None and self.file.tell() + len(data) > self.max_bytes:
+            self.rotate()
+
+        if self.file is None:
+            self.file = open(self.path, mode='ab')
+            if self.fmt == 'binary' and self.file.tell() == 0:
+                self.file.write(MAGIC)
+
+        self.file.write(data)
+        self.file.flush()
+
+    def rotate(self) -> None:
+        self.file.close()
+        self.file = None
+
+        for index in range(self.backups - 1, 0, -1):
+            if os.path.exists(f'{self.path}.{index}'):
+                os.replace(f'{self.path}.{index}', f'{self.path}.{index + 1}')
+        if self.backups:
+            os.replace(self.path, f'{self.path}.1')
+        else:
+            os.remove(self.path)
+
+    def close(self) -> None:
+        if self.closing:
+            return
+
+        self.closing = True
+        self.wake.set()
+        self.thread.join()
+
+        self.flush()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def read_log(path: str):
+    """Yield the events of a log file (either format) as dicts like the ndjson lines."""
+    with open(path, mode='rb') as file:
+        data = file.read()
+
+    if not data.startswith(MAGIC):
+        for line in data.splitlines():
+            yield json.loads(line)
+        return
+
+    position = len(MAGIC)
+    while position < len(data):
+        size, timestamp, code, session = RECORD.unpack_from(data, position)
+        position += RECORD.size
+        fields = json.loads(data[position:position + size])
+        position += size
+        yield {'t': round(timestamp, 4), 'event': EVENTS[code], 'session': session, **fields}
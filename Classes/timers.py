@@ -0,0 +1,120 @@
+import heapq
+import itertools
+import time
+
+
+class Timer:
+    __slots__ = ('callback', 'delay', 'interval', 'due', 'remaining', 'version', 'active')
+
+    def __init__(self, callback, delay: float, interval: float | None) -> None:
+        self.callback = callback
+        self.delay = delay
+        self.interval = interval
+        self.due = 0.0
+        self.remaining = None
+        self.version = 0
+        self.active = False
+
+
+class TimerService:
+    """
+    One-shot and repeating timers, fired from the frame loop by update().
+
+    Timers sit in a heap by due time, so a frame only looks at the timers that
+    expired. Cancelling or pausing a timer bumps its version instead of
+    searching the heap, the old entry is skipped when it comes up.
+
+    pause() and resume() work on one timer, or without one on the whole
+    service: its clock stops and every timer keeps the time it had left.
+    """
+
+    def __init__(self, clock=time.perf_counter) -> None:
+        self.clock = clock
+        self.heap = []
+        self.order = itertools.count()
+        self.paused_at = None
+        self.paused_time = 0.0
+
+    def now(self) -> float:
+        if self.paused_at is not None:
+            return self.paused_at - self.paused_time
+        return self.clock() - self.paused_time
+
+    def after(self, delay: float, callback) -> Timer:
+        """Call callback once, delay seconds from now."""
+        return self.schedule(Timer(callback, delay, None), delay)
+
+    def every(self, interval: float, callback) -> Timer:
+        """Call callback every interval seconds until the timer is cancelled."""
+        return self.schedule(Timer(callback, interval, interval), interval)
+
+    def schedule(self, timer: Timer, delay: float) -> Timer:
+        timer.due = self.now() + delay
+        timer.version += 1
+        timer.active = True
+        timer.remaining = None
+        heapq.heappush(self.heap, (timer.due, next(self.order), timer.version, timer))
+        return timer
+
+    def cancel(self, timer: Timer | None) -> None:
+        if timer is not None:
+            timer.version += 1
+            timer.active = False
+            timer.remaining = None
+
+    def pause(self, timer: Timer | None = None) -> None:
+        if timer is None:
+            if self.paused_at is None:
+                self.paused_at = self.clock()
+        elif timer.active:
+            remaining = max(0.0, timer.due - self.now())
+            self.cancel(timer)
+            timer.remaining = remaining
+
+    def resume(self, timer: Timer | None = None) -> None:
+        if timer is None:
+            if self.paused_at is not None:
+                self.paused_time += self.clock() - self.paused_at
+                self.paused_at = None
+        elif timer.remaining is not None:
+            self.schedule(timer, timer.remaining)
+
+    def progress(self, timer: Timer) -> float:
+        """How far the timer is into its current period, 0 to 1."""
+        if not timer.active:
+            return 1.0
+        period = timer.interval or timer.delay
+        return min(1.0, max(0.0, 1 - (timer.due - self.now()) / period)) if period else 1.0
+
+    def next_delay(self) -> float | None:
+        """Seconds until the next timer fires, None when nothing is scheduled."""
+        if self.paused_at is not None:
+            return None
+
+        while self.heap and self.heap[0][2] != self.heap[0][3].version:
+            heapq.heappop(self.heap)
+        return max(0.0, self.heap[0][0] - self.now()) if self.heap else None
+
+    def update(self) -> int:
+        """Fire the expired timers, returns how many fired."""
+        if self.paused_at is not None:
+            return 0
+
+        now = self.now()
+        fired = 0
+        while self.heap and self.heap[0][0] <= now:
+            due, _, version, timer = heapq.heappop(self.heap)
+            if version != timer.version:
+                continue
+
+            if timer.interval:
+                # a late frame doesn't make the timer fire several times in a row
+                next_due = due + timer.interval
+                timer.due = next_due if next_due > now else now + timer.interval
+                heapq.heappush(self.heap, (timer.due, next(self.order), timer.version, timer))
+            else:
+                timer.active = False
+
+            timer.callback()
+            fired += 1
+        return fired
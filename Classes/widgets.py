@@ -0,0 +1,200 @@
+"""
+Retained widgets for the text entry screens.
+
+A widget keeps its rendered surfaces and its geometry and only draws again
+after it changed: it paints its old area with the background and blits the
+new surface there, and returns the rects it touched. A Screen paints all of
+its widgets once (and again whenever Game.repaint is set), after that only
+the changed ones, and Game.blit_screen presents just those rects.
+"""
+
+from abc import ABC, abstractmethod
+
+import pygame
+
+
+class Widget(ABC):
+    def __init__(self, game, background=None) -> None:
+        self.game = game
+        self.background = background or game.BLACK
+        self.dirty = True
+
+    @abstractmethod
+    def draw(self, target: pygame.Surface, force: bool = False) -> list:
+        """Draw when changed (or forced), returns the rects that changed on target."""
+
+
+class Label(Widget):
+    def __init__(self, game, text: str, size: int, point: tuple, color, font: str | None = None,
+                 position: str = 'center', background=None) -> None:
+        super().__init__(game, background)
+        self.text = text
+        self.size = size
+        self.point = point
+        self.color = color
+        self.font = font or game.font
+        self.position = position
+
+        self.surface = None
+        self.rect = None
+        # where the last surface went, painted over before the next one
+        self.drawn = None
+
+    def set_text(self, text: str) -> None:
+        if text != self.text:
+            self.text = text
+            self.surface = None
+            self.dirty = True
+
+    def render(self) -> None:
+        self.surface = self.game.get_font(self.font, self.size).render(self.text, True, self.color)
+        self.rect = self.surface.get_rect()
+        setattr(self.rect, self.position, self.game.scaled_point(self.point))
+
+    def draw(self, target: pygame.Surface, force: bool = False) -> list:
+        if not (self.dirty or force):
+            return []
+        if self.surface is None:
+            self.render()
+
+        rects = [self.rect]
+        if self.drawn is not None and not force:
+            target.fill(self.background, self.drawn)
+            rects.append(self.drawn)
+
+        target.blit(self.surface, self.rect)
+        self.drawn = self.rect
+        self.dirty = False
+        return rects
+
+
+class Prompt(Label):
+    """The 'PRESS ENTER TO ...' call to action, like Game.proceed."""
+
+    def __init__(self, game, act: str = 'CONTINUE') -> None:
+        super().__init__(game, f'PRESS ENTER TO {act} >>', 20, (game.mid_w, game.HEIGHT - 200), game.RED,
+                         font=game.second_font)
+
+
+class Input(Widget):
+    """Letters typed into a widget, push() and pop() invalidate only what they change."""
+
+    chars: list
+
+    def __len__(self) -> int:
+        return len(self.chars)
+
+    @abstractmethod
+    def push(self, char: str) -> None:
+        """Add a typed letter."""
+
+    @abstractmethod
+    def pop(self) -> None:
+        """Remove the last letter."""
+
+    def type_keys(self) -> None:
+        for char in self.game.OTHER_KEY:
+            if char in self.game.alphabet:
+                self.push(char)
+
+
+class TextInput(Input):
+    """Free text on an underline, centered on point."""
+
+    def __init__(self, game, point: tuple, size: int = 25, line_length: int = 400, color=None,
+                 max_length: int | None = None) -> None:
+        super().__init__(game)
+        color = color or game.WHITE
+        x, y = point
+        self.chars = []
+        self.text = ''
+        self.max_length = max_length
+        self.label = Label(game, '', size, (x, y - 50), color)
+
+        self.color = color
+        self.line = (game.scaled_point((int(x - line_length / 2), int(y))),
+                     game.scaled_point((int(x + line_length / 2), int(y))))
+        self.line_width = game.scaled_width(2)
+
+    def push(self, char: str) -> None:
+        if self.max_length is None or len(self.chars) < self.max_length:
+            self.chars.append(char)
+            self.text += char
+            self.label.set_text(self.text)
+
+    def pop(self) -> None:
+        if self.chars:
+            self.chars.pop()
+            self.text = self.text[:-1]
+            self.label.set_text(self.text)
+
+    def draw(self, target: pygame.Surface, force: bool = False) -> list:
+        rects = []
+        if force:
+            rects.append(pygame.draw.line(target, self.color, *self.line, self.line_width))
+        return rects + self.label.draw(target, force)
+
+
+class SlotInput(Input):
+    """A fixed number of one-letter slots on lines, centered on the screen at height y."""
+
+    def __init__(self, game, length: int, y: int, size: int = 20, slot_length: int = 60, gap: int = 15,
+                 color=None) -> None:
+        super().__init__(game)
+        self.color = color or game.WHITE
+        self.chars = []
+        self.length = length
+
+        start_x = game.DISPLAY_W // 2 - (length * (slot_length + gap)) // 2
+        self.lines = []
+        self.slots = []
+        for i in range(length):
+            x = start_x + i * (slot_length + gap)
+            self.lines.append((game.scaled_point((x, y)), game.scaled_point((x + slot_length, y))))
+            self.slots.append(Label(game, '', size, (x + slot_length // 2, y - 50), self.color, position='midtop'))
+        self.line_width = game.scaled_width(3)
+
+    @property
+    def text(self) -> str:
+        return ''.join(self.chars)
+
+    def push(self, char: str) -> None:
+        if len(self.chars) < self.length:
+            self.slots[len(self.chars)].set_text(char)
+            self.chars.append(char)
+
+    def pop(self) -> None:
+        if self.chars:
+            self.chars.pop()
+            self.slots[len(self.chars)].set_text('')
+
+    def draw(self, target: pygame.Surface, force: bool = False) -> list:
+        rects = []
+        if force:
+            for start, end in self.lines:
+                rects.append(pygame.draw.line(target, self.color, start, end, self.line_width))
+        for slot in self.slots:
+            rects.extend(slot.draw(target, force))
+        return rects
+
+
+class Screen:
+    def __init__(self, game, widgets: list, background=None) -> None:
+        self.game = game
+        self.widgets = widgets
+        self.background = background or game.BLACK
+
+    def draw(self) -> list | None:
+        """Draw onto the display, returns the changed rects or None after a full repaint."""
+        display = self.game.display
+        if self.game.repaint:
+            self.game.repaint = False
+            display.fill(self.background)
+            for widget in self.widgets:
+                widget.draw(display, force=True)
+            return None
+
+        rects = []
+        for widget in self.widgets:
+            rects.extend(widget.draw(display))
+        return rects
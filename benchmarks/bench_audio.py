@@ -0,0 +1,74 @@
+"""
+Audio benchmark.
+
+Times what starting the story music costs on the main thread: the old way
+(reopening the mixer and streaming the mp3) and playing the PCM decoded in
+the background. Also reports how long the background decode takes with an
+empty and with a filled PCM cache on disk.
+
+    python benchmarks/bench_audio.py [rounds]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame  # noqa: E402
+
+from Classes.audio import AudioLibrary  # noqa: E402
+from functions import get_asset_path  # noqa: E402
+
+TRACK = 'horror.mp3'
+ARGS = (99, 90, 20, .1)
+
+
+def reopen_and_stream() -> None:
+    pygame.mixer.quit()
+    pygame.mixer.init()
+    pygame.mixer.music.load(get_asset_path('Sound', TRACK))
+    pygame.mixer.music.set_volume(ARGS[3])
+    pygame.mixer.music.play(*ARGS[:3])
+
+
+def main_thread(play, rounds: int) -> tuple[float, float]:
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        play()
+        times.append(time.perf_counter() - start)
+    return sum(times) / rounds, max(times)
+
+
+def bench(rounds: int) -> None:
+    pygame.init()
+    pygame.mixer.init()
+
+    with tempfile.TemporaryDirectory() as directory:
+        decodes = {}
+        for cache in ('empty', 'filled'):
+            library = AudioLibrary(directory=directory)
+            start = time.perf_counter()
+            library.preload(TRACK, ARGS[1])
+            library.wait()
+            decodes[cache] = time.perf_counter() - start
+
+        cases = {
+            'reopen mixer + stream (before)': reopen_and_stream,
+            'decoded PCM': lambda: library.play(TRACK, *ARGS),
+        }
+        for name, play in cases.items():
+            mean, peak = main_thread(play, rounds)
+            print(f'{name:<32} main thread {mean * 1000:7.2f} ms  max {peak * 1000:7.2f} ms')
+
+    print(f'background decode: {decodes["empty"] * 1000:.0f} ms with an empty PCM cache, '
+          f'{decodes["filled"] * 1000:.0f} ms with a filled one')
+
+
+if __name__ == '__main__':
+    bench(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,108 @@
+"""
+Cold-start benchmark, loose asset files against the asset pack.
+
+Every run is a new interpreter that starts the game and loads what the first
+minutes need: the menu background and controls, the fonts, the horror track
+and every mini game's images. When the page cache can be dropped (root on
+Linux) it's dropped before every run, so the files really come from disk,
+otherwise the numbers are for a warm cache. The pack is built first when it
+isn't there.
+
+    python benchmarks/bench_coldstart.py [runs]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+START = time.perf_counter()
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def count_loads(counts: dict) -> None:
+    """Count the asset loads, each is a file open when the assets are loose."""
+    import pygame
+
+    def counted(key, load):
+        def wrapper(source, *args):
+            counts[key if isinstance(source, str) else 'pack reads'] += 1
+            return load(source, *args)
+        return wrapper
+
+    pygame.image.load = counted('file opens', pygame.image.load)
+    pygame.font.Font = counted('file opens', pygame.font.Font)
+    pygame.mixer.music.load = counted('file opens', pygame.mixer.music.load)
+
+
+def child(packed: bool) -> None:
+    counts = {'file opens': 0, 'pack reads': 0}
+    count_loads(counts)
+
+    from functions import use_pack
+    from Classes.game import Game
+    from Classes.registry import MINI_GAMES
+
+    if packed:
+        use_pack()
+    imported = time.perf_counter()
+
+    game = Game()
+    started = time.perf_counter()
+
+    game.main_menu.draw_background()
+    game.get_font(game.second_font, 20)
+    game.play_music('horror.mp3', 99, 90, 20, volume=.1)
+    for game_id in MINI_GAMES:
+        game.get_game_controller(game_id)
+    loaded = time.perf_counter()
+
+    print(json.dumps({'import': imported - START, 'game': started - imported, 'assets': loaded - started,
+                      'total': loaded - START, **counts}))
+
+
+def drop_caches() -> bool:
+    try:
+        os.sync()
+        with open('/proc/sys/vm/drop_caches', 'w') as file:
+            file.write('3')
+        return True
+    except OSError:
+        return False
+
+
+def bench(runs: int) -> None:
+    from functions import ASSET_PACK, ASSETS_DIR
+    from Classes.assetpack import build_pack
+
+    if not os.path.exists(ASSET_PACK):
+        build_pack(ASSETS_DIR, ASSET_PACK)
+
+    results = {'loose': [], 'packed': []}
+    cold = True
+    for _ in range(runs):
+        for mode in results:
+            cold = drop_caches() and cold
+            output = subprocess.run([sys.executable, __file__, '--child', mode], capture_output=True, text=True,
+                                    check=True).stdout
+            results[mode].append(json.loads(output.strip().splitlines()[-1]))
+
+    print(f'{runs} runs each, page cache {"dropped" if cold else "warm (cannot drop it here)"}, medians:')
+    for mode, rows in results.items():
+        median = {key: statistics.median(row[key] for row in rows) for key in rows[0]}
+        print(f'{mode:<7} total {median["total"] * 1000:7.1f} ms  (import {median["import"] * 1000:6.1f}  '
+              f'Game() {median["game"] * 1000:6.1f}  assets {median["assets"] * 1000:6.1f})  '
+              f'file opens {median["file opens"]:.0f}  pack reads {median["pack reads"]:.0f}')
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        child(sys.argv[2] == 'packed')
+    else:
+        bench(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
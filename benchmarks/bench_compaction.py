@@ -0,0 +1,97 @@
+"""
+Scoreboard compaction benchmark.
+
+Writes a scoreboard with `rows` random rows, compacts it in the background
+while scores keep being saved, checks that no row went missing and times
+reading the scores before and after.
+
+    python benchmarks/bench_compaction.py [rows]
+"""
+
+import gzip
+import os
+import random
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from Classes.rating import Rating  # noqa: E402
+
+DIFFICULTIES = ('easy', 'medium', 'hard')
+# reading more rows than this with get_scores takes gigabytes
+READ_LIMIT = 2_000_000
+
+
+def write_scoreboard(path: str, rows: int, rng: random.Random) -> None:
+    with open(path, mode='w', newline='') as file:
+        file.write('name,score,time,difficulty\n')
+        for start in range(0, rows, 100_000):
+            file.write(''.join(
+                f'player{rng.randrange(100_000)},{rng.randrange(10_000)},{rng.randrange(30, 900)},'
+                f'{rng.choice(DIFFICULTIES)}\r\n'
+                for _ in range(min(100_000, rows - start))
+            ))
+
+
+def count_rows(path: str) -> int:
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, mode='rb') as file:
+        return sum(block.count(b'\n') for block in iter(lambda: file.read(1024 * 1024), b'')) - 1
+
+
+def timed_read(rating: Rating) -> str:
+    rows = count_rows(rating.path)
+    if rows > READ_LIMIT:
+        return f'skipped ({rows} rows)'
+    start = time.perf_counter()
+    rating.get_scores()
+    return f'{(time.perf_counter() - start) * 1000:.1f} ms ({rows} rows)'
+
+
+def bench(rows: int) -> None:
+    rng = random.Random(1)
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'scoreboard.csv')
+
+    start = time.perf_counter()
+    write_scoreboard(path, rows, rng)
+    size = os.path.getsize(path)
+    print(f'wrote {rows} rows, {size / 1024 ** 2:.0f} MB in {time.perf_counter() - start:.1f} s')
+
+    rating = Rating(None, path)
+    print(f'get_scores before: {timed_read(rating)}')
+
+    # keep saving scores while the compaction runs
+    started = time.perf_counter()
+    compaction = rating.compact_in_background()
+    saves, slowest = 0, 0.0
+    while compaction.is_alive():
+        start = time.perf_counter()
+        rating.save_rating(f'live{saves}', rng.randrange(60, 900), rng.choice(DIFFICULTIES), rng.randrange(10_000))
+        slowest = max(slowest, time.perf_counter() - start)
+        saves += 1
+        time.sleep(0.001)
+    compaction.join()
+    elapsed = time.perf_counter() - started
+
+    archive = os.path.join(directory, 'archive')
+    segments = [os.path.join(archive, name) for name in sorted(os.listdir(archive))]
+    kept = count_rows(path)
+    archived = sum(count_rows(segment) for segment in segments)
+    archive_size = sum(os.path.getsize(segment) for segment in segments)
+
+    print(f'compacted in {elapsed:.1f} s with {saves} saves meanwhile (slowest save {slowest * 1000:.1f} ms)')
+    print(f'kept {kept} rows ({os.path.getsize(path) / 1024:.0f} KB), archived {archived} rows '
+          f'in {len(segments)} segments ({archive_size / 1024 ** 2:.1f} MB)')
+    print(f'rows accounted for: {kept + archived} of {rows + saves} '
+          f'{"ok" if kept + archived == rows + saves else "MISMATCH"}')
+    print(f'get_scores after: {timed_read(rating)}')
+
+
+if __name__ == '__main__':
+    bench(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
@@ -0,0 +1,90 @@
+"""
+Hangman dictionary benchmark.
+
+For each size, builds a synthetic word list, compiles it, then measures in a
+fresh process (after imports) the time to open the dictionary and draw a word, the cost of a
+random draw, and the resident memory afterwards. A plain python list loaded
+from the text file is measured the same way for comparison.
+
+    python benchmarks/bench_dictionary.py 10000 100000 1000000
+"""
+
+import os
+import random
+import string
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from Classes.dictionary import HangmanDictionary  # noqa: E402
+
+SAMPLES = 100000
+
+PROBE = '''
+import os, random, sys, time
+sys.path.insert(0, {root!r})
+from Classes.dictionary import HangmanDictionary
+
+def rss_kb():
+    with open('/proc/self/statm') as file:
+        return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+
+base = rss_kb()
+start = time.perf_counter()
+if {mode!r} == 'dict':
+    dictionary = HangmanDictionary({path!r})
+    dictionary.random_word('medium')
+    draw = lambda: dictionary.random_word('medium')
+else:
+    with open({path!r}) as file:
+        words = [line.strip() for line in file]
+    random.choice(words)
+    draw = lambda: random.choice(words)
+load = time.perf_counter() - start
+
+start = time.perf_counter()
+for _ in range({samples}):
+    draw()
+sample = (time.perf_counter() - start) / {samples}
+print(load, sample, rss_kb() - base)
+'''
+
+
+def write_word_list(path: str, amount: int) -> None:
+    rng = random.Random(amount)
+    with open(path, mode='w') as file:
+        for _ in range(amount):
+            length = rng.randint(3, 16)
+            file.write(''.join(rng.choices(string.ascii_lowercase, k=length)) + '\n')
+
+
+def probe(mode: str, path: str) -> tuple[float, float, int]:
+    code = PROBE.format(root=ROOT, mode=mode, path=path, samples=SAMPLES)
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    load, sample, rss = output.split()[-3:]
+    return float(load), float(sample), int(rss)
+
+
+def bench(amount: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'words.txt')
+        target = os.path.join(tmp, 'words.dict')
+        write_word_list(source, amount)
+
+        start = time.perf_counter()
+        HangmanDictionary.build(source, target)
+        build = time.perf_counter() - start
+
+        for mode, path in (('text', source), ('dict', target)):
+            load, sample, rss = probe(mode, path)
+            print(f'{amount:>8} words  {mode}  build {build if mode == "dict" else 0:6.2f} s'
+                  f'  load {load * 1000:8.2f} ms  sample {sample * 1e6:5.2f} us  rss +{rss / 1024:7.1f} MiB')
+
+
+if __name__ == '__main__':
+    for size in [int(arg) for arg in sys.argv[1:]] or [10000, 100000, 1000000]:
+        bench(size)
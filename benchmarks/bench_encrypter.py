@@ -0,0 +1,54 @@
+"""
+Encrypter word index benchmark.
+
+Builds synthetic word lists, then times the lazy load and the per round
+challenge generation (word + encoding + distractors).
+
+    python benchmarks/bench_encrypter.py 10000 100000 500000
+"""
+
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Classes.cipher import HexCipher, WordIndex  # noqa: E402
+
+ROUNDS = 20000
+
+
+def write_word_list(path: str, amount: int) -> None:
+    rng = random.Random(amount)
+    with open(path, mode='w') as file:
+        for _ in range(amount):
+            length = rng.randint(2, 12)
+            file.write(''.join(rng.choices(string.ascii_uppercase, k=length)) + '\n')
+
+
+def bench(amount: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'words.txt')
+        write_word_list(path, amount)
+
+        index = WordIndex(path)
+        start = time.perf_counter()
+        index.load()
+        load_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(ROUNDS):
+            word = index.random_word(('easy', 'medium', 'hard')[i % 3])
+            HexCipher.encode(word)
+            index.distractors(word)
+        round_time = (time.perf_counter() - start) / ROUNDS
+
+    print(f'{amount:>9} words  load {load_time * 1000:8.1f} ms  round {round_time * 1e6:6.1f} us')
+
+
+if __name__ == '__main__':
+    for size in [int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000]:
+        bench(size)
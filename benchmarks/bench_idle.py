@@ -0,0 +1,77 @@
+"""
+Idle CPU benchmark.
+
+Runs static screens with nobody pressing a key for a few seconds, with idle
+rendering on and off, and reports the CPU used. An animated screen is also
+run with the window unfocused to show background throttling.
+
+    python benchmarks/bench_idle.py [seconds]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame  # noqa: E402
+
+from Classes.game import Game  # noqa: E402
+
+
+def key_later(key: int, seconds: float) -> None:
+    event = pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode='', scancode=0)
+    pygame.time.set_timer(event, int(seconds * 1000), loops=1)
+
+
+def measure(name: str, run, seconds: float) -> None:
+    wall, cpu = time.perf_counter(), time.process_time()
+    frames = count_frames(run)
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    print(f'{name:<42} cpu {cpu / wall * 100:6.1f} %  frames {frames / wall:7.1f} /s')
+
+
+def count_frames(run) -> int:
+    frames = [0]
+    flip = pygame.display.update
+
+    def counting_flip(*args):
+        frames[0] += 1
+        return flip(*args)
+
+    pygame.display.update = counting_flip
+    try:
+        run()
+    finally:
+        pygame.display.update = flip
+    return frames[0]
+
+
+def bench(seconds: float) -> None:
+    game = Game()
+
+    scenes = {
+        'Game.show_rules': (game.show_rules, pygame.K_RETURN),
+        'MainMenu.display_menu': (game.main_menu.display_menu, pygame.K_RETURN),
+        'Rating.display_rating': (game.rating.display_rating, pygame.K_BACKSPACE),
+    }
+
+    for idle in (False, True):
+        game.idle_rendering = idle
+        for name, (run, key) in scenes.items():
+            game.rating.run_display = True
+            key_later(key, seconds)
+            measure(f'{name} (idle {"on" if idle else "off"})', run, seconds)
+
+    game.idle_rendering = True
+    for focused in (True, False):
+        pygame.event.post(pygame.event.Event(pygame.WINDOWFOCUSGAINED if focused else pygame.WINDOWFOCUSLOST))
+        key_later(pygame.K_RETURN, seconds)
+        measure(f'Game.pre_story ({"focused" if focused else "background"})', game.pre_story, seconds)
+
+
+if __name__ == '__main__':
+    bench(float(sys.argv[1]) if len(sys.argv) > 1 else 3)
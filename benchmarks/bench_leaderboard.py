@@ -0,0 +1,111 @@
+"""
+Leaderboard submission benchmark.
+
+Submits scores to the local stand-in server and reports scores per second
+and the request latency, for: a new connection per score, one kept-alive
+connection per score, and kept-alive batches. Then checks the offline queue:
+scores submitted while the server is down are replayed once it's back.
+
+    python benchmarks/bench_leaderboard.py [scores] [batch]
+"""
+
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from Classes.leaderboard import LeaderboardClient, LeaderboardServer  # noqa: E402
+
+
+def client_for(server_url: str, batch: int) -> LeaderboardClient:
+    path = os.path.join(tempfile.mkdtemp(), 'queue.ndjson')
+    return LeaderboardClient(server_url, path, batch_size=batch, background=False)
+
+
+def timed(client: LeaderboardClient, reconnect: bool) -> list[float]:
+    """Time every request the client makes."""
+    latencies = []
+    request = client.request
+
+    def wrapper(*args):
+        if reconnect:
+            client.disconnect()
+        start = time.perf_counter()
+        try:
+            return request(*args)
+        finally:
+            latencies.append(time.perf_counter() - start)
+
+    client.request = wrapper
+    return latencies
+
+
+def submit(url: str, scores: int, batch: int, reconnect: bool) -> None:
+    client = client_for(url, batch)
+    latencies = timed(client, reconnect)
+
+    start = time.perf_counter()
+    for index in range(scores):
+        client.submit(f'bench{index}', index % 5000, 60 + index % 300, 'easy')
+        if len(client.pending) >= batch:
+            client.send_pending()
+    client.send_pending()
+    elapsed = time.perf_counter() - start
+    client.close()
+
+    name = 'new connection' if reconnect else f'keep-alive, batch {batch}'
+    p99 = statistics.quantiles(latencies, n=100, method='inclusive')[-1] if len(latencies) > 1 else latencies[0]
+    print(f'{name:<22} {scores / elapsed:>8.0f} scores/s  {len(latencies):>6} requests  '
+          f'latency mean {statistics.mean(latencies) * 1000:.2f} ms  p99 {p99 * 1000:.2f} ms  '
+          f'connections {client.connects}')
+
+
+def offline(scores: int) -> None:
+    server = LeaderboardServer()
+    host, port = server.server_address[:2]
+    url = server.url
+    server.server_close()
+
+    client = client_for(url, 50)
+    for index in range(scores):
+        client.submit(f'offline{index}', index, 60, 'hard')
+    client.sync()
+    queued = len(client.pending)
+
+    # a restart of the game picks the queue up from the file
+    client.close()
+    client = LeaderboardClient(url, client.queue_path, batch_size=50, background=False)
+
+    server = LeaderboardServer(host, port)
+    server.start()
+    start = time.perf_counter()
+    client.sync()
+    elapsed = time.perf_counter() - start
+    client.close()
+
+    print(f'offline queue: {queued} queued while down, {len(server.scores)} replayed in {elapsed * 1000:.1f} ms, '
+          f'{len(client.pending)} left, top cached {len(client.cache)}')
+    server.shutdown()
+    server.server_close()
+
+
+def bench(scores: int, batch: int) -> None:
+    server = LeaderboardServer()
+    server.start()
+
+    submit(server.url, scores, 1, reconnect=True)
+    submit(server.url, scores, 1, reconnect=False)
+    submit(server.url, scores, batch, reconnect=False)
+
+    server.shutdown()
+    server.server_close()
+    offline(min(scores, 500))
+
+
+if __name__ == '__main__':
+    bench(int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+          int(sys.argv[2]) if len(sys.argv) > 2 else 50)
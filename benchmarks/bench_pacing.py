@@ -0,0 +1,72 @@
+"""
+Frame pacing benchmark.
+
+Draws an animated screen at the target FPS in the synchronous mode and with
+the asyncio runner, and reports how far the frames are off the target. Every
+io-every frames a blocking write (a score save that takes ~30 ms) is made:
+inline in the synchronous mode, through Game.run_io with the runner.
+
+    python benchmarks/bench_pacing.py [frames] [io-every]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from Classes.game import Game  # noqa: E402
+from Classes.runner import AsyncRunner, FramePacing  # noqa: E402
+
+SAVE_TIME = 0.03
+
+
+def slow_save(path: str, frame: int) -> None:
+    with open(path, mode='a') as file:
+        file.write(f'bench,{frame},0,easy\n')
+        file.flush()
+        os.fsync(file.fileno())
+    time.sleep(SAVE_TIME)
+
+
+def run(game: Game, frames: int, io_every: int, path: str) -> FramePacing:
+    pacing = FramePacing()
+    game.frame_listeners.append(pacing)
+    try:
+        for frame in range(frames):
+            game.check_events()
+            game.display.fill(game.BLACK)
+            game.draw_text(f'frame {frame}', 30, game.mid_w, game.mid_h, color=game.WHITE, position='center')
+
+            if io_every and frame % io_every == io_every - 1:
+                game.run_io(slow_save, path, frame)
+
+            game.blit_screen()
+    finally:
+        game.frame_listeners.remove(pacing)
+    return pacing
+
+
+def bench(frames: int, io_every: int) -> None:
+    game = Game()
+    path = os.path.join(tempfile.mkdtemp(), 'scores.csv')
+
+    for mode in ('sync', 'async'):
+        game.runner = AsyncRunner() if mode == 'async' else None
+        summary = run(game, frames, io_every, path).summary(game.FPS)
+        if game.runner:
+            game.runner.close()
+
+        print(f'{mode:<6} {summary["frames"]} frames at {game.FPS} fps  mean {summary["mean_ms"]:.2f} ms  '
+              f'error mean {summary["error_mean_ms"]:.2f} ms  p95 {summary["error_p95_ms"]:.2f} ms  '
+              f'max {summary["error_max_ms"]:.2f} ms  '
+              f'dropped {summary["dropped"]}')
+
+
+if __name__ == '__main__':
+    bench(int(sys.argv[1]) if len(sys.argv) > 1 else 600,
+          int(sys.argv[2]) if len(sys.argv) > 2 else 30)
@@ -0,0 +1,91 @@
+"""
+Mini game prefetch benchmark.
+
+Launches every mini game the way the game loop does (selection, controller,
+configure) with a cold start on selection and after hovering the option in
+the menu long enough for the prefetch, and reports the time from the
+selection to the rules screen. Then moves the cursor over every option
+faster than the hover delay and away from a running prefetch, and checks
+that nothing is left behind.
+
+    python benchmarks/bench_prefetch.py [rounds]
+"""
+
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from Classes.game import Game  # noqa: E402
+from Classes.prefetch import Prefetcher  # noqa: E402
+from Classes.registry import MINI_GAMES  # noqa: E402
+
+
+def hover(game: Game, game_id: str, seconds: float) -> None:
+    """Rest the cursor on game_id for seconds, running the timers like the menu does."""
+    game.prefetcher.hover(game_id)
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        game.timers.update()
+        time.sleep(0.005)
+
+
+def launch(game: Game, game_id: str) -> float:
+    game.game_mode = game_id
+    selected = time.perf_counter()
+    controller = game.get_game_controller(game_id)
+    controller.configure()
+    controller.layout_rules()
+    return time.perf_counter() - selected
+
+
+def reset(game: Game) -> None:
+    game.prefetcher.cancel()
+    for controller in game.controllers.values():
+        controller.release()
+    game.controllers = {}
+
+
+def bench(rounds: int) -> None:
+    game = Game()
+    game.difficulty = 'medium'
+    # the first launch also imports the module and loads the word lists
+    first = {game_id: launch(game, game_id) for game_id in MINI_GAMES}
+    reset(game)
+
+    print(f'selection to rules screen, median of {rounds} after the first launch:')
+    for game_id in MINI_GAMES:
+        timings = {'on selection': [], 'prefetched': []}
+        for _ in range(rounds):
+            launch_time = launch(game, game_id)
+            timings['on selection'].append(launch_time)
+            reset(game)
+
+            hover(game, game_id, Prefetcher.HOVER_DELAY + 0.2)
+            timings['prefetched'].append(launch(game, game_id))
+            reset(game)
+
+        cold, warm = (statistics.median(times) for times in timings.values())
+        print(f'{game_id:<12} first launch {first[game_id] * 1000:7.2f} ms  on selection {cold * 1000:7.2f} ms  '
+              f'prefetched {warm * 1000:6.2f} ms')
+
+    # scroll past everything, then leave a prefetch while it runs
+    surfaces = len(game.surfaces)
+    cancelled = game.prefetcher.cancelled
+    for game_id in MINI_GAMES:
+        hover(game, game_id, Prefetcher.HOVER_DELAY / 5)
+    hover(game, 'rps', Prefetcher.HOVER_DELAY + 0.02)
+    hover(game, 'hangman', 0)
+    reset(game)
+    time.sleep(0.5)
+    print(f'scrolling: {game.prefetcher.cancelled - cancelled} prefetches cancelled, '
+          f'{len(game.surfaces) - surfaces} surfaces left behind')
+
+
+if __name__ == '__main__':
+    bench(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,101 @@
+"""
+Render preset benchmark.
+
+Draws and presents typical frames for every render preset, uncapped, and
+reports the mean and 95th percentile frame time. Each preset runs in its own
+process so they don't share fonts or display state.
+
+    python benchmarks/bench_render.py [frames]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def frames(game):
+    """Frame drawing functions, one per scene."""
+    from Classes.widgets import Label, Prompt, Screen, SlotInput
+
+    game.difficulty = 'medium'
+
+    hangman = game.get_game_controller('hangman')
+    hangman.new_round('shadow')
+    for char in 'sxq':
+        hangman.guess(char)
+
+    rps = game.get_game_controller('rps')
+
+    def draw_menu():
+        game.main_menu.redraw()
+
+    def draw_hangman():
+        game.display.fill(game.WHITE)
+        hangman.draw_gallows()
+        hangman.draw_word_lines()
+        hangman.draw_options()
+        game.blit_screen()
+
+    def draw_rps():
+        game.display.fill(game.BLACK)
+        rps.draw_options()
+        rps.display_score()
+        game.blit_screen()
+
+    # the password screen like guess_password builds it, every frame types or deletes the last letter
+    slots = SlotInput(game, 7, 400)
+    password = Screen(game, [
+        Label(game, 'GUESS THE PASSWORD', 20, (game.DISPLAY_W / 2, 100), game.WHITE),
+        slots,
+        Prompt(game, 'SUBMIT'),
+    ])
+    for char in 'chall':
+        slots.push(char)
+    game.repaint = True
+
+    def draw_password():
+        if len(slots) == 5:
+            slots.push('e')
+        else:
+            slots.pop()
+        game.blit_screen(password.draw())
+
+    return {'MainMenu': draw_menu, 'HangmanGame': draw_hangman, 'RPSGame': draw_rps, 'guess_password': draw_password}
+
+
+def run_preset(preset: str, count: int) -> None:
+    from Classes.game import Game
+
+    game = Game(render_preset=preset)
+    game.FPS = 0  # uncapped
+
+    for name, draw in frames(game).items():
+        draw()
+        times = []
+        for _ in range(count):
+            start = time.perf_counter()
+            draw()
+            times.append(time.perf_counter() - start)
+
+        p95 = statistics.quantiles(times, n=20)[-1]
+        print(f'{preset:<12} {name:<15} mean {statistics.mean(times) * 1000:6.2f} ms  p95 {p95 * 1000:6.2f} ms')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 2 and sys.argv[1] == '--preset':
+        run_preset(sys.argv[2], int(sys.argv[3]))
+    else:
+        from Classes.game import Game
+
+        amount = sys.argv[1] if len(sys.argv) > 1 else '200'
+        for name in Game.RENDER_PRESETS:
+            output = subprocess.run([sys.executable, __file__, '--preset', name, amount],
+                                    capture_output=True, text=True, check=True).stdout
+            print('\n'.join(line for line in output.splitlines() if line.startswith(name)))
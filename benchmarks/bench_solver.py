@@ -0,0 +1,97 @@
+"""
+Hangman solver benchmark.
+
+Builds a synthetic word list (letters drawn by english frequency), then plays
+random words from it asking for a hint before every guess, and reports the
+hint latency against the 2 ms frame budget. A regex scan over the same words
+is timed for comparison, as is the offline difficulty pass.
+
+    python benchmarks/bench_solver.py [words] [games]
+"""
+
+import os
+import random
+import re
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from functions import letter_bit  # noqa: E402
+from Classes.dictionary import LETTER_FREQUENCY, MIN_WORD_LENGTH  # noqa: E402
+from Classes.solver import HangmanSolver, LETTERS  # noqa: E402
+
+BUDGET = 0.002
+
+
+def make_words(amount: int) -> list[str]:
+    letters, weights = zip(*LETTER_FREQUENCY.items())
+    words = set()
+    while len(words) < amount:
+        length = min(MIN_WORD_LENGTH + int(random.expovariate(0.3)), 12)
+        words.add(''.join(random.choices(letters, weights, k=length)))
+    return list(words)
+
+
+def regex_hint(words: list[str], pattern: str, used_mask: int) -> str | None:
+    """What a hint costs without the bitsets: scan every word of the length."""
+    wrong = ''.join(char for char in LETTERS if used_mask & letter_bit(char) and char not in pattern)
+    blank = f'[^{pattern.replace("_", "")}{wrong}]' if pattern.strip('_') or wrong else '.'
+    regex = re.compile(pattern.replace('_', blank))
+
+    counts = dict.fromkeys((char for char in LETTERS if not used_mask & letter_bit(char)), 0)
+    for word in words:
+        if len(word) == len(pattern) and regex.fullmatch(word):
+            for char in set(word):
+                if char in counts:
+                    counts[char] += 1
+    return max(counts, key=counts.get, default=None)
+
+
+def play(solver: HangmanSolver, word: str, times: list[float]) -> None:
+    used = 0
+    while True:
+        pattern = ''.join(char if used & letter_bit(char) else '_' for char in word)
+        if '_' not in pattern:
+            return
+
+        start = time.perf_counter()
+        char = solver.best_letter(pattern, used)
+        times.append(time.perf_counter() - start)
+        used |= letter_bit(char)
+
+
+def bench(amount: int, games: int) -> None:
+    random.seed(1)
+    words = make_words(amount)
+
+    start = time.perf_counter()
+    solver = HangmanSolver(words)
+    print(f'{amount} words, bitsets built in {time.perf_counter() - start:.2f} s')
+
+    times = []
+    for word in random.sample(words, games):
+        play(solver, word, times)
+
+    p95 = statistics.quantiles(times, n=20)[-1]
+    within = sum(t < BUDGET for t in times) / len(times)
+    print(f'hint        {len(times)} hints  mean {statistics.mean(times) * 1000:.3f} ms  '
+          f'p95 {p95 * 1000:.3f} ms  max {max(times) * 1000:.3f} ms  {within:.1%} under {BUDGET * 1000:.0f} ms')
+
+    # the first hint of a round has the most candidates, the worst case for a scan
+    word = random.choice(words)
+    start = time.perf_counter()
+    regex_hint(words, '_' * len(word), 0)
+    print(f'regex scan  first hint {(time.perf_counter() - start) * 1000:.1f} ms')
+
+    start = time.perf_counter()
+    misses = solver.misses()
+    print(f'difficulty  {len(misses)} words scored in {time.perf_counter() - start:.2f} s, '
+          f'mean {statistics.mean(misses.values()):.2f} wrong guesses')
+
+
+if __name__ == '__main__':
+    bench(int(sys.argv[1]) if len(sys.argv) > 1 else 100000,
+          int(sys.argv[2]) if len(sys.argv) > 2 else 200)
@@ -0,0 +1,72 @@
+"""
+Surface cache benchmark.
+
+Loads the images a launch needs (the menu background and controls, the rock
+paper scissors originals and every hand size the game uses) without the disk
+cache, with an empty cache and with the cache filled by the run before, and
+reports the time per launch and whether the cached pixels match.
+
+    python benchmarks/bench_surface_cache.py [rounds]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame  # noqa: E402
+
+from Classes.game import Game  # noqa: E402
+from Classes.registry import get_spec  # noqa: E402
+from Classes.surfaces import SurfaceCache, SurfaceStore  # noqa: E402
+
+
+def launch(game: Game, store: SurfaceStore, originals: tuple, hands: list) -> list:
+    """Load everything like a launch does, returns the surfaces."""
+    surfaces = [store.load('main.png', 'Background', (game.RENDER_W, game.RENDER_H)),
+                store.load('main_controls.png', factor=0.25 * game.scale)]
+    for asset_type, name in originals:
+        store.acquire(name, asset_type)
+    surfaces.extend(store.acquire(name, asset_type, size) for asset_type, name, size in hands)
+    for asset_type, name in originals:
+        store.release(name, asset_type)
+    return surfaces
+
+
+def bench(rounds: int) -> None:
+    game = Game()
+    spec = get_spec('rps')
+    game.get_game_controller('rps')
+    hands = [key for key in game.surfaces.surfaces if key[2] is not None]
+
+    with tempfile.TemporaryDirectory() as directory:
+        timings = {'no cache': [], 'cold': [], 'warm': []}
+        images = {}
+        for _ in range(rounds):
+            for mode in timings:
+                if mode == 'cold':
+                    for filename in os.listdir(directory):
+                        os.remove(os.path.join(directory, filename))
+                # a new cache each launch, nothing is remembered in memory
+                store = SurfaceStore(SurfaceCache(directory) if mode != 'no cache' else None)
+                start = time.perf_counter()
+                surfaces = launch(game, store, spec.assets, hands)
+                timings[mode].append(time.perf_counter() - start)
+                images[mode] = [pygame.image.tobytes(surface, 'RGBA') for surface in surfaces]
+
+        size = sum(os.path.getsize(os.path.join(directory, filename)) for filename in os.listdir(directory))
+
+    print(f'{len(hands)} hand sizes, {len(spec.assets)} originals, background and controls, '
+          f'cache {size / 1024 ** 2:.1f} MB, best of {rounds}:')
+    for mode, times in timings.items():
+        print(f'{mode:<9} {min(times) * 1000:7.1f} ms  x{min(timings["no cache"]) / min(times):4.1f}  '
+              f'same pixels {images[mode] == images["no cache"]}')
+
+
+if __name__ == '__main__':
+    bench(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
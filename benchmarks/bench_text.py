@@ -0,0 +1,86 @@
+"""
+Text rendering benchmark.
+
+Draws short strings that change every frame (counters, a hangman letter row,
+a question) with the TTF renderer and with the glyph atlas, and reports the
+time per string, the one-off atlas build and whether the pixels match. The
+letter row is also drawn like HangmanGame does it, queued on the render
+queue and flushed once per frame.
+
+    python benchmarks/bench_text.py [frames]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame  # noqa: E402
+
+from Classes.game import Game  # noqa: E402
+
+LETTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+ROUNDS = 5
+# name: (size, strings per frame, render queue layer or None)
+CASES = {
+    'counter': (20, lambda frame: [f'{frame * 7 % 10000}'], None),
+    'letter row': (24, lambda frame: list(LETTERS), None),
+    'letter row, queued': (24, lambda frame: list(LETTERS), 1),
+    'timer': (20, lambda frame: [f'TIME {frame // 60:02}:{frame % 60:02}'], None),
+    'question': (25, lambda frame: [f'Question: {frame % 97} + {frame % 13} = ?'], None),
+}
+
+
+def draw(game: Game, size: int, strings: list[str], atlas: bool, layer: int | None) -> None:
+    for index, text in enumerate(strings):
+        game.draw_text(text, size, 40 + index * 45, 300, color=game.ORANGE, position='center', atlas=atlas,
+                       layer=layer)
+    if layer is not None:
+        game.render.flush(game.display)
+        game.render.end_frame()
+
+
+def bench(frames: int) -> None:
+    # no music: its decode thread would compete with the first case
+    game = Game(audio=False, prefetch=False)
+
+    for name, (size, make, layer) in CASES.items():
+        start = time.perf_counter()
+        game.get_atlas(game.font, size, game.ORANGE)
+        build = time.perf_counter() - start
+
+        timings = {False: [], True: []}
+        for atlas in (False, True):
+            # the first draws load the font and fill the caches, not part of the timing
+            draw(game, size, make(0), atlas, layer)
+        # alternated rounds, the best of each, so a busy moment doesn't favour one side
+        for _ in range(ROUNDS):
+            for atlas in (False, True):
+                strings = 0
+                start = time.perf_counter()
+                for frame in range(frames):
+                    texts = make(frame)
+                    draw(game, size, texts, atlas, layer)
+                    strings += len(texts)
+                timings[atlas].append((time.perf_counter() - start) / strings)
+        timings = {atlas: min(times) for atlas, times in timings.items()}
+
+        # same frame both ways, compare the pixels
+        images = []
+        for atlas in (False, True):
+            game.display.fill(game.BLACK)
+            draw(game, size, make(frames), atlas, layer)
+            images.append(pygame.image.tobytes(game.display, 'RGB'))
+
+        difference = max(abs(a - b) for a, b in zip(images[0], images[1]))
+        print(f'{name:<18} ttf {timings[False] * 1e6:7.1f} us  atlas {timings[True] * 1e6:6.1f} us  '
+              f'x{timings[False] / timings[True]:4.2f}  atlas build {build * 1000:.1f} ms  '
+              f'max channel difference {difference}')
+
+
+if __name__ == '__main__':
+    bench(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -2,28 +2,70 @@
 HEY, lets store all static functions inside this file.
 """
 
+import functools
 import os
-import sys
+import random
 import pygame
 
 
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets')
+ASSET_PACK = os.path.join(ASSETS_DIR, 'assets.pack')
+# derived data that is safe to delete, rebuilt on the next launch
+CACHE_DIR = os.path.join(os.path.dirname(ASSETS_DIR), 'cache')
+
+# the mapped AssetPack, once use_pack() loaded one
+asset_pack = None
+
+
 def get_asset_path(asset_type: str, name: str):
-    # Construct the path to the asset
-    assets_path = os.path.join(sys.path[0], 'assets', asset_type)
-    return os.path.join(assets_path, name)
+    # Next to this file, not sys.path[0], so it works from any entry point
+    return os.path.join(ASSETS_DIR, asset_type, name)
+
+
+def use_pack(path: str = ASSET_PACK):
+    """Memory-map the asset pack, images, fonts and sounds in it are loaded from it from now on."""
+    global asset_pack
+    from Classes.assetpack import AssetPack
+
+    asset_pack = AssetPack(path)
+    return asset_pack
+
 
+def packed_name(path: str) -> str | None:
+    """The name of an asset path in the asset pack, None without a pack or when it's not in there."""
+    if asset_pack is not None:
+        name = os.path.relpath(path, ASSETS_DIR).replace(os.sep, '/')
+        if name in asset_pack:
+            return name
+    return None
 
-def get_image(name: str):
+
+def asset_source(path: str):
+    """A reader from the asset pack for an asset path, the path itself when it's not packed."""
+    name = packed_name(path)
+    return path if name is None else asset_pack.open(name)
+
+
+def asset_bytes(path: str):
+    """The raw file content of an asset, a view into the pack when it's packed."""
+    name = packed_name(path)
+    if name is not None:
+        return asset_pack.data(name)
+    with open(path, 'rb') as file:
+        return file.read()
+
+
+def get_image(name: str, asset_type: str = 'Other'):
     # Use the helper function to get the correct path for the image
-    path = get_asset_path('Other', name)
+    path = get_asset_path(asset_type, name)
 
-    # Load the image
-    return pygame.image.load(path)
+    # Load the image, the name tells pygame the format when it comes from the pack
+    return pygame.image.load(asset_source(path), name)
 
 
 def split_text(text, font, font_size, max_width) -> list:
     """Breaks the text into multiple lines that fit within the given width."""
-    font = pygame.font.Font(font, font_size)
+    font = pygame.font.Font(asset_source(font), font_size)
     lines = []
     current_line = ''
 
@@ -84,3 +126,59 @@ def draw_rect(display, pos, size, color, border_thickness=0, border_color=None):
     if border_thickness > 0:
         border_color = border_color or color
         pygame.draw.rect(display, border_color, rect, border_thickness)
+
+
+def letter_bit(char: str) -> int:
+    """Bit of a lowercase letter in a 26 bit letter mask ('a' = 1, 'z' = 1 << 25)."""
+    return 1 << (ord(char) - 97) if 'a' <= char <= 'z' else 0
+
+
+def letter_mask(word: str) -> int:
+    """Mask with the bits of all letters in the word set."""
+    mask = 0
+    for char in word:
+        mask |= letter_bit(char)
+    return mask
+
+
+def scene(method):
+    """
+    Mark a method as a scene, the game tracks the active one as 'Class.method'.
+
+    Works on Game itself and on anything holding the game in `self.game`.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        game = getattr(self, 'game', self)
+        previous = game.enter_scene(f'{type(self).__name__}.{method.__name__}')
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            game.exit_scene(previous)
+
+    return wrapper
+
+
+def calculate_score(wins: int, seconds: int | float, difficulty: str, password_correct: bool) -> int:
+    mod = {
+        'easy': 1,
+        'medium': 2,
+        'hard': 3
+    }
+
+    # Calculate the score
+    score = ((wins * 1000) - (seconds * 0.1)) * mod[difficulty]
+
+    if password_correct:
+        score += 1000
+
+    # Ensure the score is non-negative
+    return max(0, int(score))
+
+
+def award_letters(pass_list: list, games_left: int, rng=random) -> str:
+    """Take the password letters for a won mini game out of pass_list, spread over the games left."""
+    new_letters = ''
+    for _ in range(len(pass_list) // games_left):
+        new_letters += pass_list.pop(rng.randint(0, len(pass_list) - 1))
+    return new_letters
@@ -1,11 +1,29 @@
+import argparse
+import atexit
+import os
+
 import pygame.time
 
 from Classes.game import Game
+from Classes.rating import Rating
+from functions import ASSET_PACK
 
 
-def main():
+def main(enabled_games: list[str] | None = None, render_preset: str = 'quality', telemetry=None,
+         use_async: bool = False, leaderboard=None, profiler=None):
     # game initialization
-    g = Game()
+    g = Game(enabled_games, render_preset, telemetry)
+    attach_profiler(g, profiler)
+
+    if leaderboard:
+        g.rating.use_leaderboard(leaderboard)
+
+    if use_async:
+        from Classes.runner import AsyncRunner
+
+        # frames wait on an asyncio loop, score saves run on it in between
+        g.runner = AsyncRunner()
+        atexit.register(g.runner.close)
     clock = pygame.time.Clock()
 
     # main loop that checks if game is still running
@@ -26,5 +44,225 @@ def main():
         g.game_loop()
 
 
+def build_dictionary(source: str, target: str | None, solver: bool = False) -> None:
+    from Classes.dictionary import HangmanDictionary, difficulty_score, is_valid_word
+
+    score = difficulty_score
+    if solver:
+        from Classes.solver import HangmanSolver
+
+        # rank by the wrong guesses the hint solver needs, letter rarity breaks ties
+        with open(source, mode='r') as file:
+            words = {word for word in (line.strip().lower() for line in file) if is_valid_word(word)}
+        misses = HangmanSolver(words).misses()
+        score = lambda word: (misses[word], difficulty_score(word))
+
+    target = target or os.path.splitext(source)[0] + '.dict'
+    counts = HangmanDictionary.build(source, target, score)
+    print(f'{target}: ' + ', '.join(f'{name} {count}' for name, count in counts.items()))
+
+
+def simulate(sessions: int, workers: int | None, scaling: bool) -> None:
+    from Classes import simulator
+
+    workers = workers or os.cpu_count()
+    if scaling:
+        simulator.scaling(sessions, workers)
+    else:
+        simulator.report(*simulator.run(sessions, workers), workers)
+
+
+def run_bots(sessions: int | None, minutes: float | None, correct_rate: float,
+             enabled_games: list[str] | None, render_preset: str, telemetry=None, profiler=None) -> None:
+    from Classes.bots import BotDriver
+
+    driver = BotDriver(correct_rate, enabled_games=enabled_games, render_preset=render_preset, telemetry=telemetry)
+    attach_profiler(driver.game, profiler)
+    try:
+        driver.run(sessions, minutes)
+        driver.report()
+    finally:
+        driver.close()
+
+
+def report_memory(enabled_games: list[str] | None, render_preset: str) -> None:
+    from Classes.memory import memory_report, print_report
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+    # a game with every mini game loaded, as it is after a full session
+    g = Game(enabled_games, render_preset)
+    for game_id in g.enabled_games:
+        g.get_game_controller(game_id)
+
+    print_report(memory_report(g))
+
+
+def open_telemetry(args):
+    if not args.telemetry:
+        return None
+
+    from Classes.telemetry import Telemetry
+    return Telemetry(args.telemetry, args.telemetry_format)
+
+
+def compact_scoreboard(keep_top: int, recent: int) -> None:
+    from Classes.compaction import compact
+    from functions import get_asset_path
+
+    result = compact(get_asset_path('Other', 'scoreboard.csv'), keep_top, recent)
+    print(f'{result.rows} rows: kept {result.kept}, archived {result.archived} '
+          f'in {len(result.segments)} segments, {result.seconds:.2f} s')
+    for segment in result.segments:
+        print(f'  {segment}')
+
+
+def open_profiler(args):
+    if args.profile is None:
+        return None
+
+    from Classes.profiling import SceneProfiler
+    return SceneProfiler(args.profile_dir, args.profile, args.profile_frames, args.profile_top)
+
+
+def attach_profiler(game: Game, profiler) -> None:
+    if profiler:
+        game.profiler = profiler
+        game.frame_listeners.append(profiler)
+
+
+def open_leaderboard(args):
+    if not args.leaderboard:
+        return None
+
+    from Classes.leaderboard import LeaderboardClient
+    from functions import get_asset_path
+    return LeaderboardClient(args.leaderboard, get_asset_path('Other', 'leaderboard_queue.ndjson'),
+                             get_asset_path('Other', 'leaderboard_cache.json'))
+
+
+def serve_leaderboard(port: int) -> None:
+    from Classes.leaderboard import LeaderboardServer
+
+    server = LeaderboardServer(port=port)
+    print(f'leaderboard stand-in on {server.url}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def build_asset_pack(target: str) -> None:
+    from Classes.assetpack import build_pack
+    from functions import ASSETS_DIR
+
+    entries = build_pack(ASSETS_DIR, target)
+    for name, size in entries:
+        print(f'{size:>10}  {name}')
+    print(f'{len(entries)} assets, {os.path.getsize(target)} bytes -> {target}')
+
+
+def open_pack(path: str | None) -> None:
+    if path is None:
+        return
+
+    from functions import use_pack
+    pack = use_pack(path)
+    print(f'asset pack {path}: {len(pack)} assets')
+
+
+def game_ids(value: str) -> list[str]:
+    """--games value: registered mini game ids, comma separated."""
+    from Classes.registry import MINI_GAMES
+
+    ids = [game_id.strip() for game_id in value.split(',') if game_id.strip()]
+    unknown = [game_id for game_id in ids if game_id not in MINI_GAMES]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown mini game {', '.join(unknown)} "
+                                         f"(choose from {', '.join(MINI_GAMES)})")
+    if not ids:
+        raise argparse.ArgumentTypeError(f'no mini game ids in {value!r}')
+    return ids
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Horror Adventure')
+    parser.add_argument('--build-dictionary', nargs='+', metavar=('SOURCE', 'TARGET'),
+                        help='compile a word list (one word per line) into a hangman dictionary and exit')
+    parser.add_argument('--solver-difficulty', action='store_true',
+                        help='with --build-dictionary, rank words by how many wrong guesses the hint solver makes')
+    parser.add_argument('--games', type=game_ids, metavar='ID,ID',
+                        help='only offer these mini games, e.g. rps,hangman (default: all)')
+    parser.add_argument('--preset', choices=list(Game.RENDER_PRESETS), default='quality',
+                        help='internal render resolution, lower presets are scaled up to the window (default: quality)')
+    parser.add_argument('--simulate', type=int, metavar='SESSIONS',
+                        help='play SESSIONS headless sessions with simulated players, print the score distribution and exit')
+    parser.add_argument('--workers', type=int, metavar='N',
+                        help='worker processes for --simulate (default: one per core)')
+    parser.add_argument('--scaling', action='store_true',
+                        help='with --simulate, repeat the run for 1 to N workers and print the speedup')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help='pace frames on an asyncio event loop so I/O like score saves overlaps rendering')
+    parser.add_argument('--memory-report', action='store_true',
+                        help='load every mini game headless, print surface bytes and object counts per subsystem and exit')
+    parser.add_argument('--telemetry', metavar='PATH',
+                        help='append session telemetry events to PATH (rotated by size)')
+    parser.add_argument('--telemetry-format', choices=('ndjson', 'binary'), default='ndjson',
+                        help='telemetry log format (default: ndjson)')
+    parser.add_argument('--compact-scoreboard', action='store_true',
+                        help='move all but the best and the newest scores to gzip archives next to the scoreboard and exit')
+    parser.add_argument('--keep-top', type=int, default=Rating.KEEP_TOP, metavar='K',
+                        help=f'with --compact-scoreboard, best rows kept per difficulty (default: {Rating.KEEP_TOP})')
+    parser.add_argument('--recent', type=int, default=Rating.KEEP_RECENT, metavar='N',
+                        help=f'with --compact-scoreboard, newest rows kept (default: {Rating.KEEP_RECENT})')
+    parser.add_argument('--leaderboard', metavar='URL',
+                        help='show and submit scores to a shared leaderboard, e.g. http://127.0.0.1:8765')
+    parser.add_argument('--leaderboard-server', type=int, nargs='?', const=8765, metavar='PORT',
+                        help='run the local stand-in leaderboard server (default port: 8765) and exit on ctrl-c')
+    parser.add_argument('--profile', nargs='*', metavar='SCENE',
+                        help='profile these scenes with cProfile, e.g. Game.game_loop HangmanGame.play pre_story '
+                             '(no names: every scene), one .pstats file per scene and a summary at exit')
+    parser.add_argument('--profile-dir', default='profiles', metavar='DIR',
+                        help='with --profile, where the .pstats files go (default: profiles)')
+    parser.add_argument('--profile-frames', type=int, metavar='N',
+                        help='with --profile, stop profiling a scene after N frames, exit once every named scene has them')
+    parser.add_argument('--profile-top', type=int, default=10, metavar='N',
+                        help='with --profile, functions per scene in the summary (default: 10)')
+    parser.add_argument('--build-pack', nargs='?', const=ASSET_PACK, metavar='TARGET',
+                        help=f'pack the images, fonts and sounds into one file and exit (default: {ASSET_PACK})')
+    parser.add_argument('--pack', nargs='?', const=ASSET_PACK, metavar='PATH',
+                        help='load images, fonts and sounds from an asset pack made with --build-pack')
+    parser.add_argument('--bots', type=int, nargs='?', const=0, metavar='SESSIONS',
+                        help='let bots play SESSIONS sessions headless (no number: until --minutes or ctrl-c), '
+                             'print sessions per minute and frame times per scene and exit')
+    parser.add_argument('--minutes', type=float,
+                        help='with --bots, stop after this many minutes')
+    parser.add_argument('--correct-rate', type=float, default=0.7,
+                        help='with --bots, how often the quiz bots answer right and the password is known (default: 0.7)')
+    return parser.parse_args()
+
+
 if __name__ == '__main__':
-    main()
+    args = parse_args()
+    open_pack(args.pack)
+
+    if args.build_pack:
+        build_asset_pack(args.build_pack)
+    elif args.build_dictionary:
+        build_dictionary(args.build_dictionary[0], (args.build_dictionary[1:] or [None])[0], args.solver_difficulty)
+    elif args.compact_scoreboard:
+        compact_scoreboard(args.keep_top, args.recent)
+    elif args.leaderboard_server is not None:
+        serve_leaderboard(args.leaderboard_server)
+    elif args.memory_report:
+        report_memory(args.games, args.preset)
+    elif args.bots is not None:
+        run_bots(args.bots or None, args.minutes, args.correct_rate, args.games, args.preset, open_telemetry(args),
+                 open_profiler(args))
+    elif args.simulate:
+        simulate(args.simulate, args.workers, args.scaling)
+    else:
+        main(args.games, args.preset, open_telemetry(args), args.use_async, open_leaderboard(args), open_profiler(args))
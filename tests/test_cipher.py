@@ -0,0 +1,27 @@
+import pytest
+
+from Classes.cipher import HexCipher, WordIndex
+
+
+@pytest.mark.parametrize('word', ['A', 'GHOST', 'ZEBRA', 'JAZZ', 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'])
+def test_round_trip(word):
+    assert HexCipher.decode(HexCipher.encode(word)) == word
+
+
+def test_encodes_alphabet_positions_in_hex():
+    assert HexCipher.encode('ajpz') == '1-A-10-1A'
+    assert HexCipher.decode('1-A-10-1A') == 'AJPZ'
+
+
+def test_fallback_pool_is_built_once():
+    index = WordIndex('unused.txt')
+    index.loaded = True
+    for word in ('cat', 'dog', 'cat', 'ghost'):
+        index.add(word)
+
+    pool = index.fallback_pool('easy', ('ALPHA', 'CAT'))
+    assert pool == ['ALPHA', 'CAT', 'DOG']
+    assert index.fallback_pool('easy', ('ALPHA', 'CAT')) is pool
+
+    index.add('owl')
+    assert index.fallback_pool('easy', ('ALPHA', 'CAT')) == ['ALPHA', 'CAT', 'DOG', 'OWL']
@@ -0,0 +1,146 @@
+import gzip
+import os
+
+import pytest
+
+from Classes import compaction
+from Classes.compaction import compact
+
+HEADER = b'name,score,time,difficulty\n'
+
+
+def write_scoreboard(path, rows):
+    with open(path, mode='wb') as file:
+        file.write(HEADER)
+        for name, score, difficulty in rows:
+            file.write(f'{name},{score},10,{difficulty}\n'.encode())
+
+
+def read_segments(segments):
+    lines = []
+    for segment in segments:
+        with gzip.open(segment, mode='rb') as file:
+            assert file.readline() == HEADER
+            lines.extend(file.read().splitlines())
+    return lines
+
+
+def temp_files(*directories):
+    return [name for directory in directories if os.path.isdir(directory)
+            for name in os.listdir(directory) if name.endswith('.tmp')]
+
+
+@pytest.fixture
+def scoreboard(tmp_path):
+    path = tmp_path / 'rating.csv'
+    rows = [(f'p{i}', (i * 37) % 101, ('easy', 'hard')[i % 2]) for i in range(200)]
+    write_scoreboard(path, rows)
+    return path, rows
+
+
+def test_keeps_best_and_recent_rows_and_archives_the_rest(scoreboard, tmp_path):
+    path, rows = scoreboard
+    archive = tmp_path / 'archive'
+
+    result = compact(str(path), keep_top=5, recent=10, archive_dir=str(archive))
+
+    lines = [f'{name},{score},10,{difficulty}'.encode() for name, score, difficulty in rows]
+    best = set()
+    for difficulty in ('easy', 'hard'):
+        ranked = sorted((row for row in enumerate(rows) if row[1][2] == difficulty), key=lambda row: -row[1][1])
+        best.update(index for index, _ in ranked[:5])
+    expected = [lines[index] for index in sorted(best | set(range(190, 200)))]
+
+    with open(path, mode='rb') as file:
+        assert file.readline() == HEADER
+        assert file.read().splitlines() == expected
+
+    archived = read_segments(result.segments)
+    assert sorted(archived + expected) == sorted(lines)
+    assert (result.rows, result.kept, result.archived) == (200, len(expected), 200 - len(expected))
+    assert temp_files(tmp_path, archive) == []
+
+
+def test_cuts_segments_between_lines(scoreboard, tmp_path, monkeypatch):
+    path, rows = scoreboard
+    # blocks that end mid line, copy_lines has to complete them
+    monkeypatch.setattr(compaction, 'BLOCK_SIZE', 64)
+
+    result = compact(str(path), keep_top=0, recent=0, archive_dir=str(tmp_path / 'archive'), segment_bytes=500)
+
+    assert len(result.segments) > 1
+    assert all(segment.endswith('.csv.gz') for segment in result.segments)
+    assert len(read_segments(result.segments)) == len(rows)
+
+
+def test_fsyncs_segments_and_directories_after_renames(scoreboard, tmp_path, monkeypatch):
+    path, _ = scoreboard
+    archive = tmp_path / 'archive'
+    events = []
+
+    def replace(source, target):
+        events.append(('replace', os.path.basename(target)))
+        real_replace(source, target)
+
+    real_replace = os.replace
+    monkeypatch.setattr(compaction.os, 'replace', replace)
+    monkeypatch.setattr(compaction, 'fsync_dir', lambda directory: events.append(('fsync_dir', directory)))
+
+    result = compact(str(path), keep_top=5, recent=10, archive_dir=str(archive), segment_bytes=1000)
+
+    names = [os.path.basename(segment) for segment in result.segments]
+    assert events == [('replace', name) for name in names] + [('fsync_dir', str(archive)),
+                                                              ('replace', 'rating.csv'),
+                                                              ('fsync_dir', str(tmp_path))]
+
+
+def test_failure_keeps_the_old_scoreboard_and_removes_temp_files(scoreboard, tmp_path, monkeypatch):
+    path, _ = scoreboard
+    archive = tmp_path / 'archive'
+    before = path.read_bytes()
+
+    def replace(source, target):
+        if os.path.basename(target) == 'rating.csv':
+            raise OSError('disk full')
+        real_replace(source, target)
+
+    real_replace = os.replace
+    monkeypatch.setattr(compaction.os, 'replace', replace)
+
+    with pytest.raises(OSError):
+        compact(str(path), keep_top=5, recent=10, archive_dir=str(archive))
+
+    assert path.read_bytes() == before
+    assert temp_files(tmp_path, archive) == []
+
+
+def test_failure_while_archiving_removes_partial_segments(scoreboard, tmp_path, monkeypatch):
+    path, _ = scoreboard
+    archive = tmp_path / 'archive'
+
+    def copy_lines(*args):
+        raise OSError('read error')
+
+    monkeypatch.setattr(compaction, 'copy_lines', copy_lines)
+    monkeypatch.setattr(compaction.SegmentWriter, 'write', lambda self, lines: None)
+
+    with pytest.raises(OSError):
+        compact(str(path), keep_top=5, recent=10, archive_dir=str(archive))
+    assert temp_files(tmp_path, archive) == []
+
+
+def test_copies_rows_appended_during_the_scan(scoreboard, tmp_path):
+    path, _ = scoreboard
+
+    class AppendingLock:
+        def __enter__(self):
+            with open(path, mode='ab') as file:
+                file.write(b'late,1,10,easy\nlater,2,10,hard\n')
+
+        def __exit__(self, *exc):
+            return False
+
+    result = compact(str(path), keep_top=5, recent=10, archive_dir=str(tmp_path / 'archive'), lock=AppendingLock())
+
+    assert result.appended == 2
+    assert path.read_bytes().endswith(b'late,1,10,easy\nlater,2,10,hard\n')
@@ -0,0 +1,89 @@
+import os
+
+import pytest
+
+from Classes import dictionary
+from Classes.dictionary import DIFFICULTIES, HangmanDictionary, difficulty_score
+
+WORDS = ['cat', 'dog', 'ghost', 'zombie', 'jazz', 'quiz', 'pumpkin', 'witch', 'skeleton', 'moon', 'bat', 'owl']
+
+
+@pytest.fixture
+def word_list(tmp_path):
+    path = tmp_path / 'words.txt'
+    # duplicates, capitals and invalid words are dropped by the build
+    path.write_text('\n'.join(WORDS + ['Cat', 'no', 'two words', 'naïve', 'x' * 17]) + '\n')
+    return path
+
+
+def test_build_and_read_round_trip(word_list, tmp_path):
+    target = tmp_path / 'words.dict'
+
+    counts = HangmanDictionary.build(str(word_list), str(target))
+
+    compiled = HangmanDictionary(str(target))
+    try:
+        assert counts == {name: compiled.count(name) for name in DIFFICULTIES}
+        assert len(compiled) == len(WORDS)
+
+        read = [word for name in DIFFICULTIES for word in compiled.words(name)]
+        # easiest first, across the buckets
+        assert read == sorted(WORDS, key=lambda word: (difficulty_score(word), word))
+        for name in DIFFICULTIES:
+            assert compiled.random_word(name) in list(compiled.words(name))
+    finally:
+        compiled.close()
+
+
+def test_get_word_out_of_range(word_list, tmp_path):
+    target = tmp_path / 'words.dict'
+    HangmanDictionary.build(str(word_list), str(target))
+    compiled = HangmanDictionary(str(target))
+    try:
+        with pytest.raises(IndexError):
+            compiled.get_word('easy', compiled.count('easy'))
+    finally:
+        compiled.close()
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'words.dict'
+    path.write_bytes(b'not a dictionary at all')
+    with pytest.raises(ValueError):
+        HangmanDictionary(str(path)).open()
+
+
+@pytest.fixture
+def assets(word_list, tmp_path, monkeypatch):
+    cache = tmp_path / 'cache'
+    monkeypatch.setattr(dictionary, 'DICTIONARY_CACHE', str(cache))
+    monkeypatch.setattr(dictionary, 'get_asset_path', lambda asset_type, name: str(tmp_path / name))
+    (tmp_path / 'words.txt').write_text(word_list.read_text())
+    return tmp_path, cache
+
+
+def test_get_dictionary_compiles_into_the_cache(assets):
+    directory, cache = assets
+
+    compiled = dictionary.get_dictionary.__wrapped__('words')
+
+    assert compiled.path == str(cache / 'words.dict')
+    assert len(compiled) == len(WORDS)
+    assert not (directory / 'words.dict').exists()
+    compiled.close()
+
+
+def test_get_dictionary_prefers_an_up_to_date_build_in_assets(assets):
+    directory, cache = assets
+    HangmanDictionary.build(str(directory / 'words.txt'), str(directory / 'words.dict'))
+
+    compiled = dictionary.get_dictionary.__wrapped__('words')
+    assert compiled.path == str(directory / 'words.dict')
+    compiled.close()
+
+    # the list changed after that build
+    modified = os.path.getmtime(directory / 'words.dict') + 10
+    os.utime(directory / 'words.txt', (modified, modified))
+    compiled = dictionary.get_dictionary.__wrapped__('words')
+    assert compiled.path == str(cache / 'words.dict')
+    compiled.close()
@@ -0,0 +1,148 @@
+import json
+import socket
+
+import pytest
+
+from Classes.leaderboard import LeaderboardClient, LeaderboardServer
+
+
+@pytest.fixture
+def server():
+    server = LeaderboardServer()
+    server.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def client(url, tmp_path, **options) -> LeaderboardClient:
+    options.setdefault('cache_path', str(tmp_path / 'cache.json'))
+    return LeaderboardClient(url, str(tmp_path / 'queue.ndjson'), background=False, timeout=1.0, **options)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def queued(tmp_path) -> list[dict]:
+    with open(tmp_path / 'queue.ndjson') as file:
+        return [json.loads(line) for line in file]
+
+
+def test_sends_queued_scores_and_caches_the_top(server, tmp_path):
+    board = client(server.url, tmp_path, limit=2)
+    for name, score in (('ann', 10), ('bob', 30), ('cid', 20)):
+        board.submit(name, score, 60, 'easy')
+
+    board.sync()
+
+    assert board.online is True
+    assert board.pending == [] and queued(tmp_path) == []
+    assert [entry['name'] for entry in board.top()] == ['bob', 'cid']
+    with open(tmp_path / 'cache.json') as file:
+        assert json.load(file) == board.cache
+    board.close()
+
+
+def test_offline_queue_is_replayed_when_the_server_is_back(tmp_path):
+    port = free_port()
+    board = client(f'http://127.0.0.1:{port}', tmp_path)
+    board.submit('ann', 10, 60, 'easy')
+    board.submit('bob', 20, 60, 'hard')
+
+    board.sync()
+    assert board.online is False
+    assert len(board.pending) == 2 and queued(tmp_path) == board.pending
+    board.close()
+
+    # a restarted game picks the queue up from the file
+    board = client(f'http://127.0.0.1:{port}', tmp_path)
+    assert len(board.pending) == 2
+
+    server = LeaderboardServer(port=port)
+    server.start()
+    try:
+        board.sync()
+        assert board.online is True
+        assert board.pending == [] and queued(tmp_path) == []
+        assert sorted(entry['name'] for entry in server.scores) == ['ann', 'bob']
+    finally:
+        board.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_torn_last_line_is_dropped_and_rewritten(server, tmp_path):
+    entries = [{'id': 'a1', 'name': 'ann', 'score': 10, 'time': 60, 'difficulty': 'easy'},
+               {'id': 'b2', 'name': 'bob', 'score': 20, 'time': 60, 'difficulty': 'hard'}]
+    with open(tmp_path / 'queue.ndjson', mode='w') as file:
+        file.write(''.join(json.dumps(entry) + '\n' for entry in entries) + '{"id": "c3", "name": "ci')
+
+    board = client(server.url, tmp_path)
+
+    assert board.pending == entries
+    assert queued(tmp_path) == entries
+
+    board.sync()
+    assert board.online is True
+    assert sorted(entry['id'] for entry in server.scores) == ['a1', 'b2']
+    board.close()
+
+
+def test_resent_batch_is_not_counted_twice(server, tmp_path):
+    board = client(server.url, tmp_path)
+    board.submit('ann', 10, 60, 'easy')
+    board.submit('bob', 20, 60, 'hard')
+
+    # the server stores the batch, but the response never reaches the client
+    request = board.request
+
+    def lost_response(method, path, body=None):
+        result = request(method, path, body)
+        if method == 'POST':
+            raise OSError('connection reset')
+        return result
+
+    board.request = lost_response
+    board.sync()
+    assert board.online is False and len(board.pending) == 2
+    assert len(server.scores) == 2
+
+    board.request = request
+    board.sync()
+    assert board.online is True and board.pending == []
+    assert sorted(entry['name'] for entry in server.scores) == ['ann', 'bob']
+    board.close()
+
+
+@pytest.mark.parametrize('body', [
+    {'error': 'not a list'},
+    [{'name': 'ann'}],
+    ['ann', 10],
+])
+def test_malformed_top_scores_keep_the_cache(server, tmp_path, body):
+    cached = [{'id': 'a1', 'name': 'ann', 'score': 10, 'time': 60, 'difficulty': 'easy'}]
+    cache_path = tmp_path / 'cache.json'
+    cache_path.write_text(json.dumps(cached))
+    server.top = lambda limit: body
+
+    board = client(server.url, tmp_path)
+    board.sync()
+
+    assert board.online is False
+    assert board.top() == cached
+    assert json.loads(cache_path.read_text()) == cached
+    board.close()
+
+
+def test_server_rejects_malformed_scores(server, tmp_path):
+    board = client(server.url, tmp_path)
+    board.pending.append({'id': 'x', 'name': 'ann'})
+
+    board.sync()
+
+    assert board.online is False
+    assert server.scores == []
+    board.close()
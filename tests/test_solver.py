@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from functions import letter_bit
+from Classes.solver import HangmanSolver
+
+WORDS = ['shadow', 'shrewd', 'sheath', 'ghost', 'ghoul', 'grave', 'grove', 'crypt', 'witch', 'hex', 'hut',
+         'bat', 'cat', 'hat', 'owl', 'moon', 'mood', 'doom', 'boom', 'tomb', 'bone', 'cone', 'tone']
+
+
+def mask(letters: str) -> int:
+    mask = 0
+    for char in letters:
+        mask |= letter_bit(char)
+    return mask
+
+
+def fits(word: str, pattern: str, guessed: str) -> bool:
+    """What a player sees: guessed letters are shown everywhere, blanks hide the rest."""
+    return len(word) == len(pattern) and all(
+        shown == char if shown != '_' else char not in guessed for shown, char in zip(pattern, word))
+
+
+def pattern(word: str, guessed: str) -> str:
+    return ''.join(char if char in guessed else '_' for char in word)
+
+
+@pytest.fixture(scope='module')
+def solver():
+    return HangmanSolver(WORDS)
+
+
+def test_candidates_match_the_brute_force_filter(solver):
+    rng = random.Random(7)
+    for _ in range(500):
+        word = rng.choice(WORDS)
+        guessed = ''.join(rng.sample('abcdefghijklmnopqrstuvwxyz', rng.randrange(8)))
+        shown = pattern(word, guessed)
+
+        found = solver.words(shown, mask(guessed))
+
+        assert word in found
+        assert sorted(found) == sorted(other for other in WORDS if fits(other, shown, guessed))
+
+
+@pytest.mark.parametrize('shown, guessed, expected', [
+    ('___', '', ['bat', 'cat', 'hat', 'hex', 'hut', 'owl']),
+    ('_at', 'at', ['bat', 'cat', 'hat']),
+    ('_at', 'atc', ['bat', 'hat']),
+    ('_oo_', 'o', ['boom', 'doom', 'mood', 'moon']),
+    ('_oo_', 'om', []),
+    ('______', 'z', ['shadow', 'sheath', 'shrewd']),
+    ('_______', '', []),
+])
+def test_candidates(solver, shown, guessed, expected):
+    assert sorted(solver.words(shown, mask(guessed))) == expected
+
+
+def test_best_letter_is_in_the_most_candidates(solver):
+    # 'm' is in all of boom, doom, mood and moon, 'd' only in two
+    assert solver.best_letter('_oo_', mask('o')) == 'm'
+    assert solver.best_letter('_at', mask('atbch')) is None
+
+
+def test_misses_follow_best_letter(solver):
+    misses = solver.misses()
+    assert set(misses) == set(WORDS)
+    assert all(count >= 0 for count in misses.values())
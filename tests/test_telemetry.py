@@ -0,0 +1,80 @@
+import os
+
+import pytest
+
+from Classes.telemetry import FORMATS, MAGIC, Telemetry, read_log
+
+
+def session(telemetry: Telemetry) -> None:
+    telemetry.start_session(difficulty='hard')
+    telemetry.record('game_start', game='hangman')
+    telemetry.record('letters', letters='ghost', name='ünïcode')
+    telemetry.record('game_end', game='hangman', score=12, won=True)
+
+
+def events(records: list) -> list:
+    return [{key: value for key, value in record.items() if key != 't'} for record in records]
+
+
+@pytest.mark.parametrize('fmt', FORMATS)
+def test_read_log_round_trip(tmp_path, fmt):
+    path = str(tmp_path / f'telemetry.{fmt}')
+    telemetry = Telemetry(path, fmt=fmt, flush_interval=60)
+    session(telemetry)
+    telemetry.close()
+
+    records = list(read_log(path))
+
+    assert events(records) == [
+        {'event': 'session_start', 'session': 1, 'difficulty': 'hard'},
+        {'event': 'game_start', 'session': 1, 'game': 'hangman'},
+        {'event': 'letters', 'session': 1, 'letters': 'ghost', 'name': 'ünïcode'},
+        {'event': 'game_end', 'session': 1, 'game': 'hangman', 'score': 12, 'won': True},
+    ]
+    assert all(isinstance(record['t'], float) for record in records)
+    with open(path, mode='rb') as file:
+        assert file.read().startswith(MAGIC) == (fmt == 'binary')
+
+
+def test_both_formats_read_the_same(tmp_path):
+    logs = {}
+    for fmt in FORMATS:
+        path = str(tmp_path / f'telemetry.{fmt}')
+        telemetry = Telemetry(path, fmt=fmt, flush_interval=60)
+        session(telemetry)
+        telemetry.close()
+        logs[fmt] = events(read_log(path))
+
+    assert logs['ndjson'] == logs['binary']
+
+
+@pytest.mark.parametrize('fmt', FORMATS)
+def test_dropped_events_are_counted(tmp_path, fmt):
+    path = str(tmp_path / 'telemetry.log')
+    telemetry = Telemetry(path, fmt=fmt, capacity=4, flush_interval=60)
+    # keep the writer asleep, so the buffer overflows
+    telemetry.wake.set = lambda: None
+    for index in range(10):
+        telemetry.record('scene_enter', scene=str(index))
+    del telemetry.wake.set
+    telemetry.close()
+
+    records = events(read_log(path))
+    assert [record['scene'] for record in records[:-1]] == ['6', '7', '8', '9']
+    assert records[-1] == {'event': 'dropped', 'session': 0, 'count': 6}
+
+
+@pytest.mark.parametrize('fmt', FORMATS)
+def test_rotated_logs_stay_readable(tmp_path, fmt):
+    path = str(tmp_path / 'telemetry.log')
+    telemetry = Telemetry(path, fmt=fmt, max_bytes=200, backups=2, flush_interval=60)
+    for index in range(30):
+        telemetry.record('scene_enter', scene=str(index))
+        telemetry.flush()
+    telemetry.close()
+
+    assert sorted(os.listdir(tmp_path)) == ['telemetry.log', 'telemetry.log.1', 'telemetry.log.2']
+    scenes = [int(record['scene']) for name in ('telemetry.log.2', 'telemetry.log.1', 'telemetry.log')
+              for record in read_log(str(tmp_path / name))]
+    # the oldest were rotated out, the rest is in order
+    assert scenes == list(range(30 - len(scenes), 30))
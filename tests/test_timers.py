@@ -0,0 +1,107 @@
+import pytest
+
+from Classes.timers import TimerService
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def timers(clock):
+    return TimerService(clock)
+
+
+def test_fires_in_due_order(timers, clock):
+    fired = []
+    for delay in (0.3, 0.1, 0.2, 0.1):
+        timers.after(delay, lambda delay=delay: fired.append(delay))
+
+    clock.time = 0.15
+    assert timers.update() == 2
+    clock.time = 1.0
+    assert timers.update() == 2
+    assert fired == [0.1, 0.1, 0.2, 0.3]
+
+
+def test_next_delay(timers, clock):
+    assert timers.next_delay() is None
+    timers.after(0.5, lambda: None)
+    timers.after(0.2, lambda: None)
+    clock.time = 0.05
+    assert timers.next_delay() == pytest.approx(0.15)
+
+
+def test_cancel_skips_the_timer(timers, clock):
+    fired = []
+    first = timers.after(0.1, lambda: fired.append('first'))
+    timers.after(0.2, lambda: fired.append('second'))
+    timers.cancel(first)
+    timers.cancel(None)
+
+    assert timers.next_delay() == pytest.approx(0.2)
+    clock.time = 1.0
+    timers.update()
+    assert fired == ['second']
+    assert not first.active
+
+
+def test_reschedule_replaces_the_old_due_time(timers, clock):
+    fired = []
+    timer = timers.after(0.1, lambda: fired.append(clock.time))
+    timers.schedule(timer, 0.5)
+
+    clock.time = 0.2
+    assert timers.update() == 0
+    clock.time = 0.5
+    assert timers.update() == 1
+    assert fired == [0.5]
+
+
+def test_repeating_timer_does_not_catch_up(timers, clock):
+    fired = []
+    timers.every(0.1, lambda: fired.append(clock.time))
+
+    clock.time = 0.1
+    timers.update()
+    # a long frame fires it once, the next one is a full interval later
+    clock.time = 0.55
+    timers.update()
+    assert timers.next_delay() == pytest.approx(0.1)
+    assert fired == [0.1, 0.55]
+
+
+def test_paused_timer_keeps_its_remaining_time(timers, clock):
+    fired = []
+    timer = timers.after(0.3, lambda: fired.append(clock.time))
+
+    clock.time = 0.1
+    timers.pause(timer)
+    clock.time = 5.0
+    assert timers.update() == 0
+    timers.resume(timer)
+    clock.time = 5.2
+    timers.update()
+    assert fired == [5.2]
+
+
+def test_paused_service_stops_its_clock(timers, clock):
+    timer = timers.after(0.3, lambda: None)
+    clock.time = 0.1
+    timers.pause()
+    clock.time = 10.0
+    assert timers.update() == 0
+    assert timers.next_delay() is None
+
+    timers.resume()
+    assert timers.next_delay() == pytest.approx(0.2)
+    assert timers.progress(timer) == pytest.approx(1 / 3)
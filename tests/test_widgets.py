@@ -0,0 +1,139 @@
+import pygame
+import pytest
+
+from Classes.widgets import Label, Prompt, Screen, SlotInput, TextInput
+
+
+@pytest.fixture(scope='module')
+def game():
+    from Classes.game import Game
+
+    return Game(audio=False, prefetch=False)
+
+
+@pytest.fixture
+def target(game):
+    surface = pygame.Surface(game.display.get_size())
+    surface.fill(game.BLACK)
+    return surface
+
+
+def lit(surface, rect) -> bool:
+    """Anything but the background inside rect."""
+    area = surface.subsurface(rect.clip(surface.get_rect()))
+    return pygame.transform.average_color(area)[:3] != (0, 0, 0)
+
+
+def test_label_draws_once_until_changed(game, target):
+    label = Label(game, 'HELLO', 20, (200, 100), game.WHITE)
+
+    rects = label.draw(target)
+    assert rects == [label.rect]
+    assert lit(target, label.rect)
+    assert label.draw(target) == []
+
+    label.set_text('HELLO')
+    assert label.draw(target) == []
+
+
+def test_label_paints_over_its_old_area(game, target):
+    label = Label(game, 'A MUCH LONGER TEXT', 20, (200, 100), game.WHITE, position='midleft')
+    label.draw(target)
+    old = label.rect.copy()
+
+    label.set_text('A')
+    rects = label.draw(target)
+
+    assert rects == [label.rect, old]
+    assert label.rect.width < old.width
+    assert not lit(target, pygame.Rect(label.rect.right + 5, old.top, old.right - label.rect.right - 5, old.height))
+
+
+def test_forced_draw_only_reports_the_new_area(game, target):
+    label = Label(game, 'TEXT', 20, (200, 100), game.WHITE)
+    label.draw(target)
+    assert label.draw(target, force=True) == [label.rect]
+
+
+def test_prompt(game, target):
+    prompt = Prompt(game, 'SUBMIT')
+    assert prompt.text == 'PRESS ENTER TO SUBMIT >>'
+    assert prompt.draw(target) == [prompt.rect]
+
+
+def test_text_input_editing(game):
+    name = TextInput(game, (game.mid_w, 300), max_length=3)
+    for char in 'abcd':
+        name.push(char)
+    assert (name.text, len(name)) == ('abc', 3)
+
+    name.pop()
+    assert (name.text, name.chars, name.label.text) == ('ab', ['a', 'b'], 'ab')
+    for _ in range(3):
+        name.pop()
+    assert name.text == '' and len(name) == 0
+
+
+def test_text_input_redraws_only_the_text(game, target):
+    name = TextInput(game, (game.mid_w, 300))
+    first = name.draw(target, force=True)
+    # the underline, then the text
+    assert len(first) == 2 and lit(target, first[0])
+
+    assert name.draw(target) == []
+    name.push('x')
+    assert name.draw(target) == [name.label.rect, first[1]]
+
+
+def test_text_input_types_the_pressed_letters(game):
+    name = TextInput(game, (game.mid_w, 300))
+    game.OTHER_KEY = ['h', '1', 'i']
+    try:
+        name.type_keys()
+    finally:
+        game.OTHER_KEY = []
+    assert name.text == 'hi'
+
+
+def test_slot_input_fills_the_next_slot(game):
+    slots = SlotInput(game, 3, 400)
+
+    slots.push('a')
+    slots.push('b')
+    # the caret is on the first empty slot
+    assert [slot.text for slot in slots.slots] == ['a', 'b', '']
+    slots.push('c')
+    slots.push('d')
+    assert slots.text == 'abc' and len(slots) == 3
+
+    slots.pop()
+    assert [slot.text for slot in slots.slots] == ['a', 'b', '']
+    slots.push('z')
+    assert slots.text == 'abz'
+
+
+def test_slot_input_redraws_only_the_changed_slot(game, target):
+    slots = SlotInput(game, 4, 400)
+    assert len(slots.draw(target, force=True)) == 4 + 4
+    assert slots.draw(target) == []
+
+    empty = slots.slots[0].drawn
+    slots.push('q')
+    assert slots.draw(target) == [slots.slots[0].rect, empty]
+    slots.pop()
+    rects = slots.draw(target)
+    assert len(rects) == 2 and not lit(target, rects[1])
+
+
+def test_screen_repaints_then_presents_changes(game):
+    slots = SlotInput(game, 3, 400)
+    screen = Screen(game, [Label(game, 'TITLE', 20, (200, 100), game.WHITE), slots])
+
+    game.repaint = True
+    assert screen.draw() is None
+    assert game.repaint is False
+    assert screen.draw() == []
+
+    empty = slots.slots[0].drawn
+    slots.push('k')
+    assert screen.draw() == [slots.slots[0].rect, empty]